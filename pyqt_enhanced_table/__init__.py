@@ -1,12 +1,30 @@
 from .enhanced_table import EnhancedTableWidget, ColumnConfig, NumericTableWidgetItem
+from .enhanced_view import EnhancedTableView
+from .table_model import ColumnarTableModel
 from .table_footer import TableFooter
 from .active_filters_bar import ActiveFiltersBar
+from .action_delegate import ActionButtonsDelegate
+from .settings_store import (
+    SettingsStore,
+    QSettingsStore,
+    SQLiteSettingsStore,
+    MemorySettingsStore,
+    set_default_settings_store,
+)
 
 __all__ = [
     "EnhancedTableWidget",
     "ColumnConfig",
     "NumericTableWidgetItem",
+    "EnhancedTableView",
+    "ColumnarTableModel",
     "TableFooter",
     "TableFooter",
     "ActiveFiltersBar",
+    "ActionButtonsDelegate",
+    "SettingsStore",
+    "QSettingsStore",
+    "SQLiteSettingsStore",
+    "MemorySettingsStore",
+    "set_default_settings_store",
 ]
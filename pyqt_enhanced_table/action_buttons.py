@@ -6,23 +6,23 @@ from PyQt6.QtWidgets import QPushButton
 from PyQt6.QtCore import QSize
 import qtawesome as qta
 
-from .theme import ICONS, COLORS
+from .theme import ICONS, COLORS, ensure_theme, hex_to_rgba  # noqa: F401
 
 
 # Standart Buton Boyutu
 BTN_SIZE = QSize(32, 28)
 ICON_SIZE = QSize(16, 16)
 
+# Satır içi butonlar arası boşluk ve hücre kenar boşlukları (sol, üst, sağ, alt)
+BTN_SPACING = 6
+CELL_MARGINS = (4, 2, 4, 2)
 
-def hex_to_rgba(hex_color: str, alpha: float) -> str:
-    """Hex kodu RGBA string'ine çevirir."""
-    hex_color = hex_color.lstrip("#")
-    if len(hex_color) == 6:
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        return f"rgba({r}, {g}, {b}, {alpha})"
-    return hex_color
+# Satır aksiyonları: aksiyon -> (renk adı, ipucu, ikon)
+ROW_ACTIONS = {
+    "view": ("text_secondary", "Görüntüle", ICONS["view"]),
+    "edit": ("primary", "Düzenle", ICONS["edit"]),
+    "delete": ("danger", "Sil", ICONS["delete"]),
+}
 
 
 def _apply_action_style(
@@ -32,8 +32,6 @@ def _apply_action_style(
     Butona standart stil ve ikon uygular.
     """
     color = COLORS.get(color_name, COLORS["primary"])
-    bg_hover = hex_to_rgba(color, 0.4)  # %40 opacity bg
-    border_hover = color  # Tam opak border
 
     # Ikon oluştur
     btn.setIcon(qta.icon(icon_name, color=color))
@@ -41,44 +39,30 @@ def _apply_action_style(
     btn.setFixedSize(BTN_SIZE)
     btn.setToolTip(tooltip)
 
-    # Stil uygula
-    btn.setStyleSheet(
-        f"""
-        QPushButton {{
-            background-color: transparent !important;
-            border: none !important;
-            border-radius: 4px !important;
-            padding: 2px !important;
-        }}
-        QPushButton:hover {{
-            background-color: {bg_hover} !important;
-            border: 1px solid {border_hover} !important;
-        }}
-        QPushButton:pressed {{
-            background-color: {hex_to_rgba(color, 0.6)} !important;
-        }}
-    """
-    )
+    # Stil (tema stil sayfasından, actionColor özelliğine göre)
+    btn.setProperty("class", "action-button")
+    btn.setProperty("actionColor", color_name if color_name in COLORS else "primary")
+    ensure_theme(btn)
 
 
 def create_view_button(parent=None) -> QPushButton:
     """Görüntüle butonu (Nötr/Gri)"""
     btn = QPushButton(parent)
-    _apply_action_style(btn, "text_secondary", "Görüntüle", ICONS["view"])
+    _apply_action_style(btn, *ROW_ACTIONS["view"])
     return btn
 
 
 def create_edit_button(parent=None) -> QPushButton:
     """Düzenle butonu (Mavi/Primary)"""
     btn = QPushButton(parent)
-    _apply_action_style(btn, "primary", "Düzenle", ICONS["edit"])
+    _apply_action_style(btn, *ROW_ACTIONS["edit"])
     return btn
 
 
 def create_delete_button(parent=None) -> QPushButton:
     """Sil butonu (Kırmızı/Danger)"""
     btn = QPushButton(parent)
-    _apply_action_style(btn, "danger", "Sil", ICONS["delete"])
+    _apply_action_style(btn, *ROW_ACTIONS["delete"])
     return btn
 
 
@@ -0,0 +1,257 @@
+"""
+Delegate painted row action buttons.
+Paints the inline view/edit/delete buttons of every row instead of keeping
+a widget tree per row (see create_action_widget).
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QToolTip,
+)
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QPoint,
+    QRect,
+    QRectF,
+    QSize,
+)
+from PyQt6.QtGui import QColor, QPainter, QPen, QPixmap
+import qtawesome as qta
+
+from .action_buttons import BTN_SIZE, BTN_SPACING, CELL_MARGINS, ICON_SIZE, ROW_ACTIONS
+from .theme import COLORS, theme_generation
+
+# (icon name, color, device pixel ratio) -> pixmap, shared by all delegates
+_ACTION_PIXMAPS: Dict[Tuple[str, str, float], QPixmap] = {}
+_pixmap_generation = -1
+
+
+def _action_pixmap(icon_name: str, color: str, dpr: float) -> QPixmap:
+    """Pre-rendered action icon (dropped on theme change)"""
+    global _pixmap_generation
+    generation = theme_generation()
+    if generation != _pixmap_generation:
+        _ACTION_PIXMAPS.clear()
+        _pixmap_generation = generation
+
+    key = (icon_name, color, dpr)
+    pixmap = _ACTION_PIXMAPS.get(key)
+    if pixmap is None:
+        pixmap = qta.icon(icon_name, color=color).pixmap(ICON_SIZE, dpr)
+        _ACTION_PIXMAPS[key] = pixmap
+    return pixmap
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """
+    Row action buttons painted by a delegate.
+
+    Install on the action column (EnhancedTableMixin.create_action_delegate
+    or setItemDelegateForColumn). Buttons look like the action_buttons.py
+    buttons; hover and clicks are hit-tested in editorEvent. The row ID is
+    read from UserRole of column 0, like get_selected_id().
+    """
+
+    # Signals
+    action_clicked = pyqtSignal(object, str)  # row_id, action
+
+    def __init__(
+        self,
+        actions: Sequence[str] = ("view", "edit", "delete"),
+        parent: Optional[QObject] = None,
+    ):
+        super().__init__(parent)
+        self._actions: List[str] = [a for a in actions if a in ROW_ACTIONS]
+        self._hover: Optional[Tuple[QPersistentModelIndex, str]] = None
+        self._pressed: Optional[Tuple[QPersistentModelIndex, str]] = None
+        self._view: Optional[QAbstractItemView] = None
+        self._viewport: Optional[QObject] = None
+
+        if isinstance(parent, QAbstractItemView):
+            self.attach(parent)
+
+    def attach(self, view: QAbstractItemView):
+        """Enable hover tracking on a view (hover is reset when the mouse leaves)"""
+        if self._view is view:
+            return
+        if self._viewport is not None:
+            self._viewport.removeEventFilter(self)
+        self._view = view
+        self._viewport = view.viewport()
+        view.setMouseTracking(True)
+        self._viewport.installEventFilter(self)
+
+    def actions(self) -> List[str]:
+        return list(self._actions)
+
+    # --- Geometry ---
+
+    def _button_rects(self, cell: QRect) -> List[Tuple[str, QRect]]:
+        """Button rect of every action inside a cell (left aligned, v-centered)"""
+        left, top, right, bottom = CELL_MARGINS
+        width, height = BTN_SIZE.width(), BTN_SIZE.height()
+        inner = cell.adjusted(left, top, -right, -bottom)
+        y = inner.top() + max(0, (inner.height() - height) // 2)
+        height = min(height, inner.height())
+
+        rects = []
+        x = inner.left()
+        for action in self._actions:
+            rects.append((action, QRect(x, y, width, height)))
+            x += width + BTN_SPACING
+        return rects
+
+    def _action_at(self, cell: QRect, pos: QPoint) -> Optional[str]:
+        for action, rect in self._button_rects(cell):
+            if rect.contains(pos):
+                return action
+        return None
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        left, top, right, bottom = CELL_MARGINS
+        count = len(self._actions)
+        width = left + right + count * BTN_SIZE.width()
+        width += max(0, count - 1) * BTN_SPACING
+        return QSize(width, top + bottom + BTN_SIZE.height())
+
+    # --- Painting ---
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        # Cell background / selection only, no text
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else None
+        if style is not None:
+            style.drawPrimitive(
+                QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, opt.widget
+            )
+
+        dpr = painter.device().devicePixelRatioF()
+        painter.save()
+        painter.setClipRect(option.rect)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        for action, rect in self._button_rects(option.rect):
+            color_name, _, icon_name = ROW_ACTIONS[action]
+            color = COLORS.get(color_name, COLORS["primary"])
+
+            if self._is_state(self._pressed, index, action):
+                self._paint_button_background(painter, rect, color, 0.6, False)
+            elif self._is_state(self._hover, index, action):
+                self._paint_button_background(painter, rect, color, 0.4, True)
+
+            pixmap = _action_pixmap(icon_name, color, dpr)
+            icon_rect = QRect(QPoint(0, 0), ICON_SIZE)
+            icon_rect.moveCenter(rect.center())
+            painter.drawPixmap(icon_rect, pixmap)
+
+        painter.restore()
+
+    def _paint_button_background(
+        self, painter: QPainter, rect: QRect, color: str, alpha: float, border: bool
+    ):
+        fill = QColor(color)
+        fill.setAlphaF(alpha)
+        painter.setBrush(fill)
+        painter.setPen(QPen(QColor(color), 1) if border else Qt.PenStyle.NoPen)
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+
+    @staticmethod
+    def _is_state(
+        state: Optional[Tuple[QPersistentModelIndex, str]],
+        index: QModelIndex,
+        action: str,
+    ) -> bool:
+        return state is not None and state[1] == action and state[0] == index
+
+    # --- Events ---
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex):
+        event_type = event.type()
+        if event_type not in (
+            QEvent.Type.MouseMove,
+            QEvent.Type.MouseButtonPress,
+            QEvent.Type.MouseButtonRelease,
+            QEvent.Type.MouseButtonDblClick,
+        ):
+            return super().editorEvent(event, model, option, index)
+
+        view = option.widget if isinstance(option.widget, QAbstractItemView) else None
+        action = self._action_at(option.rect, event.position().toPoint())
+
+        if event_type == QEvent.Type.MouseMove:
+            self._set_hover(view, index, action)
+            return False
+
+        if event.button() != Qt.MouseButton.LeftButton or action is None:
+            return False
+
+        if event_type == QEvent.Type.MouseButtonRelease:
+            pressed = self._pressed
+            self._set_pressed(view, None)
+            if self._is_state(pressed, index, action):
+                row_id = index.siblingAtColumn(0).data(Qt.ItemDataRole.UserRole)
+                self.action_clicked.emit(row_id, action)
+        else:
+            self._set_pressed(view, (QPersistentModelIndex(index), action))
+        return True  # Buttons take the click, the selection stays as it is
+
+    def helpEvent(self, event, view, option: QStyleOptionViewItem, index: QModelIndex):
+        """Button tooltips"""
+        if event.type() == QEvent.Type.ToolTip:
+            action = self._action_at(option.rect, event.pos())
+            if action is not None:
+                QToolTip.showText(event.globalPos(), ROW_ACTIONS[action][1], view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        """Clear hover / press when the mouse leaves the buttons' cells"""
+        if obj is self._viewport:
+            event_type = event.type()
+            if event_type == QEvent.Type.Leave:
+                self._set_hover(self._view, QModelIndex(), None)
+                self._set_pressed(self._view, None)
+            elif event_type == QEvent.Type.MouseMove and self._hover is not None:
+                if self._view.indexAt(event.position().toPoint()) != self._hover[0]:
+                    self._set_hover(self._view, QModelIndex(), None)
+            elif (
+                event_type == QEvent.Type.MouseButtonRelease
+                and self._pressed is not None
+            ):
+                # Released outside the pressed button's cell
+                if self._view.indexAt(event.position().toPoint()) != self._pressed[0]:
+                    self._set_pressed(self._view, None)
+        return False
+
+    def _set_hover(self, view, index: QModelIndex, action: Optional[str]):
+        hover = (QPersistentModelIndex(index), action) if action else None
+        if hover == self._hover:
+            return
+        old, self._hover = self._hover, hover
+        self._update_cells(view, old, hover)
+
+    def _set_pressed(self, view, pressed: Optional[Tuple[QPersistentModelIndex, str]]):
+        if pressed == self._pressed:
+            return
+        old, self._pressed = self._pressed, pressed
+        self._update_cells(view, old, pressed)
+
+    def _update_cells(self, view, *states):
+        """Repaint only the cells whose button state changed"""
+        view = view or self._view
+        if view is None:
+            return
+        for state in states:
+            if state is not None and state[0].isValid():
+                view.update(QModelIndex(state[0]))
@@ -13,7 +13,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QFont
 
-from .theme import COLORS, FONT_FAMILY_QT
+from .theme import FONT_FAMILY_QT, ensure_theme
 
 
 class FilterChip(QFrame):
@@ -43,33 +43,7 @@ class FilterChip(QFrame):
         close_btn.clicked.connect(lambda: self.remove_clicked.emit(self.column_key))
         layout.addWidget(close_btn)
 
-        self._setup_style()
-
-    def _setup_style(self):
-        self.setStyleSheet(
-            f"""
-            FilterChip {{
-                background: {COLORS['bg_hover']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 12px;
-            }}
-            QLabel {{
-                color: {COLORS['text_primary']};
-                background: transparent;
-                border: none;
-            }}
-            QPushButton {{
-                background: transparent;
-                border: none;
-                color: {COLORS['text_muted']};
-                border-radius: 8px;
-            }}
-            QPushButton:hover {{
-                background: {COLORS['danger']};
-                color: white;
-            }}
-        """
-        )
+        ensure_theme(self)
 
 
 class ActiveFiltersBar(QFrame):
@@ -90,7 +64,7 @@ class ActiveFiltersBar(QFrame):
         # Label
         self._label = QLabel("Filtreler:")
         self._label.setFont(QFont(FONT_FAMILY_QT, 10))
-        self._label.setStyleSheet(f"color: {COLORS['text_muted']};")
+        self._label.setObjectName("ActiveFiltersLabel")
         layout.addWidget(self._label)
 
         # Chips Container
@@ -106,36 +80,13 @@ class ActiveFiltersBar(QFrame):
         self._clear_all_btn.setFixedHeight(22)
         self._clear_all_btn.setFont(QFont(FONT_FAMILY_QT, 10))
         self._clear_all_btn.clicked.connect(self.clear_all_clicked.emit)
-        self._clear_all_btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                background: transparent;
-                border: 1px solid {COLORS['danger']};
-                border-radius: 4px;
-                color: {COLORS['danger']};
-                padding: 2px 8px;
-            }}
-            QPushButton:hover {{
-                background: {COLORS['danger']};
-                color: white;
-            }}
-        """
-        )
+        self._clear_all_btn.setObjectName("ClearFiltersButton")
         layout.addWidget(self._clear_all_btn)
 
         # Initially hidden
         self.setVisible(False)
         self.setFixedHeight(32)
-
-        self.setStyleSheet(
-            f"""
-            QFrame#ActiveFiltersBar {{
-                background: {COLORS['bg_tertiary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 4px;
-            }}
-        """
-        )
+        ensure_theme(self)
 
     def update_filters(self, filters: Dict[str, dict], column_titles: Dict[str, str]):
         """Update chips based on active filters"""
@@ -0,0 +1,326 @@
+"""
+Searchable checkable list popup.
+Shared base of the filter popup (values) and the column chooser (columns).
+"""
+
+from typing import List, Optional, Set
+from PyQt6.QtWidgets import (
+    QFrame,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLineEdit,
+    QPushButton,
+    QWidget,
+    QListView,
+)
+from PyQt6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QTimer,
+)
+
+from .theme import ensure_theme
+
+
+class CheckableListModel(QAbstractListModel):
+    """
+    Checkable list of string values.
+
+    Check state is a default flag plus a set of toggled values, so
+    selecting all / none is a flag flip regardless of the value count.
+
+    Rows are the values whose search text contains the search string. When
+    the new search string contains the previous one, only the previous
+    matches are re-checked.
+    """
+
+    VALUE_ROLE = Qt.ItemDataRole.UserRole  # Raw value
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._values: List[str] = []
+        self._lowered: List[str] = []  # Lowercased search texts
+        self._default_checked = True
+        self._toggled: Set[str] = set()
+
+        # Search state
+        self._search = ""
+        self._matches: Optional[List[int]] = None  # None = all values
+
+    def label(self, value: str) -> str:
+        """Display text of a value"""
+        return value
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        if self._matches is None:
+            return len(self._values)
+        return len(self._matches)
+
+    def _value_at(self, row: int) -> str:
+        if self._matches is None:
+            return self._values[row]
+        return self._values[self._matches[row]]
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        value = self._value_at(index.row())
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.label(value)
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return (
+                Qt.CheckState.Checked
+                if self.is_checked(value)
+                else Qt.CheckState.Unchecked
+            )
+        if role == self.VALUE_ROLE:
+            return value
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        # Toggled by clicking anywhere on the row or by Space on the current
+        # row (see CheckableListPopup)
+        return Qt.ItemFlag.ItemIsEnabled
+
+    def set_values(
+        self, values: List[str], search_texts: Optional[List[str]] = None
+    ):
+        """Set values (all checked); search_texts default to the values"""
+        self.beginResetModel()
+        self._values = values
+        texts = values if search_texts is None else search_texts
+        self._lowered = [text.lower() for text in texts]
+        self._default_checked = True
+        self._toggled = set()
+        self._search = ""
+        self._matches = None
+        self.endResetModel()
+
+    def set_search(self, text: str):
+        """Show only values whose search text contains text (case insensitive)"""
+        needle = text.lower()
+        if needle == self._search:
+            return
+
+        if not needle:
+            matches = None
+        elif self._search and self._search in needle:
+            # Narrower search: survivors are a subset of the current matches
+            lowered = self._lowered
+            candidates = (
+                range(len(self._values)) if self._matches is None else self._matches
+            )
+            matches = [i for i in candidates if needle in lowered[i]]
+        else:
+            matches = [i for i, value in enumerate(self._lowered) if needle in value]
+
+        self.beginResetModel()
+        self._search = needle
+        self._matches = matches
+        self.endResetModel()
+
+    def values(self) -> List[str]:
+        return self._values
+
+    def is_checked(self, value: str) -> bool:
+        return self._default_checked != (value in self._toggled)
+
+    def toggle(self, row: int):
+        value = self._value_at(row)
+        if value in self._toggled:
+            self._toggled.discard(value)
+        else:
+            self._toggled.add(value)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+
+    def set_all_checked(self, checked: bool):
+        self._default_checked = checked
+        self._toggled = set()
+        self._emit_all_changed()
+
+    def set_matches_checked(self, checked: bool):
+        """Check / uncheck the values matching the search"""
+        if self._matches is None:
+            self.set_all_checked(checked)
+            return
+        for i in self._matches:
+            value = self._values[i]
+            if self.is_checked(value) != checked:
+                self._toggled.symmetric_difference_update((value,))
+        self._emit_all_changed()
+
+    def set_checked_values(self, values):
+        """Check exactly the given values"""
+        self._default_checked = False
+        self._toggled = set(values).intersection(self._values)
+        self._emit_all_changed()
+
+    def checked_values(self) -> List[str]:
+        if self._default_checked:
+            return [value for value in self._values if value not in self._toggled]
+        return list(self._toggled)
+
+    def checked_count(self) -> int:
+        if self._default_checked:
+            return len(self._values) - len(self._toggled)
+        return len(self._toggled)
+
+    def _emit_all_changed(self):
+        row_count = self.rowCount()
+        if row_count:
+            self.dataChanged.emit(
+                self.index(0),
+                self.index(row_count - 1),
+                [Qt.ItemDataRole.CheckStateRole],
+            )
+
+
+class CheckableListPopup(QFrame):
+    """
+    Popup with a search box, Select All / Clear buttons, a checkable list
+    view (only visible rows are painted) and a bottom bar with a secondary
+    button (reset_btn) and Apply.
+
+    Subclasses create their model in _create_model(), add rows in
+    _setup_extra_ui() and implement _on_reset() / _on_apply().
+    """
+
+    # Delay before a search is run, so fast typing triggers one update
+    SEARCH_DEBOUNCE_MS = 150
+
+    # Layout
+    POPUP_WIDTH = 180
+    LIST_MAX_HEIGHT = 120
+    RESET_TEXT = "Sıfırla"
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.list_model = self._create_model()
+
+        self.setWindowFlags(Qt.WindowType.Popup | Qt.WindowType.FramelessWindowHint)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, False)
+
+        self._setup_ui()
+        ensure_theme(self)
+
+    def _setup_ui(self):
+        """UI setup - Compact design"""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.setSpacing(2)
+
+        # Search box
+        self.search_input = QLineEdit()
+        self.search_input.setFixedHeight(14)
+        self.search_input.textChanged.connect(self._on_search_changed)
+        layout.addWidget(self.search_input)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._run_search)
+
+        # Select All / Clear buttons
+        buttons_layout = QHBoxLayout()
+        buttons_layout.setSpacing(2)
+        buttons_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.select_all_btn = QPushButton("Tümü")
+        self.select_all_btn.setFixedHeight(14)
+        self.select_all_btn.clicked.connect(self._select_all)
+        buttons_layout.addWidget(self.select_all_btn)
+
+        self.clear_btn = QPushButton("Hiçbiri")
+        self.clear_btn.setFixedHeight(14)
+        self.clear_btn.clicked.connect(self._clear_selection)
+        buttons_layout.addWidget(self.clear_btn)
+
+        layout.addLayout(buttons_layout)
+
+        # Checkable list
+        self.list_view = QListView()
+        self.list_view.setModel(self.list_model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setHorizontalScrollBarPolicy(
+            Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+        )
+        self.list_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.list_view.setMinimumHeight(60)
+        self.list_view.setMaximumHeight(self.LIST_MAX_HEIGHT)
+        self.list_view.clicked.connect(self._on_item_clicked)
+        self.list_view.installEventFilter(self)  # Space toggles the current row
+        layout.addWidget(self.list_view)
+
+        self._setup_extra_ui(layout)
+
+        # Bottom buttons
+        action_layout = QHBoxLayout()
+        action_layout.setSpacing(2)
+        action_layout.setContentsMargins(0, 1, 0, 0)
+
+        self.reset_btn = QPushButton(self.RESET_TEXT)
+        self.reset_btn.setFixedHeight(16)
+        self.reset_btn.clicked.connect(self._on_reset)
+        action_layout.addWidget(self.reset_btn)
+
+        self.apply_btn = QPushButton("Uygula")
+        self.apply_btn.setFixedHeight(16)
+        self.apply_btn.setProperty("class", "primary")
+        self.apply_btn.clicked.connect(self._on_apply)
+        action_layout.addWidget(self.apply_btn)
+
+        layout.addLayout(action_layout)
+
+        self.setFixedWidth(self.POPUP_WIDTH)
+
+    def _create_model(self) -> CheckableListModel:
+        return CheckableListModel(self)
+
+    def _setup_extra_ui(self, layout: QVBoxLayout):
+        """Rows between the list and the bottom buttons"""
+
+    def _reset_search(self):
+        """Clear the search box without triggering a search"""
+        self._search_timer.stop()
+        self.search_input.blockSignals(True)
+        self.search_input.clear()
+        self.search_input.blockSignals(False)
+
+    def eventFilter(self, obj, event) -> bool:
+        if (
+            obj is self.list_view
+            and event.type() == QEvent.Type.KeyPress
+            and event.key() in (Qt.Key.Key_Space, Qt.Key.Key_Select)
+        ):
+            index = self.list_view.currentIndex()
+            if index.isValid():
+                self.list_model.toggle(index.row())
+            return True
+        return super().eventFilter(obj, event)
+
+    def _on_item_clicked(self, index: QModelIndex):
+        self.list_model.toggle(index.row())
+
+    def _on_search_changed(self, text: str):
+        self._search_timer.start()  # Restart debounce
+
+    def _run_search(self):
+        self.list_model.set_search(self.search_input.text())
+
+    def _select_all(self):
+        self.list_model.set_all_checked(True)
+
+    def _clear_selection(self):
+        self.list_model.set_all_checked(False)
+
+    def _on_reset(self):
+        self.close()
+
+    def _on_apply(self):
+        self.close()
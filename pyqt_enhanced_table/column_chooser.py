@@ -0,0 +1,79 @@
+"""
+Searchable column chooser popup for wide tables.
+"""
+
+from typing import Dict, List, Set, Tuple
+from PyQt6.QtCore import pyqtSignal
+
+from .checkable_list import CheckableListModel, CheckableListPopup
+
+
+class ColumnListModel(CheckableListModel):
+    """Checkable list of column keys (checked = visible), labeled by title"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._titles: Dict[str, str] = {}
+
+    def label(self, value: str) -> str:
+        return self._titles.get(value, value)
+
+    def set_columns(self, columns: List[Tuple[str, str]], visible: Set[str]):
+        """Set (key, title) pairs in display order and the visible keys"""
+        self._titles = dict(columns)
+        self.set_values(
+            [key for key, _ in columns], [title for _, title in columns]
+        )
+        self.set_checked_values(visible)
+
+
+class ColumnChooser(CheckableListPopup):
+    """
+    Column show / hide popup.
+
+    Features:
+    - Search box over column titles
+    - Column list (checkable list view)
+    - Show / hide all search results
+    - Changes are applied together on Apply
+    """
+
+    columns_applied = pyqtSignal(dict)  # column_key -> visible (changed only)
+
+    POPUP_WIDTH = 200
+    LIST_MAX_HEIGHT = 240
+    RESET_TEXT = "İptal"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._initial: Set[str] = set()  # Visible keys when opened
+        self.search_input.setPlaceholderText("🔍 Sütun")
+
+    def _create_model(self) -> ColumnListModel:
+        return ColumnListModel(self)
+
+    def set_columns(self, columns: List[Tuple[str, str]], visible: Set[str]):
+        """Load (key, title) pairs in display order and the visible keys"""
+        self._reset_search()
+        self._initial = set(visible)
+        self.list_model.set_columns(columns, visible)
+        self.list_view.scrollToTop()
+
+    def _select_all(self):
+        self.list_model.set_matches_checked(True)
+
+    def _clear_selection(self):
+        self.list_model.set_matches_checked(False)
+
+    def changed_columns(self) -> Dict[str, bool]:
+        """Columns whose visibility differs from when the chooser was opened"""
+        checked = set(self.list_model.checked_values())
+        changes = {key: True for key in checked - self._initial}
+        changes.update((key, False) for key in self._initial - checked)
+        return changes
+
+    def _on_apply(self):
+        changes = self.changed_columns()
+        if changes:
+            self.columns_applied.emit(changes)
+        self.close()
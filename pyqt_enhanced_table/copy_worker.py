@@ -0,0 +1,129 @@
+"""
+Clipboard formatting of selected cells.
+Builds TSV, CSV and HTML text for a selection, inline for small copies or
+in the global QThreadPool for very large ones.
+"""
+
+import csv
+import html
+import io
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+# (storage rows, copied column positions or None for every column)
+CopyBlock = Tuple[Sequence[int], Optional[Set[int]]]
+
+# Text getter (by storage row) of a copied column
+CellGetter = Callable[[int], str]
+
+MIME_TSV = "text/plain"
+MIME_CSV = "text/csv"
+MIME_HTML = "text/html"
+
+CHUNK_ROWS = 4096
+
+
+def _format_chunks(
+    blocks: List[CopyBlock], getters: List[CellGetter], parts: Dict[str, list]
+) -> Iterator[int]:
+    """
+    Append formatted rows to parts (one list of pieces per MIME type),
+    yielding the number of rows done after each chunk.
+    """
+    tsv, rows_html = parts[MIME_TSV], parts[MIME_HTML]
+    csv_buffer = parts[MIME_CSV][0]
+    csv_row = csv.writer(csv_buffer).writerow
+    escape = html.escape
+
+    done = 0
+    for rows, selected in blocks:
+        if selected is None:
+            row_getters = getters
+        else:
+            row_getters = [
+                get if pos in selected else (lambda row: "")
+                for pos, get in enumerate(getters)
+            ]
+
+        for start in range(0, len(rows), CHUNK_ROWS):
+            chunk = rows[start : start + CHUNK_ROWS]
+            for row in chunk:
+                cells = [get(row) for get in row_getters]
+                tsv.append("\t".join(cells))
+                csv_row(cells)
+                rows_html.append(
+                    "<tr><td>"
+                    + "</td><td>".join(escape(cell) for cell in cells)
+                    + "</td></tr>"
+                )
+            done += len(chunk)
+            yield done
+
+
+def _new_parts() -> Dict[str, list]:
+    return {MIME_TSV: [], MIME_CSV: [io.StringIO(newline="")], MIME_HTML: []}
+
+
+def _join_parts(parts: Dict[str, list]) -> Dict[str, str]:
+    # One join per format: the result string is allocated once at full size
+    return {
+        MIME_TSV: "\n".join(parts[MIME_TSV]),
+        MIME_CSV: parts[MIME_CSV][0].getvalue(),
+        MIME_HTML: '<meta charset="utf-8"><table>'
+        + "".join(parts[MIME_HTML])
+        + "</table>",
+    }
+
+
+def format_selection(
+    blocks: List[CopyBlock], getters: List[CellGetter]
+) -> Dict[str, str]:
+    """Clipboard text per MIME type (TSV as text/plain, CSV, HTML table)"""
+    parts = _new_parts()
+    for _ in _format_chunks(blocks, getters, parts):
+        pass
+    return _join_parts(parts)
+
+
+class CopyWorkerSignals(QObject):
+    """Signals of a CopyWorker (delivered queued to the GUI thread)"""
+
+    progress = pyqtSignal(int, int, int)  # generation, done rows, total rows
+    finished = pyqtSignal(int, object)  # generation, texts (None if cancelled)
+
+
+class CopyWorker(QRunnable):
+    """
+    Formats a large selection in a worker thread.
+
+    Only thread-safe column snapshots are touched, never Qt items or models.
+    cancel() stops formatting at the next chunk boundary.
+    """
+
+    def __init__(
+        self,
+        generation: int,
+        blocks: List[CopyBlock],
+        getters: List[CellGetter],
+    ):
+        super().__init__()
+        self.setAutoDelete(False)  # Owned by the table until finished
+        self.generation = generation
+        self.signals = CopyWorkerSignals()
+        self._blocks = blocks
+        self._getters = getters
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        total = sum(len(rows) for rows, _ in self._blocks) or 1
+        parts = _new_parts()
+        for done in _format_chunks(self._blocks, self._getters, parts):
+            if self._cancelled:
+                self.signals.finished.emit(self.generation, None)
+                return
+            self.signals.progress.emit(self.generation, done, total)
+
+        self.signals.finished.emit(self.generation, _join_parts(parts))
@@ -3,25 +3,24 @@ Enhanced Table Component
 Features: Filtering, Sorting, Column Management, Persistent Settings
 """
 
-from typing import List, Dict, Optional, Set, TYPE_CHECKING
-from PyQt6.QtWidgets import (
-    QTableWidget,
-    QTableWidgetItem,
-    QHeaderView,
-    QMenu,
-    QAbstractItemView,
-    QWidget,
-    QHBoxLayout,
-    QApplication,
+import time
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QItemSelection,
+    QItemSelectionModel,
+    QTimer,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QSettings
-from PyQt6.QtGui import QAction, QKeySequence
 
-from .filterable_header import FilterableHeaderView
-from .filter_popup import FilterPopup
+from .settings_store import SettingsStore
+from .sort_keys import EMPTY_NUMBER, numeric_sort_keys, text_sort_keys
+from .table_mixin import EnhancedTableMixin
 
-if TYPE_CHECKING:
-    from .active_filters_bar import ActiveFiltersBar
+# Numeric value of number cells loaded with set_rows() / append_rows()
+NUMERIC_ROLE = Qt.ItemDataRole.UserRole + 1
 
 
 class NumericTableWidgetItem(QTableWidgetItem):
@@ -50,6 +49,24 @@ class NumericTableWidgetItem(QTableWidgetItem):
             return super().__lt__(other)
 
 
+def _changed_regions(cells: Dict[int, Dict[int, object]]) -> List[Tuple[int, ...]]:
+    """
+    Merge changed cells (row -> {col_idx: value}) into (top, bottom, left,
+    right) rectangles: the column span of each row, adjacent rows with the
+    same span joined.
+    """
+    regions: List[Tuple[int, ...]] = []
+    for row in sorted(cells):
+        left, right = min(cells[row]), max(cells[row])
+        if regions:
+            top, bottom, prev_left, prev_right = regions[-1]
+            if bottom == row - 1 and (prev_left, prev_right) == (left, right):
+                regions[-1] = (top, row, left, right)
+                continue
+        regions.append((row, row, left, right))
+    return regions
+
+
 class ColumnConfig:
     """Column Configuration Class"""
 
@@ -82,17 +99,21 @@ class ColumnConfig:
         self.align = align
 
 
-class EnhancedTableWidget(QTableWidget):
+class EnhancedTableWidget(EnhancedTableMixin, QTableWidget):
     """
     Enhanced Table Widget with advanced features.
     """
 
-    # Signals
-    row_double_clicked = pyqtSignal(int)  # Row ID
-    row_selected = pyqtSignal(int)  # Row ID
-    settings_changed = pyqtSignal()  # When settings change
-    filter_changed = pyqtSignal(dict)  # When active filters change
-    rows_filtered = pyqtSignal(int, int)  # Post-filter (visible, total)
+    # Signals (progressive loading)
+    load_busy = pyqtSignal(bool)  # Progressive load running
+    load_progress = pyqtSignal(int, int)  # (loaded, total), total 0 if unknown
+    load_finished = pyqtSignal(int)  # Loaded rows (not emitted when cancelled)
+
+    # Progressive loading inserts this much work per event loop turn
+    LOAD_FRAME_BUDGET_MS = 12
+
+    # Live updates (apply_updates) are merged and applied once per frame
+    UPDATE_FLUSH_MS = 16
 
     def __init__(
         self,
@@ -100,53 +121,74 @@ class EnhancedTableWidget(QTableWidget):
         columns: List[ColumnConfig],
         user_id: int = 0,
         parent=None,
+        settings_store: Optional[SettingsStore] = None,
     ):
         super().__init__(parent)
-        self.table_id = table_id
-        self.user_id = user_id
-        self.columns = {col.key: col for col in columns}
-        self.column_order = [col.key for col in columns]
-
-        # Filtering
-        self._active_filters: Dict[str, dict] = {}
-        self._predefined_options: Dict[str, List[str]] = {}
-        self._filter_popup: Optional[FilterPopup] = None
-
-        # CSS class
-        self.setProperty("class", "enhanced-table")
-
-        self._load_settings()
-        self._setup_table()
-        self._setup_filterable_header()
-        self._apply_column_settings()
-        self._connect_signals()
-        self._load_filter_settings()
-
-    def set_filter_options(self, column_key: str, options: List[str]):
-        """Set predefined options for filter menu"""
-        self._predefined_options[column_key] = options
-
-    def get_logical_visible_columns(self) -> List[str]:
-        """Get visible columns in logical (original) order"""
-        return [key for key in self.column_order if self.columns[key].visible]
-
-    def _get_table_index(self, column_key: str) -> int:
-        """Get logical index of column in table"""
+
+        # Progressive loading
+        self._load_iter: Optional[Iterator] = None
+        self._load_id_key: Optional[str] = None
+        self._load_total = 0
+        self._load_count = 0
+        self._load_chunk = 0
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(0)
+        self._load_timer.timeout.connect(self._load_next_chunk)
+
+        # Live updates: (row_id, column_key) -> latest value
+        self._moving_row = False
+        self._pending_updates: Dict[Tuple[object, str], object] = {}
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_FLUSH_MS)
+        self._update_timer.timeout.connect(self.flush_updates)
+
+        self._init_enhanced_table(table_id, columns, user_id, settings_store)
+
+    def _source_row_count(self) -> int:
+        return self.rowCount()
+
+    def _cell_text(self, row: int, col_idx: int) -> str:
+        item = self.item(row, col_idx)
+        return item.text() if item else ""
+
+    def _row_id(self, row: int):
+        item = self.item(row, 0)
+        return item.data(Qt.ItemDataRole.UserRole) if item else None
+
+    def _storage_row_id(self, row: int):
+        return self._row_id(row)
+
+    def _view_row(self, row: int) -> int:
+        return -1 if self.isRowHidden(row) else row
+
+    def _storage_row(self, row: int) -> int:
+        return row
+
+    def _show_rows(self, rows: Optional[List[int]]):
+        """Hide rows not in rows (None shows all), touching only changed rows"""
+        row_count = self.rowCount()
+        if rows is None:
+            visible = bytearray(b"\x01") * row_count
+        else:
+            visible = bytearray(row_count)
+            for row in rows:
+                visible[row] = 1
+
+        # One repaint/layout pass instead of one per setRowHidden call
+        self.setUpdatesEnabled(False)
         try:
-            return self.column_order.index(column_key)
-        except ValueError:
-            return -1
+            for row in range(row_count):
+                hidden = not visible[row]
+                if self.isRowHidden(row) != hidden:
+                    self.setRowHidden(row, hidden)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _setup_table(self):
         """Basic table setup"""
-        self.setAlternatingRowColors(True)
-        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectItems)
-        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.verticalHeader().setVisible(True)
-        self.verticalHeader().setDefaultSectionSize(36)
-        self.setShowGrid(False)
-        self.setSortingEnabled(False)  # Using custom handler
+        super()._setup_table()
 
         # Create columns (all logical columns)
         self.setColumnCount(len(self.column_order))
@@ -154,512 +196,556 @@ class EnhancedTableWidget(QTableWidget):
             [self.columns[key].title for key in self.column_order]
         )
 
-        # Hide initially hidden columns
-        for i, key in enumerate(self.column_order):
-            if not self.columns[key].visible:
-                self.setColumnHidden(i, True)
-
-    def _setup_filterable_header(self):
-        """Setup filterable header"""
-        self._filter_header = FilterableHeaderView(Qt.Orientation.Horizontal, self)
-        self.setHorizontalHeader(self._filter_header)
-
-        self._filter_header.setSectionsMovable(True)
-        self._filter_header.setStretchLastSection(False)
-        self._filter_header.sectionMoved.connect(self._on_section_moved)
-        self._filter_header.sectionResized.connect(self._on_section_resized)
-        self._filter_header.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self._filter_header.customContextMenuRequested.connect(self._show_column_menu)
-
-        # Filter signal
-        self._filter_header.filter_icon_clicked.connect(self._on_filter_icon_clicked)
-
-        # Set titles
-        self.setHorizontalHeaderLabels(
-            [self.columns[k].title for k in self.column_order]
-        )
-
-        # Set filterability
-        for logical_idx, key in enumerate(self.column_order):
-            col = self.columns[key]
-            self._filter_header.set_column_filterable(logical_idx, col.filterable)
-
     def _connect_signals(self):
         """Connect internal signals"""
-        self.doubleClicked.connect(self._on_double_click)
-        self.itemSelectionChanged.connect(self._on_selection_changed)
-        self._filter_header.sectionClicked.connect(self._on_header_clicked)
-
-    def keyPressEvent(self, event):
-        """Copy shortcut (Ctrl+C)"""
-        if event.matches(QKeySequence.StandardKey.Copy):
-            self._copy_selection()
-        else:
-            super().keyPressEvent(event)
-
-    def _copy_selection(self):
-        """Copy selected cells to clipboard as TSV"""
-        selection = self.selectedIndexes()
-        if not selection:
+        super()._connect_signals()
+
+        # Keep value indexes in sync with item changes
+        model = self.model()
+        model.rowsInserted.connect(self._on_model_rows_inserted)
+        model.rowsRemoved.connect(self._on_model_rows_removed)
+        model.dataChanged.connect(self._on_model_data_changed)
+        model.modelReset.connect(self._on_storage_reset)
+        model.layoutChanged.connect(lambda *args: self._on_storage_reset())
+
+    def _on_model_rows_inserted(self, parent, first: int, last: int):
+        if not self._moving_row:  # Row moves are reported as one move
+            self._on_storage_rows_inserted(first, last - first + 1)
+
+    def _on_model_rows_removed(self, parent, first: int, last: int):
+        if not self._moving_row:
+            self._on_storage_rows_removed(first, last - first + 1)
+
+    def _on_model_data_changed(self, top_left, bottom_right, roles):
+        if roles and Qt.ItemDataRole.DisplayRole.value not in roles:
+            if top_left.column() == 0 and Qt.ItemDataRole.UserRole.value in roles:
+                self._on_storage_ids_changed(top_left.row(), bottom_right.row())
             return
+        self._on_storage_cells_changed(
+            top_left.row(), bottom_right.row(), top_left.column(), bottom_right.column()
+        )
 
-        rows = sorted(list(set(index.row() for index in selection)))
-        columns = sorted(list(set(index.column() for index in selection)))
-
-        row_map = {r: i for i, r in enumerate(rows)}
-        col_map = {c: i for i, c in enumerate(columns)}
-
-        data = [["" for _ in columns] for _ in rows]
-
-        for index in selection:
-            r = row_map[index.row()]
-            c = col_map[index.column()]
-            val = index.data(Qt.ItemDataRole.DisplayRole)
-            data[r][c] = str(val) if val is not None else ""
+    def _column_sort_keys(self, col_idx: int) -> Sequence:
+        """
+        Numeric keys if every non-empty cell is a NumericTableWidgetItem (or
+        a number cell loaded by set_rows), case-insensitive text keys otherwise
+        """
+        items = [self.item(row, col_idx) for row in range(self.rowCount())]
+
+        numbers = []
+        for item in items:
+            value = getattr(item, "numeric_value", None)
+            if value is None and item is not None:
+                value = item.data(NUMERIC_ROLE)
+                if value is None and item.text():
+                    break  # Text cell
+            numbers.append(value)
+        else:
+            try:
+                return numeric_sort_keys(numbers)
+            except TypeError:
+                pass  # Non float values (e.g. dates) -> sort by text
+
+        return text_sort_keys(item.text() if item else "" for item in items)
+
+    def _cell_sort_key(self, row: int, col_idx: int, numeric: bool):
+        item = self.item(row, col_idx)
+        text = item.text() if item else ""
+        if not numeric:
+            return text.casefold()
+        if item is None:
+            return EMPTY_NUMBER
+
+        value = getattr(item, "numeric_value", None)
+        if value is None:
+            value = item.data(NUMERIC_ROLE)
+        if value is None:
+            return None if text else EMPTY_NUMBER
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return None
+        return EMPTY_NUMBER if value != value else value
+
+    def _apply_row_order(self, perm: List[int]):
+        """
+        Reorder rows in one layout change.
+
+        Hidden rows are shown during the sort and hidden again at their new
+        positions (the header would otherwise remap each hidden section).
+        """
+        row_count = len(perm)
+        if row_count < 2:
+            return
 
-        tsv = "\n".join(["\t".join(row) for row in data])
-        QApplication.clipboard().setText(tsv)
+        self.setUpdatesEnabled(False)
+        try:
+            hidden = [row for row in range(row_count) if self.isRowHidden(row)]
+            for row in hidden:
+                self.setRowHidden(row, False)
+
+            self._sort_rows(perm)
+
+            if hidden:
+                new_rows = [0] * row_count
+                for new_row, old_row in enumerate(perm):
+                    new_rows[old_row] = new_row
+                for row in hidden:
+                    self.setRowHidden(new_rows[row], True)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _sort_rows(self, perm: List[int]):
+        """
+        Column 0 items are temporarily swapped for items holding the target
+        position, so the model sorts them without calling into Python
+        (moving every column and keeping selection and current index). The
+        rank items are created by the model itself, so they are plain C++
+        items.
+        """
+        row_count = len(perm)
+        model = self.model()
+        blocked = model.blockSignals(True)
+        try:
+            originals = [self.takeItem(row, 0) for row in range(row_count)]
+            index, set_data = model.index, model.setData
+            for new_row, old_row in enumerate(perm):
+                set_data(index(old_row, 0), new_row)
+        finally:
+            model.blockSignals(blocked)
 
-    def _on_header_clicked(self, logical_index: int):
-        """Sort when header is clicked"""
-        header = self.horizontalHeader()
-        current_order = header.sortIndicatorOrder()
+        model.sort(0, Qt.SortOrder.AscendingOrder)
 
-        self.setSortingEnabled(True)
-        self.sortItems(logical_index, current_order)
-        self.setSortingEnabled(False)
+        blocked = model.blockSignals(True)
+        try:
+            for new_row, old_row in enumerate(perm):
+                item = originals[old_row]
+                if item is None:
+                    self.takeItem(new_row, 0)
+                else:
+                    self.setItem(new_row, 0, item)
+        finally:
+            model.blockSignals(blocked)
+        self.viewport().update()
+
+    def _update_storage_row(self, row: int, values: Dict[int, object]):
+        """Set cell texts (and numeric values of number columns) of a row"""
+        model = self.model()
+        for col_idx, value in values.items():
+            text = "" if value is None else str(value)
+            number = None
+            if text and self.columns[self.column_order[col_idx]].filter_type == "number":
+                try:
+                    number = float(value)
+                except (TypeError, ValueError):
+                    pass
 
-    def _on_filter_icon_clicked(self, section: int, global_pos: QPoint):
-        """Show filter popup"""
-        if section < 0 or section >= len(self.column_order):
+            item = self.item(row, col_idx)
+            if item is None:
+                if text:
+                    index = model.index(row, col_idx)
+                    model.setData(index, number, NUMERIC_ROLE)
+                    model.setData(index, text)
+                continue
+            if hasattr(item, "numeric_value"):
+                item.numeric_value = value if text else None
+            else:
+                item.setData(NUMERIC_ROLE, number)
+            item.setText(text)  # Display change updates indexes and sort keys
+
+    def _remove_storage_rows(self, rows: List[int]):
+        """
+        Remove rows, one model removal per contiguous run. The remaining
+        rows stay sorted and filtered; only the visible count is adjusted.
+        """
+        visible_count = self._visible_count
+        removed_visible = len(rows) - sum(map(self.isRowHidden, rows))
+
+        model = self.model()
+        end = len(rows)
+        while end:
+            start = end - 1
+            while start and rows[start - 1] == rows[start] - 1:
+                start -= 1
+            model.removeRows(rows[start], end - start)
+            end = start
+
+        if visible_count is not None:
+            self._visible_count = visible_count - removed_visible
+        if self._active_filters:
+            self._emit_rows_filtered()
+
+    def set_rows(self, rows: Iterable, id_key: Optional[str] = None):
+        """
+        Replace table data (tuples in column order or dicts by key).
+        id_key names the column holding the row ID (UserRole of column 0).
+        """
+        self.cancel_loading()
+        self._load_rows(rows, id_key, replace=True)
+        self.apply_saved_filters()
+
+    def append_rows(self, rows: Iterable, id_key: Optional[str] = None):
+        """
+        Append rows to table data (same row format as set_rows).
+        New rows are checked against the active filters and placed into
+        the current sort order by binary search (no full pass).
+        """
+        first = self.rowCount()
+        if self._load_rows(rows, id_key, replace=False):
+            new_rows = list(range(first, self.rowCount()))
+            self._refresh_rows(new_rows, set(range(self.columnCount())), True)
+
+    def start_loading(
+        self, rows: Iterable, id_key: Optional[str] = None, total: Optional[int] = None
+    ):
+        """
+        Replace table data progressively (rows may be a generator).
+
+        The first screenful is inserted at once; the rest is inserted in
+        chunks sized to LOAD_FRAME_BUDGET_MS, yielding to the event loop
+        in between. Saved sort and filters are applied when done (filters
+        already hide non-matching rows while loading). Reports load_busy,
+        load_progress and load_finished; total defaults to len(rows).
+        """
+        self.cancel_loading()
+        if total is None:
+            total = len(rows) if hasattr(rows, "__len__") else 0
+
+        self._load_iter = iter(rows)
+        self._load_id_key = id_key
+        self._load_total = total
+        self._load_count = 0
+        row_height = max(1, self.verticalHeader().defaultSectionSize())
+        self._load_chunk = max(32, self.viewport().height() // row_height + 1)
+
+        self._load_rows([], id_key, replace=True)
+        self.load_busy.emit(True)
+        self._load_next_chunk()
+
+    def cancel_loading(self):
+        """Stop a progressive load (rows loaded so far are kept)"""
+        if self._load_iter is None:
             return
+        self._load_timer.stop()
+        self._load_iter = None
+        self.load_busy.emit(False)
 
-        column_key = self.column_order[section]
-        col_config = self.columns[column_key]
+    def is_loading(self) -> bool:
+        return self._load_iter is not None
 
-        unique_values = self.get_unique_values(column_key)
-        current_filter = self._active_filters.get(column_key)
+    def _load_next_chunk(self):
+        if self._load_iter is None:
+            return
 
-        self._filter_popup = FilterPopup(
-            column_key=column_key,
-            column_title=col_config.title,
-            unique_values=unique_values,
-            current_filter=current_filter,
-            parent=self,
-        )
-        self._filter_popup.filter_applied.connect(self._on_filter_applied)
-        self._filter_popup.filter_cleared.connect(
-            lambda: self._on_filter_cleared(column_key)
+        started = time.perf_counter()
+        requested = self._load_chunk
+        rows = list(islice(self._load_iter, requested))
+        first = self.rowCount()
+        if self._load_rows(rows, self._load_id_key, replace=False):
+            self._hide_unmatched_rows(first)
+        self._load_count += len(rows)
+
+        # Size the next chunk to the frame budget at the measured rate. Some
+        # per-chunk costs grow with the table (header bookkeeping of hidden
+        # rows), so chunks never drop below a share of the loaded rows.
+        elapsed_ms = max((time.perf_counter() - started) * 1000, 0.1)
+        rate = len(rows) / elapsed_ms
+        self._load_chunk = max(
+            32, self.rowCount() // 64, int(rate * self.LOAD_FRAME_BUDGET_MS)
         )
 
-        self._filter_popup.move(global_pos)
-
-        # Boundary check
-        screen = self.screen()
-        if screen:
-            screen_width = screen.geometry().width()
-            popup_width = self._filter_popup.width()
-            if global_pos.x() + popup_width > screen_width:
-                new_x = global_pos.x() - popup_width + 20
-                self._filter_popup.move(new_x, global_pos.y())
-
-        self._filter_popup.show()
+        self.load_progress.emit(self._load_count, self._load_total)
+        if len(rows) < requested:
+            self._load_iter = None
+            self.apply_saved_filters()
+            self.load_busy.emit(False)
+            self.load_finished.emit(self._load_count)
+        else:
+            self._load_timer.start()
 
-    def _on_filter_applied(self, filter_data: dict):
-        """Filter applied callback"""
-        column_key = filter_data.get("column_key")
-        if not column_key:
+    def _hide_unmatched_rows(self, first: int):
+        """Hide loaded rows that fail the active filters"""
+        if not self._active_filters:
             return
+        filters = self._compiled_filters()
+        cell_text = self._cell_text
+        self.setUpdatesEnabled(False)
+        try:
+            for row in range(first, self.rowCount()):
+                for col_idx, column_filter in filters:
+                    if not column_filter.matches(cell_text(row, col_idx)):
+                        self.setRowHidden(row, True)
+                        break
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def hideEvent(self, event):
+        """Navigating away (page switch, close) cancels progressive loading"""
+        if not event.spontaneous():
+            self.cancel_loading()
+        super().hideEvent(event)
+
+    def _load_rows(self, rows: Iterable, id_key: Optional[str], replace: bool) -> bool:
+        """
+        Fill cells in one pass with repaints and model signals suspended,
+        then refresh indexes (the caller applies saved sort and filters).
+        Returns whether rows were added.
+
+        Cells are created by the model itself (plain C++ items, no Python
+        wrapper per cell). Number cells keep their value in NUMERIC_ROLE.
+        """
+        rows = list(rows)
+        if not rows and not replace:
+            return False
+
+        keys = self.column_order
+        col_count = len(keys)
+        id_col = keys.index(id_key) if id_key in keys else -1
+        numeric = [self.columns[key].filter_type == "number" for key in keys]
+        aligns = [self.columns[key].align for key in keys]
+
+        model = self.model()
+        display, user = Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.UserRole
+        alignment = Qt.ItemDataRole.TextAlignmentRole
+
+        self.setUpdatesEnabled(False)
+        try:
+            if replace:
+                self.setRowCount(0)
+            first = self.rowCount()
+            self.setRowCount(first + len(rows))
 
-        if filter_data.get("all_selected") and "text_filter" not in filter_data:
-            self._on_filter_cleared(column_key)
+            blocked = model.blockSignals(True)
+            try:
+                index, set_data = model.index, model.setData
+                for row, data in enumerate(rows, first):
+                    if isinstance(data, dict):
+                        values = [data.get(key) for key in keys]
+                        row_id = data.get(id_key) if id_key else None
+                    else:
+                        values = list(data[:col_count])
+                        values.extend([None] * (col_count - len(values)))
+                        row_id = values[id_col] if id_col != -1 else None
+
+                    for col, value in enumerate(values):
+                        if value is None or value == "":
+                            continue
+                        cell = index(row, col)
+                        set_data(cell, str(value), display)
+                        if numeric[col]:
+                            try:
+                                set_data(cell, float(value), NUMERIC_ROLE)
+                            except (TypeError, ValueError):
+                                pass  # Text cell, column sorts as text
+                        if aligns[col] is not None:
+                            set_data(cell, aligns[col].value, alignment)
+
+                    if row_id is not None:
+                        set_data(index(row, 0), row_id, user)
+            finally:
+                model.blockSignals(blocked)
+        finally:
+            self.setUpdatesEnabled(True)
+
+        if replace:
+            self._on_storage_reset()
+        elif rows:
+            self._on_storage_cells_changed(first, self.rowCount() - 1, 0, col_count - 1)
+        return bool(rows)
+
+    # --- Live updates ---
+
+    def apply_updates(self, changes: Iterable[Tuple[object, str, object]]):
+        """
+        Queue cell updates as (row_id, column_key, value) triples.
+        Queued updates are applied together once per frame (UPDATE_FLUSH_MS);
+        a later value for the same cell replaces an earlier one.
+        """
+        pending = self._pending_updates
+        for row_id, column_key, value in changes:
+            pending[(row_id, column_key)] = value
+        if pending and not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def flush_updates(self):
+        """
+        Apply queued updates now.
+
+        Cells are written with model signals suspended and announced as a
+        few rectangular dataChanged regions; filters and sort position are
+        re-checked for the touched rows only.
+        """
+        self._update_timer.stop()
+        pending, self._pending_updates = self._pending_updates, {}
+        if not pending:
             return
 
-        self._active_filters[column_key] = filter_data
-
-        visible_columns = self.get_visible_columns()
-        if column_key in visible_columns:
-            section = visible_columns.index(column_key)
-            self._filter_header.set_filter_active(section, True)
-
-        self._apply_filters()
-        self._save_filter_settings()
-        self.filter_changed.emit(self._active_filters)
-
-    def _on_filter_cleared(self, column_key: str):
-        """Filter cleared callback"""
-        if column_key in self._active_filters:
-            del self._active_filters[column_key]
-
-        visible_columns = self.get_visible_columns()
-        if column_key in visible_columns:
-            section = visible_columns.index(column_key)
-            self._filter_header.set_filter_active(section, False)
-
-        self._apply_filters()
-        self._save_filter_settings()
-        self.filter_changed.emit(self._active_filters)
-
-    def _apply_filters(self):
-        """Apply all active filters"""
-        if getattr(self, "server_side_mode", False):
-            self.rows_filtered.emit(self.rowCount(), self.rowCount())
+        cells: Dict[int, Dict[int, object]] = {}
+        for (row_id, column_key), value in pending.items():
+            row = self._id_row(row_id)
+            col_idx = self._get_table_index(column_key)
+            if row is not None and col_idx != -1:
+                cells.setdefault(row, {})[col_idx] = value
+        if not cells:
             return
 
-        visible_count = 0
-        for row in range(self.rowCount()):
-            visible = True
-            for col_key, filter_data in self._active_filters.items():
-                if col_key not in self.columns:
-                    continue
-
-                col_idx = self._get_table_index(col_key)
-                if col_idx == -1:
-                    continue
-
-                item = self.item(row, col_idx)
-                cell_text = item.text() if item else ""
-
-                all_sel = filter_data.get("all_selected", True)
-                if isinstance(all_sel, str):
-                    all_sel = all_sel.lower() == "true"
-
-                if not all_sel:
-                    allowed = filter_data.get("selected_values", [])
-                    match = False
-                    for val in allowed:
-                        if str(val) == cell_text:
-                            match = True
-                            break
-                    if not match:
-                        visible = False
-                        break
-
-                text_filter = filter_data.get("text_filter")
-                if text_filter:
-                    mode = text_filter.get("mode", "contains")
-                    text = text_filter.get("text", "").lower()
-                    if not self._match_text_filter(cell_text, text, mode):
-                        visible = False
-                        break
-
-            self.setRowHidden(row, not visible)
-            if visible:
-                visible_count += 1
-
-        self.rows_filtered.emit(visible_count, self.rowCount())
-
-    def _row_matches_filters(self, row: int) -> bool:
-        """Check if single row matches filters"""
-        if not self._active_filters:
-            return True
-
-        for col_key, filter_data in self._active_filters.items():
-            if col_key not in self.columns:
-                continue
-
-            col_idx = self._get_table_index(col_key)
-            if col_idx == -1:
-                continue
-
-            item = self.item(row, col_idx)
-            cell_text = item.text() if item else ""
-
-            if not filter_data.get("all_selected", True):
-                allowed = filter_data.get("selected_values", [])
-                if cell_text not in allowed:
-                    return False
-
-            text_filter = filter_data.get("text_filter")
-            if text_filter:
-                mode = text_filter.get("mode", "contains")
-                text = text_filter.get("text", "").lower()
-                if not self._match_text_filter(cell_text, text, mode):
-                    return False
-
-        return True
-
-    def _match_text_filter(self, cell_text: str, text: str, mode: str) -> bool:
-        """Helper for text logic"""
-        cell_lower = cell_text.lower()
-        if mode == "contains":
-            return text in cell_lower
-        elif mode == "not_contains":
-            return text not in cell_lower
-        elif mode == "equals":
-            return cell_lower == text
-        elif mode == "not_equals":
-            return cell_lower != text
-        elif mode == "starts_with":
-            return cell_lower.startswith(text)
-        elif mode == "ends_with":
-            return cell_lower.endswith(text)
-        return True
-
-    def get_unique_values(self, column_key: str) -> List[str]:
-        """Get unique values in a column"""
-        if column_key in self._predefined_options:
-            return self._predefined_options[column_key]
-
-        col_idx = self._get_table_index(column_key)
-        if col_idx == -1:
-            return []
-
-        values: Set[str] = set()
-        for row in range(self.rowCount()):
-            item = self.item(row, col_idx)
-            val = item.text() if item else ""
-            values.add(val)
-        return sorted(values)
-
-    def clear_all_filters(self):
-        """Clear all active filters"""
-        self._active_filters.clear()
-        self._filter_header.clear_all_filter_indicators()
-        for row in range(self.rowCount()):
-            self.setRowHidden(row, False)
-        self._save_filter_settings()
-        self.filter_changed.emit(self._active_filters)
-
-    def get_visible_columns(self) -> List[str]:
-        """Get visible column keys in visual order"""
-        header = self.horizontalHeader()
-        visible_cols = []
-        for visual_idx in range(header.count()):
-            logical_idx = header.logicalIndex(visual_idx)
-            if not header.isSectionHidden(logical_idx):
-                visible_cols.append(self.column_order[logical_idx])
-        return visible_cols
-
-    def _on_section_moved(self, logical_idx, old_visual, new_visual):
-        self._save_settings()
-
-    def _on_section_resized(self, logical_idx, old_size, new_size):
-        self._save_settings()
-
-    def _show_column_menu(self, pos: QPoint):
-        """Show show/hide columns menu"""
-        menu = QMenu(self)
-        for key in self.column_order:
-            col = self.columns[key]
-            action = QAction(col.title, menu)
-            action.setCheckable(True)
-            action.setChecked(col.visible)
-            action.triggered.connect(
-                lambda checked, k=key: self._toggle_column(k, checked)
-            )
-            menu.addAction(action)
-        menu.exec(self._filter_header.mapToGlobal(pos))
+        model = self.model()
+        blocked = model.blockSignals(True)
+        try:
+            for row, values in cells.items():
+                self._update_storage_row(row, values)
+        finally:
+            model.blockSignals(blocked)
 
-    def _toggle_column(self, key: str, visible: bool):
-        """Toggle column visibility"""
-        self.columns[key].visible = visible
-        self._save_settings()
+        # Repaints the regions and updates value indexes and sort keys
+        index = model.index
+        for top, bottom, left, right in _changed_regions(cells):
+            model.dataChanged.emit(index(top, left), index(bottom, right), [])
 
-        logical_idx = self.column_order.index(key)
-        self.setColumnHidden(logical_idx, not visible)
-        self.horizontalHeader().setSectionHidden(logical_idx, not visible)
+        columns = {col_idx for values in cells.values() for col_idx in values}
+        self._refresh_rows(sorted(cells), columns)
 
-        if hasattr(self, "_filter_header"):
-            self._filter_header.set_column_filterable(
-                logical_idx, self.columns[key].filterable if visible else False
+    def _refresh_rows(
+        self, rows: List[int], columns: Set[int], inserted: bool = False
+    ):
+        """
+        Re-check filters and sort position of changed rows (cells in
+        columns). For inserted rows rows_filtered always reports the new total.
+        """
+        if self._active_filters:
+            if self._filter_busy:
+                self._apply_filters()  # Running evaluation saw the old values
+            else:
+                filters = self._compiled_filters()
+                if any(col_idx in columns for col_idx, _ in filters):
+                    self._refilter_rows(rows, filters, inserted)
+                elif inserted:
+                    self._emit_rows_filtered()
+
+        sort_columns = {self._get_table_index(key) for key, _ in self._sort_columns}
+        if sort_columns & columns:
+            self._resort_rows(rows)
+
+    def _refilter_rows(self, rows: List[int], filters, report: bool = False):
+        """Show / hide rows by the active filters (rows_filtered if any changed)"""
+        changed = 0
+        self.setUpdatesEnabled(False)
+        try:
+            for row in rows:
+                hidden = not self._row_matches_filters(row, filters)
+                if hidden != self.isRowHidden(row):
+                    self.setRowHidden(row, hidden)
+                    changed += -1 if hidden else 1
+        finally:
+            self.setUpdatesEnabled(True)
+        if self._visible_count is not None:
+            self._visible_count += changed
+        if changed or report:
+            self._emit_rows_filtered()
+
+    def _emit_rows_filtered(self):
+        row_count = self.rowCount()
+        if self._visible_count is None:
+            self._visible_count = row_count - sum(
+                map(self.isRowHidden, range(row_count))
             )
+        self.rows_filtered.emit(self._visible_count, row_count)
+
+    def _resort_rows(self, rows: List[int]):
+        """
+        Move changed rows to their sorted positions (binary search on the
+        cached sort keys, one row at a time). Large batches are fully sorted.
+        """
+        if len(rows) * 32 > self.rowCount():
+            self._apply_sort()
+            return
 
-    def _apply_column_settings(self):
-        """Apply width and stretch settings"""
-        header = self.horizontalHeader()
-        for idx, key in enumerate(self.column_order):
-            if idx >= header.count():
-                break
-
-            col = self.columns[key]
-            header.setSectionResizeMode(idx, QHeaderView.ResizeMode.Interactive)
-            self.setColumnWidth(idx, col.width)
+        # Moves the header sees shift its hidden rows in C++, O(hidden rows)
+        # each; otherwise hidden flags are carried in one pass over the span
+        hidden_count = self.verticalHeader().hiddenSectionCount()
+        shift_header = len(rows) * hidden_count < self.rowCount()
 
-        if hasattr(self, "_saved_header_state") and self._saved_header_state:
-            try:
-                header.restoreState(self._saved_header_state)
-            except Exception:
-                self._saved_header_state = None
-
-    def _on_double_click(self, index):
-        """Emit double click signal with Row ID"""
-        item = self.item(index.row(), 0)
-        if item:
-            item_id = item.data(Qt.ItemDataRole.UserRole)
-            if item_id:
-                self.row_double_clicked.emit(item_id)
-
-    def _on_selection_changed(self):
-        sel_model = self.selectionModel()
-        if sel_model:
-            current = sel_model.currentIndex()
-            if current.isValid():
-                item = self.item(current.row(), 0)
-                if item:
-                    item_id = item.data(Qt.ItemDataRole.UserRole)
-                    if item_id:
-                        self.row_selected.emit(item_id)
-                        return
-
-            selected = sel_model.selectedIndexes()
-            if selected:
-                item = self.item(selected[0].row(), 0)
-                if item:
-                    item_id = item.data(Qt.ItemDataRole.UserRole)
-                    if item_id:
-                        self.row_selected.emit(item_id)
-
-    def get_selected_id(self) -> Optional[int]:
-        sel_model = self.selectionModel()
-        if sel_model:
-            current = sel_model.currentIndex()
-            if current.isValid():
-                item = self.item(current.row(), 0)
-                if item:
-                    return item.data(Qt.ItemDataRole.UserRole)
-
-            selected = sel_model.selectedIndexes()
-            if selected:
-                item = self.item(selected[0].row(), 0)
-                if item:
-                    return item.data(Qt.ItemDataRole.UserRole)
-        return None
-
-    def _get_settings_key(self, suffix: str) -> str:
-        return f"table_{self.table_id}_{self.user_id}_{suffix}"
-
-    def _save_settings(self):
-        settings = QSettings()
-        header = self.horizontalHeader()
-        state = header.saveState()
-        settings.setValue(self._get_settings_key("header_state"), state)
-
-        col_settings = {}
-        for key, col in self.columns.items():
-            col_settings[key] = {"visible": col.visible, "width": col.width}
-        settings.setValue(self._get_settings_key("columns"), col_settings)
-        self.settings_changed.emit()
-
-    def _load_settings(self):
-        settings = QSettings()
-        col_settings = settings.value(self._get_settings_key("columns"))
-        if col_settings:
-            for key, config in col_settings.items():
-                if key in self.columns:
-                    self.columns[key].visible = config.get("visible", True)
-                    self.columns[key].width = config.get("width", 100)
-
-        header_state = settings.value(self._get_settings_key("header_state"))
-        if header_state:
-            self._saved_header_state = header_state
-
-    def _save_filter_settings(self):
-        settings = QSettings()
-        settings.setValue(self._get_settings_key("filters"), self._active_filters)
-
-    def _load_filter_settings(self):
-        settings = QSettings()
-        saved_filters = settings.value(self._get_settings_key("filters"))
-        if saved_filters:
-            self._active_filters = saved_filters
-            for col_key in self._active_filters:
-                if col_key in self.columns:
-                    logical_idx = self.column_order.index(col_key)
-                    self._filter_header.set_filter_active(logical_idx, True)
-
-    def apply_saved_filters(self):
-        """Apply filters after loading data"""
-        if self._active_filters:
-            self._apply_filters()
-
-    def set_standard_row_height(self, height: int):
-        self.verticalHeader().setDefaultSectionSize(height)
-
-    def set_user_id(self, user_id: int):
-        self.user_id = user_id
-        self._load_settings()
-        self._apply_column_settings()
-
-    def create_action_widget(self, item_id, actions, callbacks=None):
-        """Create inline action buttons"""
-        from .action_buttons import (
-            create_view_button,
-            create_edit_button,
-            create_delete_button,
+        moves = self._place_sorted_rows(
+            rows, lambda source, target: self._move_row(source, target, shift_header)
         )
-
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(4, 2, 4, 2)
-        layout.setSpacing(6)
-
-        for action in actions:
-            btn = None
-            if action == "view":
-                btn = create_view_button(widget)
-                if callbacks and "view" in callbacks:
-                    btn.clicked.connect(callbacks["view"])
-            elif action == "edit":
-                btn = create_edit_button(widget)
-                if callbacks and "edit" in callbacks:
-                    btn.clicked.connect(callbacks["edit"])
-            elif action == "delete":
-                btn = create_delete_button(widget)
-                if callbacks and "delete" in callbacks:
-                    btn.clicked.connect(callbacks["delete"])
-
-            if btn:
-                layout.addWidget(btn)
-
-        layout.addStretch()
-        return widget
-
-    def create_filters_bar(self) -> "ActiveFiltersBar":
-        """Create and attach an ActiveFiltersBar"""
-        from .active_filters_bar import ActiveFiltersBar
-        from PyQt6.QtCore import QTimer
-
-        bar = ActiveFiltersBar(self.parent())
-
-        bar.filter_removed.connect(self._on_filter_cleared)
-        bar.clear_all_clicked.connect(self.clear_all_filters)
-        self.filter_changed.connect(
-            lambda filters: bar.update_filters(
-                filters, {k: c.title for k, c in self.columns.items()}
+        if not moves:
+            return
+        if not shift_header:
+            self._move_hidden_flags(moves)
+        self.viewport().update()
+
+    def _move_row(self, source: int, target: int, shift_header: bool = False):
+        """
+        Move one row's items to target, keeping its selection. Costs
+        O(|target - source|) pointer moves instead of a full sort.
+
+        With shift_header the header sees the move and carries hidden flags
+        itself; otherwise they stay put (see _move_hidden_flags).
+        """
+        col_count = self.columnCount()
+        model = self.model()
+        selection = self.selectionModel()
+        selected_cols = []
+        if selection.hasSelection():
+            selected_cols = [
+                col
+                for col in range(col_count)
+                if selection.isSelected(model.index(source, col))
+            ]
+        current = self.currentIndex()
+        current_col = current.column() if current.row() == source else -1
+        hidden = shift_header and self.isRowHidden(source)
+
+        blocked = model.blockSignals(True)
+        try:
+            items = [self.takeItem(source, col) for col in range(col_count)]
+            if shift_header:
+                model.blockSignals(blocked)
+                self._moving_row = True
+            model.removeRows(source, 1)
+            model.insertRows(target, 1)
+            model.blockSignals(True)
+            for col, item in enumerate(items):
+                if item is not None:
+                    self.setItem(target, col, item)
+        finally:
+            self._moving_row = False
+            model.blockSignals(blocked)
+        if hidden:
+            self.setRowHidden(target, True)
+
+        if selected_cols:
+            restored = QItemSelection()
+            for col in selected_cols:
+                cell = model.index(target, col)
+                restored.select(cell, cell)
+            selection.select(restored, QItemSelectionModel.SelectionFlag.Select)
+        if current_col != -1:
+            selection.setCurrentIndex(
+                model.index(target, current_col),
+                QItemSelectionModel.SelectionFlag.NoUpdate,
             )
-        )
-
-        def sync_filters():
-            if self._active_filters:
-                bar.update_filters(
-                    self._active_filters, {k: c.title for k, c in self.columns.items()}
-                )
-
-        QTimer.singleShot(0, sync_filters)
-
-        return bar
-
-    def set_server_side_mode(self, enabled: bool):
-        self.server_side_mode = enabled
-
-    def get_backend_filters(self):
-        """Convert filters (if needed for backend)"""
-        filters = {}
-        for col_key, filter_data in self._active_filters.items():
-            col_filter = {}
-
-            if not filter_data.get("all_selected", True):
-                col_filter["selected_values"] = filter_data.get("selected_values", [])
-
-            text_filter = filter_data.get("text_filter")
-            if text_filter:
-                col_filter["text_match"] = {
-                    "mode": text_filter.get("mode", "contains"),
-                    "text": text_filter.get("text", ""),
-                }
-
-            if col_filter:
-                filters[col_key] = col_filter
-
-        return filters
+        self._on_storage_row_moved(source, target)
+
+    def _move_hidden_flags(self, moves: List[Tuple[int, int]]):
+        """
+        Carry hidden flags along rows moved by _move_row. The header did not
+        see the moves, so flags are read once over the moved span and only
+        the changed ones are set.
+        """
+        if not self.verticalHeader().hiddenSectionCount():
+            return
+        first = min(min(move) for move in moves)
+        last = max(max(move) for move in moves)
+        old_flags = list(map(self.isRowHidden, range(first, last + 1)))
+        flags = list(old_flags)
+        for source, target in moves:
+            flags.insert(target - first, flags.pop(source - first))
+
+        self.setUpdatesEnabled(False)
+        try:
+            for row, (was_hidden, hidden) in enumerate(zip(old_flags, flags), first):
+                if was_hidden != hidden:
+                    self.setRowHidden(row, hidden)
+        finally:
+            self.setUpdatesEnabled(True)
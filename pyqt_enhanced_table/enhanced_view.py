@@ -0,0 +1,195 @@
+"""
+Enhanced Table View Component
+Model based counterpart of EnhancedTableWidget for large data sets.
+"""
+
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TYPE_CHECKING,
+)
+from PyQt6.QtWidgets import QTableView
+
+from .settings_store import SettingsStore
+from .table_mixin import EnhancedTableMixin
+from .table_model import ColumnarTableModel
+
+if TYPE_CHECKING:
+    from .enhanced_table import ColumnConfig
+
+
+class EnhancedTableView(EnhancedTableMixin, QTableView):
+    """
+    Enhanced Table View backed by a ColumnarTableModel.
+
+    Same features and settings keys as EnhancedTableWidget, but cells are
+    stored column by column instead of one QTableWidgetItem per cell.
+    Load data with set_rows() / append_rows().
+    """
+
+    # Changed rows re-placed one by one under a sort; larger batches are
+    # fully sorted (each move shifts index postings over the moved span)
+    RESORT_MAX_MOVES = 8
+
+    def __init__(
+        self,
+        table_id: str,
+        columns: List["ColumnConfig"],
+        user_id: int = 0,
+        parent=None,
+        settings_store: Optional[SettingsStore] = None,
+    ):
+        super().__init__(parent)
+        self._table_model = ColumnarTableModel(columns, self)
+        self._init_enhanced_table(table_id, columns, user_id, settings_store)
+
+    def table_model(self) -> ColumnarTableModel:
+        """Underlying columnar model"""
+        return self._table_model
+
+    def _source_row_count(self) -> int:
+        return self._table_model.storage_row_count()
+
+    def _cell_text(self, row: int, col_idx: int) -> str:
+        return self._table_model.cell_text(row, col_idx)
+
+    def _row_id(self, row: int):
+        model = self._table_model
+        return model.row_id(model.storage_row(row))
+
+    def _storage_row_id(self, row: int):
+        return self._table_model.row_id(row)
+
+    def _view_row(self, row: int) -> int:
+        return self._table_model.view_row(row)
+
+    def _storage_row(self, row: int) -> int:
+        return self._table_model.storage_row(row)
+
+    def _snapshot_column(self, col_idx: int) -> Callable[[int], str]:
+        return self._table_model.snapshot_column(col_idx)
+
+    def _show_rows(self, rows: Optional[List[int]]):
+        """Swap in the visible-row map with a single model reset"""
+        self._table_model.set_visible_rows(rows)
+
+    def _setup_table(self):
+        """Basic table setup"""
+        super()._setup_table()
+        self.setModel(self._table_model)
+
+    def _connect_signals(self):
+        """Connect internal signals"""
+        super()._connect_signals()
+        self._table_model.storage_rows_inserted.connect(
+            self._on_storage_rows_inserted
+        )
+        self._table_model.storage_rows_removed.connect(self._on_storage_rows_removed)
+        self._table_model.storage_cells_changed.connect(
+            self._on_storage_cells_changed
+        )
+        self._table_model.storage_row_moved.connect(self._on_storage_row_moved)
+        self._table_model.storage_reset.connect(self._on_storage_reset)
+
+    def _column_sort_keys(self, col_idx: int) -> Sequence:
+        return self._table_model.sort_keys(col_idx)
+
+    def _cell_sort_key(self, row: int, col_idx: int, numeric: bool):
+        key = self._table_model.cell_sort_key(row, col_idx)
+        if numeric != isinstance(key, float):
+            return None  # Column was demoted to text
+        return key
+
+    def _apply_row_order(self, perm: List[int]):
+        self._table_model.apply_row_order(perm)
+
+    def _update_storage_row(self, row: int, values: Dict[int, object]):
+        self._table_model.update_row(row, values)
+
+    def _remove_storage_rows(self, rows: List[int]):
+        self._table_model.remove_rows(rows)
+        if self._active_filters:
+            self._emit_rows_filtered()
+
+    def _refresh_rows(
+        self, rows: List[int], columns: Set[int], inserted: bool = False
+    ):
+        """
+        Re-check filters and sort position of changed rows (cells in
+        columns). For inserted rows rows_filtered always reports the new total.
+        """
+        if self._active_filters:
+            if self._filter_busy:
+                self._apply_filters()  # Running evaluation saw the old values
+            else:
+                filters = self._compiled_filters()
+                if inserted:
+                    self._filter_appended_rows(rows, filters)
+                elif any(col_idx in columns for col_idx, _ in filters):
+                    self._refilter_rows(rows, filters)
+
+        sort_columns = {self._get_table_index(key) for key, _ in self._sort_columns}
+        if sort_columns & columns:
+            self._resort_rows(rows)
+
+    def _refilter_rows(self, rows: List[int], filters):
+        """Show / hide rows by the active filters (rows_filtered if any changed)"""
+        model = self._table_model
+        changed = False
+        for row in rows:
+            visible = self._row_matches_filters(row, filters)
+            changed = model.set_row_visible(row, visible) or changed
+        if changed:
+            self._emit_rows_filtered()
+
+    def _filter_appended_rows(self, rows: List[int], filters):
+        """Show the matching rows of an append (hidden by the visible-row map)"""
+        matches = self._row_matches_filters
+        self._table_model.show_appended_rows(
+            [row for row in rows if matches(row, filters)]
+        )
+        self._emit_rows_filtered()
+
+    def _resort_rows(self, rows: List[int]):
+        """
+        Move changed rows to their sorted positions (binary search on the
+        cached sort keys, one row at a time). Large batches are fully sorted.
+        """
+        if len(rows) > self.RESORT_MAX_MOVES:
+            self._apply_sort()
+            return
+        self._place_sorted_rows(rows, self._table_model.move_row)
+
+    def _emit_rows_filtered(self):
+        # Visible rows are the rows of the model
+        self._visible_count = self._table_model.rowCount()
+        self.rows_filtered.emit(
+            self._visible_count, self._table_model.storage_row_count()
+        )
+
+    def set_rows(self, rows: Iterable, id_key: Optional[str] = None):
+        """Replace table data (tuples in column order or dicts by key)"""
+        self._table_model.set_rows(rows, id_key)
+        self.apply_saved_filters()
+
+    def append_rows(self, rows: Iterable, id_key: Optional[str] = None):
+        """
+        Append rows to table data.
+        New rows are checked against the active filters and placed into
+        the current sort order by binary search (no full pass).
+        """
+        model = self._table_model
+        first = model.storage_row_count()
+        model.append_rows(rows, id_key)
+        new_rows = list(range(first, model.storage_row_count()))
+        if new_rows:
+            self._refresh_rows(new_rows, set(range(len(self.column_order))), True)
+
+    def set_column_format(self, column_key: str, fmt: Optional[str]):
+        """Set display format spec for a numeric column (e.g. ".2f")"""
+        self._table_model.set_column_format(column_key, fmt)
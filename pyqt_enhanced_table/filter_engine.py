@@ -0,0 +1,130 @@
+"""
+Compiled column filters.
+Turns FilterPopup filter dicts into per-column predicates once, so row
+evaluation does no dict lookups, string coercion or mode dispatch.
+"""
+
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+
+# mode -> match(cell_lower, needle)
+TEXT_MATCHERS: Dict[str, Callable[[str, str], bool]] = {
+    "contains": lambda cell, text: text in cell,
+    "not_contains": lambda cell, text: text not in cell,
+    "equals": lambda cell, text: cell == text,
+    "not_equals": lambda cell, text: cell != text,
+    "starts_with": lambda cell, text: cell.startswith(text),
+    "ends_with": lambda cell, text: cell.endswith(text),
+}
+
+# (column_key, allowed values or None, text mode or None, lowered text)
+ColumnSignature = Tuple[str, Optional[FrozenSet[str]], Optional[str], str]
+
+
+class ColumnFilter:
+    """
+    Compiled filter for one column.
+
+    - allowed: frozenset of accepted cell texts (None = all values)
+    - mode / needle: text filter with pre-lowered needle (None = no text filter)
+    - matches(cell_text): bound predicate combining both
+    - text_matches(cell_text): text filter only (None without text filter),
+      for rows already narrowed by value through a ColumnValueIndex
+    """
+
+    __slots__ = ("column_key", "allowed", "mode", "needle", "matches", "text_matches")
+
+    def __init__(
+        self,
+        column_key: str,
+        allowed: Optional[FrozenSet[str]],
+        mode: Optional[str],
+        needle: str,
+    ):
+        self.column_key = column_key
+        self.allowed = allowed
+        self.mode = mode
+        self.needle = needle
+        self.text_matches = self._build_text_predicate()
+        self.matches = self._build_predicate()
+
+    def _build_text_predicate(self) -> Optional[Callable[[str], bool]]:
+        match_text = TEXT_MATCHERS.get(self.mode) if self.mode else None
+        if match_text is None:
+            return None
+        needle = self.needle
+        return lambda cell: match_text(cell.lower(), needle)
+
+    def _build_predicate(self) -> Callable[[str], bool]:
+        allowed = self.allowed
+        text_matches = self.text_matches
+
+        if text_matches is None:
+            if allowed is None:
+                return lambda cell: True
+            return allowed.__contains__
+
+        if allowed is None:
+            return text_matches
+        return lambda cell: cell in allowed and text_matches(cell)
+
+
+def _is_true(value) -> bool:
+    """Bool coercion tolerant of QSettings string values"""
+    if isinstance(value, str):
+        return value.lower() == "true"
+    return bool(value)
+
+
+def column_signature(column_key: str, filter_data: dict) -> ColumnSignature:
+    """Hashable signature of one column's filter dict"""
+    allowed = None
+    if not _is_true(filter_data.get("all_selected", True)):
+        allowed = frozenset(
+            str(val) for val in filter_data.get("selected_values", None) or ()
+        )
+
+    mode = None
+    needle = ""
+    text_filter = filter_data.get("text_filter")
+    if text_filter:
+        needle = text_filter.get("text", "").lower()
+        mode = text_filter.get("mode", "contains")
+
+    return (column_key, allowed, mode, needle)
+
+
+def filters_signature(active_filters: Dict[str, dict]) -> Tuple[ColumnSignature, ...]:
+    """Hashable signature of all active filters"""
+    return tuple(
+        column_signature(column_key, filter_data)
+        for column_key, filter_data in active_filters.items()
+    )
+
+
+@lru_cache(maxsize=64)
+def _compile_signature(
+    signature: Tuple[ColumnSignature, ...]
+) -> Tuple[ColumnFilter, ...]:
+    return tuple(
+        ColumnFilter(column_key, allowed, mode, needle)
+        for column_key, allowed, mode, needle in signature
+        if allowed is not None or mode is not None
+    )
+
+
+def compile_filters(active_filters: Dict[str, dict]) -> Tuple[ColumnFilter, ...]:
+    """
+    Compile active filters into column predicates.
+    Results are cached by filter signature; columns without an effective
+    condition are dropped.
+    """
+    return _compile_signature(filters_signature(active_filters))
+
+
+def match_text(cell_text: str, text: str, mode: str) -> bool:
+    """Match a cell against a lowered text filter"""
+    match = TEXT_MATCHERS.get(mode)
+    if match is None:
+        return True
+    return match(cell_text.lower(), text)
@@ -2,30 +2,37 @@
 Excel-like column filter popup widget.
 """
 
-from typing import List, Dict, Optional, Set
+from typing import Callable, List, Dict, Optional
 from PyQt6.QtWidgets import (
-    QFrame,
     QVBoxLayout,
     QHBoxLayout,
     QLineEdit,
-    QPushButton,
     QComboBox,
     QWidget,
-    QScrollArea,
-    QCheckBox,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import pyqtSignal
 
-from .theme import COLORS, FONT_FAMILY_QT
+from .checkable_list import CheckableListModel, CheckableListPopup
 
 
-class FilterPopup(QFrame):
+class FilterValuesModel(CheckableListModel):
+    """Checkable list of filter values (label: value plus row count)"""
+
+    def __init__(self, label_func: Callable[[str], str], parent=None):
+        super().__init__(parent)
+        self._label_func = label_func
+
+    def label(self, value: str) -> str:
+        return self._label_func(value)
+
+
+class FilterPopup(CheckableListPopup):
     """
     Excel-like column filter popup.
 
     Features:
     - Search box for values
-    - Unique values list (checkboxes)
+    - Unique values list (checkable list view)
     - Select All / Clear
     - Text filters (contains, equals, etc.)
     - Apply / Reset buttons
@@ -50,75 +57,23 @@ class FilterPopup(QFrame):
         unique_values: Optional[List[str]] = None,
         current_filter: Optional[dict] = None,
         parent: Optional[QWidget] = None,
+        value_counts: Optional[Dict[str, int]] = None,
     ):
         super().__init__(parent)
         self.column_key = column_key
         self.column_title = column_title
         self._all_values: List[str] = []
-        self._selected_values: Set[str] = set()
-        self._checkboxes: Dict[str, QCheckBox] = {}
-
-        self.setWindowFlags(Qt.WindowType.Popup | Qt.WindowType.FramelessWindowHint)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, False)
-
-        self._setup_ui()
-        self._setup_style()
-
-        if unique_values:
-            self.set_unique_values(unique_values)
-
-        if current_filter:
-            self._apply_current_filter(current_filter)
-
-    def _setup_ui(self):
-        """UI setup - Compact design"""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(4, 4, 4, 4)
-        layout.setSpacing(2)
-
-        # Search box
-        self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText(f"🔍 {self.column_title}")
-        self.search_input.setFixedHeight(14)
-        self.search_input.textChanged.connect(self._on_search_changed)
-        layout.addWidget(self.search_input)
-
-        # Select All / Clear buttons
-        buttons_layout = QHBoxLayout()
-        buttons_layout.setSpacing(2)
-        buttons_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.select_all_btn = QPushButton("Tümü")
-        self.select_all_btn.setFixedHeight(14)
-        self.select_all_btn.clicked.connect(self._select_all)
-        buttons_layout.addWidget(self.select_all_btn)
-
-        self.clear_btn = QPushButton("Hiçbiri")
-        self.clear_btn.setFixedHeight(14)
-        self.clear_btn.clicked.connect(self._clear_selection)
-        buttons_layout.addWidget(self.clear_btn)
+        self._value_counts: Dict[str, int] = {}
 
-        layout.addLayout(buttons_layout)
-
-        # Values list
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(
-            Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+        self.set_column(
+            column_key, column_title, unique_values, current_filter, value_counts
         )
-        self.scroll_area.setMinimumHeight(60)
-        self.scroll_area.setMaximumHeight(120)
-
-        self.values_container = QWidget()
-        self.values_layout = QVBoxLayout(self.values_container)
-        self.values_layout.setContentsMargins(2, 2, 2, 2)
-        self.values_layout.setSpacing(0)
-        self.values_layout.addStretch()
 
-        self.scroll_area.setWidget(self.values_container)
-        layout.addWidget(self.scroll_area)
+    def _create_model(self) -> FilterValuesModel:
+        return FilterValuesModel(self._value_label, self)
 
-        # Text filter
+    def _setup_extra_ui(self, layout: QVBoxLayout):
+        """Text filter row"""
         text_filter_layout = QHBoxLayout()
         text_filter_layout.setSpacing(2)
         text_filter_layout.setContentsMargins(0, 0, 0, 0)
@@ -137,221 +92,49 @@ class FilterPopup(QFrame):
 
         layout.addLayout(text_filter_layout)
 
-        # Bottom buttons
-        action_layout = QHBoxLayout()
-        action_layout.setSpacing(2)
-        action_layout.setContentsMargins(0, 1, 0, 0)
-
-        self.reset_btn = QPushButton("Sıfırla")
-        self.reset_btn.setFixedHeight(16)
-        self.reset_btn.clicked.connect(self._on_reset)
-        action_layout.addWidget(self.reset_btn)
-
-        self.apply_btn = QPushButton("Uygula")
-        self.apply_btn.setFixedHeight(16)
-        self.apply_btn.setProperty("class", "primary")
-        self.apply_btn.clicked.connect(self._on_apply)
-        action_layout.addWidget(self.apply_btn)
-
-        layout.addLayout(action_layout)
-
-        # Width
-        self.setFixedWidth(180)
-
-    def _setup_style(self):
-        """Style setup"""
-        self.setStyleSheet(
-            f"""
-            FilterPopup {{
-                background: {COLORS['bg_secondary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 6px;
-            }}
-
-            QLineEdit {{
-                background: {COLORS['bg_primary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 2px;
-                padding: 0px 4px;
-                color: {COLORS['text_primary']};
-                font-family: {FONT_FAMILY_QT};
-                font-size: 9px;
-                min-height: 14px;
-            }}
-
-            QLineEdit:focus {{
-                border-color: {COLORS['primary']};
-            }}
-
-            QComboBox {{
-                background: {COLORS['bg_primary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 2px;
-                padding: 0px 4px;
-                color: {COLORS['text_primary']};
-                font-family: {FONT_FAMILY_QT};
-                font-size: 9px;
-                min-height: 14px;
-            }}
-
-            QComboBox::drop-down {{
-                border: none;
-                width: 12px;
-            }}
-
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 2px solid transparent;
-                border-right: 2px solid transparent;
-                border-top: 3px solid {COLORS['text_secondary']};
-            }}
-
-            QComboBox QAbstractItemView {{
-                background: {COLORS['bg_secondary']};
-                border: 1px solid {COLORS['border']};
-                selection-background-color: {COLORS['primary']};
-                font-size: 9px;
-            }}
-
-            QPushButton {{
-                background: {COLORS['bg_hover']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 2px;
-                padding: 0px 4px;
-                color: {COLORS['text_primary']};
-                font-family: {FONT_FAMILY_QT};
-                font-size: 9px;
-            }}
-
-            QPushButton:hover {{
-                background: {COLORS['bg_active']};
-            }}
-
-            QPushButton[class="primary"] {{
-                background: {COLORS['primary']};
-                border: none;
-                color: white;
-            }}
-
-            QPushButton[class="primary"]:hover {{
-                background: {COLORS['primary_hover']};
-            }}
-
-            QScrollArea {{
-                background: {COLORS['bg_primary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 3px;
-            }}
-
-            QScrollBar:vertical {{
-                background: {COLORS['bg_primary']};
-                width: 6px;
-                border-radius: 3px;
-            }}
-
-            QScrollBar::handle:vertical {{
-                background: {COLORS['border']};
-                border-radius: 3px;
-                min-height: 16px;
-            }}
-
-            QScrollBar::handle:vertical:hover {{
-                background: {COLORS['text_muted']};
-            }}
-
-            QCheckBox {{
-                color: {COLORS['text_primary']};
-                font-family: {FONT_FAMILY_QT};
-                font-size: 10px;
-                spacing: 3px;
-                padding: 1px;
-            }}
-
-            QCheckBox:hover {{
-                background: {COLORS['bg_hover']};
-                border-radius: 2px;
-            }}
-
-            QCheckBox::indicator {{
-                width: 10px;
-                height: 10px;
-                border: 1px solid {COLORS['border']};
-                border-radius: 2px;
-                background: {COLORS['bg_primary']};
-            }}
+    def set_column(
+        self,
+        column_key: str,
+        column_title: str,
+        unique_values: Optional[List[str]] = None,
+        current_filter: Optional[dict] = None,
+        value_counts: Optional[Dict[str, int]] = None,
+    ):
+        """Retarget the popup to a column (one popup is reused between opens)"""
+        self.column_key = column_key
+        self.column_title = column_title
 
-            QCheckBox::indicator:checked {{
-                background: {COLORS['primary']};
-                border-color: {COLORS['primary']};
-            }}
+        # Reset inputs without triggering a search
+        self._reset_search()
+        self.search_input.setPlaceholderText(f"🔍 {column_title}")
+        self.text_filter_input.clear()
+        self.text_mode_combo.setCurrentIndex(0)
 
-            QCheckBox::indicator:checked:hover {{
-                background: {COLORS['primary_hover']};
-            }}
-        """
-        )
+        self.set_unique_values(unique_values or [], value_counts)
+        if current_filter:
+            self._apply_current_filter(current_filter)
+        self.list_view.scrollToTop()
 
-    def set_unique_values(self, values: List[str]):
-        """Set unique values to be displayed"""
+    def set_unique_values(
+        self, values: List[str], counts: Optional[Dict[str, int]] = None
+    ):
+        """Set unique values (and optional row count per value) to be displayed"""
+        self._value_counts = counts or {}
         self._all_values = sorted(set(str(v) for v in values if v is not None))
-        self._selected_values = set(self._all_values)  # All selected initially
-        self._rebuild_checkboxes()
-
-    def _rebuild_checkboxes(self, filter_text: str = ""):
-        """Rebuild checkbox list"""
-        # Clear existing
-        for cb in self._checkboxes.values():
-            cb.deleteLater()
-        self._checkboxes.clear()
-
-        # Remove stretch
-        while self.values_layout.count() > 0:
-            item = self.values_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Add filtered values
-        filter_lower = filter_text.lower()
-        for value in self._all_values:
-            if filter_lower and filter_lower not in value.lower():
-                continue
-
-            checkbox = QCheckBox(value if value else "(Boş)")
-            checkbox.setChecked(value in self._selected_values)
-            checkbox.stateChanged.connect(
-                lambda state, v=value: self._on_checkbox_changed(v, state)
-            )
-            self._checkboxes[value] = checkbox
-            self.values_layout.addWidget(checkbox)
-
-        self.values_layout.addStretch()
-
-    def _on_checkbox_changed(self, value: str, state: int):
-        if state == Qt.CheckState.Checked.value:
-            self._selected_values.add(value)
-        else:
-            self._selected_values.discard(value)
-
-    def _on_search_changed(self, text: str):
-        self._rebuild_checkboxes(text)
-
-    def _select_all(self):
-        self._selected_values = set(self._all_values)
-        for value, checkbox in self._checkboxes.items():
-            checkbox.blockSignals(True)
-            checkbox.setChecked(True)
-            checkbox.blockSignals(False)
+        self.list_model.set_values(self._all_values)  # All selected initially
 
-    def _clear_selection(self):
-        self._selected_values.clear()
-        for checkbox in self._checkboxes.values():
-            checkbox.blockSignals(True)
-            checkbox.setChecked(False)
-            checkbox.blockSignals(False)
+    def _value_label(self, value: str) -> str:
+        """List text: value plus row count if known"""
+        label = value if value else "(Boş)"
+        count = self._value_counts.get(value)
+        if count is None:
+            return label
+        count_text = format(count, ",").replace(",", " ")
+        return f"{label} ({count_text})"
 
     def _on_reset(self):
-        self._selected_values = set(self._all_values)
-        self._rebuild_checkboxes()
+        self.list_model.set_all_checked(True)
+        self.search_input.clear()
         self.text_filter_input.clear()
         self.text_mode_combo.setCurrentIndex(0)
         self.filter_cleared.emit()
@@ -365,8 +148,8 @@ class FilterPopup(QFrame):
     def get_filter_data(self) -> dict:
         data = {
             "column_key": self.column_key,
-            "selected_values": list(self._selected_values),
-            "all_selected": len(self._selected_values) == len(self._all_values),
+            "selected_values": self.list_model.checked_values(),
+            "all_selected": self.list_model.checked_count() == len(self._all_values),
         }
 
         # Text filter
@@ -381,8 +164,7 @@ class FilterPopup(QFrame):
 
     def _apply_current_filter(self, filter_data: dict):
         if "selected_values" in filter_data:
-            self._selected_values = set(filter_data["selected_values"])
-            self._rebuild_checkboxes()
+            self.list_model.set_checked_values(filter_data["selected_values"])
 
         if "text_filter" in filter_data:
             tf = filter_data["text_filter"]
@@ -395,7 +177,7 @@ class FilterPopup(QFrame):
 
     def has_active_filter(self) -> bool:
         """Is there any active filter toggled?"""
-        if len(self._selected_values) < len(self._all_values):
+        if self.list_model.checked_count() < len(self._all_values):
             return True
         if self.text_filter_input.text().strip():
             return True
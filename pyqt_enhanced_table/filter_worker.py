@@ -0,0 +1,66 @@
+"""
+Background filter evaluation.
+Runs compiled column predicates over column snapshots in the global
+QThreadPool and reports the visible rows back to the GUI thread.
+"""
+
+from typing import Callable, List, Sequence, Tuple
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+# (text getter over a column snapshot, predicate)
+ScanFilter = Tuple[Callable[[int], str], Callable[[str], bool]]
+
+
+class FilterWorkerSignals(QObject):
+    """Signals of a FilterWorker (delivered queued to the GUI thread)"""
+
+    progress = pyqtSignal(int, int, int)  # generation, done, total
+    finished = pyqtSignal(int, object)  # generation, rows (None if cancelled)
+
+
+class FilterWorker(QRunnable):
+    """
+    Evaluates filters for a candidate row set in a worker thread.
+
+    Only thread-safe snapshots are touched, never Qt items or models.
+    cancel() stops the evaluation at the next chunk boundary.
+    """
+
+    CHUNK_SIZE = 16384
+
+    def __init__(
+        self,
+        generation: int,
+        rows: Sequence[int],
+        filters: List[ScanFilter],
+    ):
+        super().__init__()
+        self.setAutoDelete(False)  # Owned by the table until finished
+        self.generation = generation
+        self.signals = FilterWorkerSignals()
+        self._rows = rows
+        self._filters = filters
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        rows = self._rows
+        # Progress: each filter pass counts as len(initial rows) steps
+        step = len(rows)
+        total = step * len(self._filters) or 1
+
+        for pass_idx, (get_text, matches) in enumerate(self._filters):
+            kept: List[int] = []
+            for start in range(0, len(rows), self.CHUNK_SIZE):
+                if self._cancelled:
+                    self.signals.finished.emit(self.generation, None)
+                    return
+                chunk = rows[start : start + self.CHUNK_SIZE]
+                kept.extend(row for row in chunk if matches(get_text(row)))
+                done = pass_idx * step + (start + len(chunk)) * step // len(rows)
+                self.signals.progress.emit(self.generation, done, total)
+            rows = kept
+
+        self.signals.finished.emit(self.generation, list(rows))
@@ -2,13 +2,25 @@
 Excel-like filterable QHeaderView.
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from PyQt6.QtWidgets import QHeaderView, QWidget
-from PyQt6.QtCore import Qt, pyqtSignal, QRect, QPoint
-from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QMouseEvent
+from PyQt6.QtCore import Qt, pyqtSignal, QRect, QPoint, QSize
+from PyQt6.QtGui import (
+    QPainter,
+    QColor,
+    QPen,
+    QFont,
+    QFontMetrics,
+    QMouseEvent,
+    QPixmap,
+)
 import qtawesome as qta
 
-from .theme import COLORS, FONT_FAMILY_QT, ICONS
+from . import theme
+from .theme import COLORS, ICONS, theme_generation
+
+# (icon name, color, size, device pixel ratio) -> pixmap, shared by all headers
+_ICON_PIXMAPS: Dict[Tuple[str, str, int, float], QPixmap] = {}
 
 
 class FilterableHeaderView(QHeaderView):
@@ -22,6 +34,7 @@ class FilterableHeaderView(QHeaderView):
 
     Clicks:
     - Left Click on Section: Sort
+    - Shift + Left Click on Section: Add secondary sort column
     - Click on Filter Icon: Open FilterPopup
     """
 
@@ -44,6 +57,15 @@ class FilterableHeaderView(QHeaderView):
         self._filterable_columns: Dict[int, bool] = {}  # section_idx -> filterable
         self._active_filters: Dict[int, bool] = {}  # section_idx -> has_active_filter
 
+        # Sort state (multi-column)
+        self._sort_orders: Dict[int, Qt.SortOrder] = {}  # section -> order
+        self._sort_priorities: Dict[int, int] = {}  # section -> 1-based priority
+
+        # Render cache (see _render_cache)
+        self._render_generation = -1
+        # section -> (title, width, elided title)
+        self._elided_titles: Dict[int, Tuple[str, int, str]] = {}
+
         # Hover state
         self._hover_section = -1
         self._hover_on_filter_icon = False
@@ -83,6 +105,21 @@ class FilterableHeaderView(QHeaderView):
         self._active_filters.clear()
         self.viewport().update()
 
+    def set_sort_columns(self, sort_columns: List[Tuple[int, Qt.SortOrder]]):
+        """Set sorted sections, most significant first"""
+        self._sort_orders = dict(sort_columns)
+        # Priority numbers only mean something with several sort columns
+        self._sort_priorities = (
+            {section: i + 1 for i, (section, _) in enumerate(sort_columns)}
+            if len(sort_columns) > 1
+            else {}
+        )
+        if sort_columns:
+            self.setSortIndicator(*sort_columns[0])
+        else:
+            self.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.viewport().update()
+
     def _get_filter_icon_rect(self, rect: QRect) -> QRect:
         """Calculate filter icon rect within the section rect"""
         # Icon on the right
@@ -107,17 +144,70 @@ class FilterableHeaderView(QHeaderView):
         section_rect = QRect(x, 0, width, height)
         return self._get_filter_icon_rect(section_rect)
 
+    def _render_cache(self):
+        """Fonts, colors and pens used for painting (rebuilt on theme change)"""
+        generation = theme_generation()
+        if generation == self._render_generation:
+            return
+        self._render_generation = generation
+        _ICON_PIXMAPS.clear()
+
+        self._colors = {
+            name: QColor(COLORS[name])
+            for name in (
+                "bg_hover",
+                "bg_secondary",
+                "bg_active",
+                "border",
+                "text_primary",
+                "text_secondary",
+                "primary",
+            )
+        }
+        self._border_pen = QPen(self._colors["border"], 1)
+
+        self._title_font = QFont(theme.FONT_FAMILY_QT, 11)
+        self._title_font.setWeight(QFont.Weight.DemiBold)
+        self._title_metrics = QFontMetrics(self._title_font)
+        self._glyph_font = QFont(theme.FONT_FAMILY_QT, 9)
+        self._priority_font = QFont(theme.FONT_FAMILY_QT, 7)
+        self._elided_titles.clear()
+
+    def _icon_pixmap(self, icon_name: str, color: str, size: int) -> QPixmap:
+        """Pre-rendered icon (shared by all headers)"""
+        dpr = self.devicePixelRatioF()
+        key = (icon_name, color, size, dpr)
+        pixmap = _ICON_PIXMAPS.get(key)
+        if pixmap is None:
+            pixmap = qta.icon(icon_name, color=color).pixmap(QSize(size, size), dpr)
+            _ICON_PIXMAPS[key] = pixmap
+        return pixmap
+
+    def _elided_title(self, section: int, text: str, width: int) -> str:
+        """Title elided to width (cached per section until text/width change)"""
+        cached = self._elided_titles.get(section)
+        if cached is not None and cached[0] == text and cached[1] == width:
+            return cached[2]
+        elided = self._title_metrics.elidedText(
+            text, Qt.TextElideMode.ElideRight, width
+        )
+        self._elided_titles[section] = (text, width, elided)
+        return elided
+
     def paintSection(self, painter: QPainter, rect: QRect, logicalIndex: int):
         """Paint header section"""
+        self._render_cache()
+        colors = self._colors
         painter.save()
 
         # Background
         is_hover = logicalIndex == self._hover_section
-        bg_color = COLORS["bg_hover"] if is_hover else COLORS["bg_secondary"]
-        painter.fillRect(rect, QColor(bg_color))
+        painter.fillRect(
+            rect, colors["bg_hover"] if is_hover else colors["bg_secondary"]
+        )
 
         # Bottom Border
-        painter.setPen(QPen(QColor(COLORS["border"]), 1))
+        painter.setPen(self._border_pen)
         painter.drawLine(rect.bottomLeft(), rect.bottomRight())
 
         # Right Border (Separator)
@@ -128,10 +218,8 @@ class FilterableHeaderView(QHeaderView):
             logicalIndex, Qt.Orientation.Horizontal, Qt.ItemDataRole.DisplayRole
         )
         if text:
-            painter.setPen(QColor(COLORS["text_primary"]))
-            font = QFont(FONT_FAMILY_QT, 11)
-            font.setWeight(QFont.Weight.DemiBold)
-            painter.setFont(font)
+            painter.setPen(colors["text_primary"])
+            painter.setFont(self._title_font)
 
             # Adjust text rect to avoid overlap with filter icon
             text_rect = rect.adjusted(
@@ -147,25 +235,37 @@ class FilterableHeaderView(QHeaderView):
             painter.drawText(
                 text_rect,
                 Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-                str(text),
+                self._elided_title(logicalIndex, str(text), text_rect.width()),
             )
 
         # Sort Indicator - Left of filter icon
-        sort_indicator = self.sortIndicatorSection()
-        if sort_indicator == logicalIndex:
-            sort_order = self.sortIndicatorOrder()
+        sort_order = self._sort_orders.get(logicalIndex)
+        if sort_order is not None:
             # Use icons from theme
             icon_name = (
                 ICONS["sort_up"]
                 if sort_order == Qt.SortOrder.AscendingOrder
                 else ICONS["sort_down"]
             )
-            icon = qta.icon(icon_name, color=COLORS["primary"])
-
             icon_size = 16
             icon_x = rect.right() - self.FILTER_ICON_WIDTH - icon_size - 8
             icon_y = rect.top() + (rect.height() - icon_size) // 2
-            icon.paint(painter, QRect(icon_x, icon_y, icon_size, icon_size))
+            painter.drawPixmap(
+                icon_x,
+                icon_y,
+                self._icon_pixmap(icon_name, COLORS["primary"], icon_size),
+            )
+
+            # Sort priority (multi-column sort)
+            priority = self._sort_priorities.get(logicalIndex)
+            if priority:
+                painter.setPen(colors["primary"])
+                painter.setFont(self._priority_font)
+                painter.drawText(
+                    QRect(icon_x + icon_size - 4, icon_y, 10, icon_size),
+                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom,
+                    str(priority),
+                )
 
         # Filter Icon
         is_filterable = self.is_column_filterable(logicalIndex)
@@ -176,19 +276,17 @@ class FilterableHeaderView(QHeaderView):
 
     def _draw_filter_icon(self, painter: QPainter, rect: QRect, section: int):
         """Draw the filter icon"""
+        colors = self._colors
         icon_rect = self._get_filter_icon_rect(rect)
 
         # Hover background
         is_icon_hover = section == self._hover_section and self._hover_on_filter_icon
         if is_icon_hover:
-            painter.fillRect(
-                icon_rect.adjusted(2, 4, -2, -4), QColor(COLORS["bg_active"])
-            )
+            painter.fillRect(icon_rect.adjusted(2, 4, -2, -4), colors["bg_active"])
 
         # Filter Icon Symbol (▼) or Generic Icon
-        painter.setPen(QColor(COLORS["text_secondary"]))
-        font = QFont(FONT_FAMILY_QT, 9)
-        painter.setFont(font)
+        painter.setPen(colors["text_secondary"])
+        painter.setFont(self._glyph_font)
         painter.drawText(
             icon_rect,
             Qt.AlignmentFlag.AlignCenter,
@@ -198,23 +296,22 @@ class FilterableHeaderView(QHeaderView):
         # Active Filter Indicator (Dot)
         if self.is_filter_active(section):
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(COLORS["primary"]))
+            painter.setBrush(colors["primary"])
             # Small circle
             center = icon_rect.center()
             painter.drawEllipse(center.x() + 5, center.y() - 6, 6, 6)
 
     def _get_section_at(self, pos: QPoint) -> int:
-        """Get logical index at position manually"""
-        for logical_idx in range(self.count()):
-            if self.isSectionHidden(logical_idx):
-                continue
-
-            x = self.sectionViewportPosition(logical_idx)
-            w = self.sectionSize(logical_idx)
+        """Get logical index at position (-1 if none)"""
+        # Visual index lookup in the header's section spans, no per-section loop
+        return self.logicalIndexAt(pos)
 
-            if x <= pos.x() < x + w:
-                return logical_idx
-        return -1
+    def _update_hover_sections(self, old_section: int, new_section: int):
+        """Repaint only the sections whose hover state changed"""
+        if old_section >= 0:
+            self.updateSection(old_section)
+        if new_section >= 0 and new_section != old_section:
+            self.updateSection(new_section)
 
     def mouseMoveEvent(self, event: QMouseEvent):
         """Handle mouse move for hover effects"""
@@ -238,7 +335,7 @@ class FilterableHeaderView(QHeaderView):
             old_hover != self._hover_section
             or old_icon_hover != self._hover_on_filter_icon
         ):
-            self.viewport().update()
+            self._update_hover_sections(old_hover, self._hover_section)
 
         super().mouseMoveEvent(event)
 
@@ -264,9 +361,10 @@ class FilterableHeaderView(QHeaderView):
 
     def leaveEvent(self, event):
         """Reset hover state on leave"""
+        old_hover = self._hover_section
         self._hover_section = -1
         self._hover_on_filter_icon = False
-        self.viewport().update()
+        self._update_hover_sections(old_hover, -1)
         super().leaveEvent(event)
 
     def sizeHint(self):
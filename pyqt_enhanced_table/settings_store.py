@@ -0,0 +1,141 @@
+"""
+Settings stores for table persistence.
+Each table keeps one settings record per (table_id, user_id) with the keys
+"header_state", "columns", "sort" and "filters".
+"""
+
+import base64
+import copy
+import json
+import sqlite3
+from typing import Any, Dict, Tuple
+from PyQt6.QtCore import QByteArray, QSettings
+
+SETTINGS_KEYS = ("header_state", "columns", "sort", "filters")
+
+
+class SettingsStore:
+    """
+    Settings store interface.
+
+    - load(table_id, user_id): Whole settings record of a table (missing keys
+      are simply absent)
+    - save(table_id, user_id, values): Update the given keys of the record
+    """
+
+    def load(self, table_id: str, user_id: int) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def save(self, table_id: str, user_id: int, values: Dict[str, Any]):
+        raise NotImplementedError
+
+
+class QSettingsStore(SettingsStore):
+    """QSettings backend (keys: table_{table_id}_{user_id}_{key})"""
+
+    def _key(self, table_id: str, user_id: int, key: str) -> str:
+        return f"table_{table_id}_{user_id}_{key}"
+
+    def load(self, table_id: str, user_id: int) -> Dict[str, Any]:
+        settings = QSettings()
+        record = {}
+        for key in SETTINGS_KEYS:
+            settings_key = self._key(table_id, user_id, key)
+            if settings.contains(settings_key):
+                record[key] = settings.value(settings_key)
+        return record
+
+    def save(self, table_id: str, user_id: int, values: Dict[str, Any]):
+        settings = QSettings()
+        for key, value in values.items():
+            settings.setValue(self._key(table_id, user_id, key), value)
+
+
+class MemorySettingsStore(SettingsStore):
+    """In-memory backend (tests, throwaway sessions)"""
+
+    def __init__(self):
+        self._records: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+    def load(self, table_id: str, user_id: int) -> Dict[str, Any]:
+        return copy.deepcopy(self._records.get((table_id, user_id), {}))
+
+    def save(self, table_id: str, user_id: int, values: Dict[str, Any]):
+        record = self._records.setdefault((table_id, user_id), {})
+        record.update(copy.deepcopy(values))
+
+
+class SQLiteSettingsStore(SettingsStore):
+    """
+    SQLite backend: a single file with one JSON row per (table_id, user_id).
+    Loading a table reads one row instead of one key per setting.
+    """
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS table_settings (
+                table_id TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (table_id, user_id)
+            )
+            """
+        )
+        self._conn.commit()
+        self._records: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+    def _record(self, table_id: str, user_id: int) -> Dict[str, Any]:
+        record = self._records.get((table_id, user_id))
+        if record is None:
+            row = self._conn.execute(
+                "SELECT data FROM table_settings WHERE table_id = ? AND user_id = ?",
+                (table_id, user_id),
+            ).fetchone()
+            record = json.loads(row[0], object_hook=_decode_value) if row else {}
+            self._records[(table_id, user_id)] = record
+        return record
+
+    def load(self, table_id: str, user_id: int) -> Dict[str, Any]:
+        return copy.deepcopy(self._record(table_id, user_id))
+
+    def save(self, table_id: str, user_id: int, values: Dict[str, Any]):
+        record = self._record(table_id, user_id)
+        record.update(copy.deepcopy(values))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO table_settings (table_id, user_id, data) "
+            "VALUES (?, ?, ?)",
+            (table_id, user_id, json.dumps(record, default=_encode_value)),
+        )
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+
+def _encode_value(value):
+    """JSON encoding of non JSON values (header state)"""
+    if isinstance(value, (QByteArray, bytes)):
+        return {"__bytes__": base64.b64encode(bytes(value)).decode("ascii")}
+    raise TypeError(f"Cannot store {type(value).__name__} in settings")
+
+
+def _decode_value(obj: dict):
+    if "__bytes__" in obj and len(obj) == 1:
+        return QByteArray(base64.b64decode(obj["__bytes__"]))
+    return obj
+
+
+_default_store: SettingsStore = QSettingsStore()
+
+
+def default_settings_store() -> SettingsStore:
+    """Store used by tables created without settings_store"""
+    return _default_store
+
+
+def set_default_settings_store(store: SettingsStore):
+    """Set the store used by tables created without settings_store"""
+    global _default_store
+    _default_store = store
@@ -0,0 +1,101 @@
+"""
+Precomputed column sort keys.
+Sorting computes one key per row up front and argsorts them, instead of
+letting Qt call a Python comparison O(N log N) times.
+"""
+
+import math
+from array import array
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+
+# Key of empty numeric cells: sorts before every number (empty < non-empty)
+EMPTY_NUMBER = -math.inf
+
+
+def numeric_sort_keys(values: Iterable[Optional[float]]) -> array:
+    """Keys of a numeric column (None / NaN are empty cells)"""
+    return array("d", [EMPTY_NUMBER if v is None or v != v else v for v in values])
+
+
+def text_sort_keys(texts: Iterable[str]) -> List[str]:
+    """Case-insensitive keys of a text column (empty text sorts first)"""
+    return [text.casefold() for text in texts]
+
+
+def argsort(keys: Sequence, descending: bool = False) -> List[int]:
+    """
+    Stable row permutation ordering keys: perm[new_row] = old_row.
+    Equal keys keep their current order in both directions.
+    """
+    return sorted(range(len(keys)), key=keys.__getitem__, reverse=descending)
+
+
+def descending_keys(keys: Sequence) -> Sequence:
+    """Keys that order a column descending when sorted ascending"""
+    if isinstance(keys, array):
+        return array(keys.typecode, [-key for key in keys])
+    ranks = {key: rank for rank, key in enumerate(sorted(set(keys)))}
+    return [-ranks[key] for key in keys]
+
+
+def composite_argsort(columns: List[Tuple[Sequence, bool]]) -> List[int]:
+    """
+    Stable row permutation for several key columns, most significant first.
+    Each column is (keys, descending); rows are sorted once on key tuples.
+    """
+    if len(columns) == 1:
+        keys, descending = columns[0]
+        return argsort(keys, descending)
+
+    key_columns = [
+        descending_keys(keys) if descending else keys for keys, descending in columns
+    ]
+    return argsort(list(zip(*key_columns)))
+
+
+def permute(keys: Sequence, perm: Sequence[int]) -> Sequence:
+    """Reorder cached keys along with their rows"""
+    reordered = [keys[row] for row in perm]
+    if isinstance(keys, array):
+        return array(keys.typecode, reordered)
+    return reordered
+
+
+def sorted_position(
+    columns: List[Tuple[Sequence, bool]], row: int, skip: Set[int] = frozenset()
+) -> int:
+    """
+    Position a row belongs at when the other rows, apart from those in skip
+    (rows still to be placed), are sorted by columns ((keys, descending),
+    most significant first; ties in row order). Returns the row's index
+    after moving it there (row itself if in place).
+    """
+
+    def less(a: int, b: int) -> bool:
+        for keys, descending in columns:
+            key_a, key_b = keys[a], keys[b]
+            if key_a != key_b:
+                return key_a > key_b if descending else key_a < key_b
+        return a < b
+
+    count = len(columns[0][0])
+    before, after = row - 1, row + 1
+    if (before < 0 or before not in skip and less(before, row)) and (
+        after == count or after not in skip and less(row, after)
+    ):
+        return row
+
+    # Binary search over the other rows (positions past row shift up by one)
+    lo, hi = 0, count - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        probe = mid
+        while probe < hi and (probe if probe < row else probe + 1) in skip:
+            probe += 1
+        if probe == hi:
+            hi = mid  # Only skipped rows from mid on
+        elif less(probe if probe < row else probe + 1, row):
+            lo = probe + 1
+        else:
+            hi = probe
+    return lo
@@ -15,7 +15,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import pyqtSignal, Qt
 import qtawesome as qta
 
-from .theme import COLORS, ICONS
+from .theme import COLORS, ICONS, ensure_theme
 
 
 class MiniStat(QFrame):
@@ -35,29 +35,7 @@ class MiniStat(QFrame):
         # Style
         self.setFrameShape(QFrame.Shape.StyledPanel)
         self.setFrameShadow(QFrame.Shadow.Raised)
-        self.setStyleSheet(
-            f"""
-            MiniStat {{
-                background-color: {COLORS['bg_secondary']};
-                border: 1px solid {COLORS['bg_hover']};
-                border-radius: 4px;
-            }}
-            QLabel {{
-                border: none;
-                background: transparent;
-            }}
-            .mini-stat-title {{
-                color: {COLORS['text_secondary']};
-                font-size: 11px;
-                font-weight: 500;
-            }}
-            .mini-stat-value {{
-                color: {COLORS['text_primary']};
-                font-size: 12px;
-                font-weight: bold;
-            }}
-        """
-        )
+        ensure_theme(self)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(6, 0, 8, 0)
@@ -108,61 +86,8 @@ class TableFooter(QWidget):
         """Setup UI"""
         self.setProperty("class", "table-footer")
 
-        # General Footer Style
-        self.setStyleSheet(
-            f"""
-            .table-footer {{
-                background-color: {COLORS['bg_primary']};
-                border-top: 1px solid #333333;
-            }}
-            .footer-label, .pagination-label {{
-                color: {COLORS['text_secondary']};
-                font-size: 12px;
-            }}
-            QComboBox {{
-                background-color: transparent;
-                border: 1px solid transparent;
-                border-radius: 4px;
-                color: {COLORS['text_secondary']};
-                padding: 0px;
-                padding-left: 4px;
-                width: 45px;
-                min-width: 45px;
-                max-width: 45px;
-                height: 24px;
-                min-height: 24px;
-                max-height: 24px;
-            }}
-            QComboBox:hover {{
-                background-color: {COLORS['bg_hover']};
-                border: 1px solid {COLORS['active_border'] if 'active_border' in COLORS else '#505050'};
-                color: {COLORS['text_primary']};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 14px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 3px solid transparent;
-                border-right: 3px solid transparent;
-                border-top: 3px solid #909090;
-                margin-right: 4px;
-            }}
-            QPushButton {{
-                background-color: transparent;
-                border: 1px solid transparent;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['bg_hover']};
-                border: 1px solid {COLORS['active_border'] if 'active_border' in COLORS else '#505050'};
-            }}
-            QPushButton:disabled {{
-                opacity: 0.3;
-            }}
-        """
-        )
+        # General Footer Style (theme stylesheet)
+        ensure_theme(self)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
@@ -173,6 +98,26 @@ class TableFooter(QWidget):
         self._stats_container.setSpacing(8)
         layout.addLayout(self._stats_container)
 
+        # Busy indicator (async filtering)
+        self._busy_btn = QPushButton()
+        self._busy_btn.setFlat(True)
+        self._busy_btn.setFixedSize(24, 24)
+        self._busy_btn.setIcon(
+            qta.icon(
+                ICONS["spinner"],
+                color=COLORS["text_secondary"],
+                animation=qta.Spin(self._busy_btn),
+            )
+        )
+        self._busy_btn.setToolTip("Filtering...")
+        self._busy_btn.hide()
+        layout.addWidget(self._busy_btn)
+
+        self._progress_label = QLabel()
+        self._progress_label.setProperty("class", "footer-label")
+        self._progress_label.hide()
+        layout.addWidget(self._progress_label)
+
         # Spacer
         layout.addStretch()
 
@@ -181,16 +126,6 @@ class TableFooter(QWidget):
         self._controls_frame.setProperty("class", "footer-controls")
         self._controls_frame.setFixedHeight(32)
 
-        self._controls_frame.setStyleSheet(
-            f"""
-            .footer-controls {{
-                background-color: {COLORS['bg_secondary']};
-                border: 1px solid {COLORS['bg_hover']};
-                border-radius: 4px;
-            }}
-        """
-        )
-
         controls_layout = QHBoxLayout(self._controls_frame)
         controls_layout.setContentsMargins(4, 0, 4, 0)
         controls_layout.setSpacing(8)
@@ -211,9 +146,7 @@ class TableFooter(QWidget):
         line = QFrame()
         line.setFrameShape(QFrame.Shape.VLine)
         line.setFrameShadow(QFrame.Shadow.Sunken)
-        line.setStyleSheet(
-            f"background-color: {COLORS['bg_hover']}; border: none; width: 1px;"
-        )
+        line.setObjectName("FooterSeparator")
         line.setFixedHeight(16)
         controls_layout.addWidget(line)
 
@@ -285,6 +218,20 @@ class TableFooter(QWidget):
         self._prev_btn.setEnabled(current > 1)
         self._next_btn.setEnabled(current < total_pages)
 
+    def set_busy(self, busy: bool):
+        """Show/hide busy indicator (connect to filter_busy / load_busy)"""
+        self._busy_btn.setVisible(busy)
+        self._progress_label.setVisible(busy)
+        if not busy:
+            self._progress_label.clear()
+
+    def set_progress(self, done: int, total: int):
+        """Update busy progress (connect to filter_progress / load_progress)"""
+        if total:
+            self._progress_label.setText(f"{done * 100 // total}%")
+        else:
+            self._progress_label.setText(str(done))  # Total unknown
+
     def set_page_size(self, size: int):
         """Set page size"""
         self._page_size_combo.setCurrentText(str(size))
@@ -0,0 +1,1446 @@
+"""
+Shared behavior for enhanced tables.
+Filtering, column management, persistence and row identity helpers used by
+both EnhancedTableWidget (item based) and EnhancedTableView (model based).
+"""
+
+import copy
+from array import array
+from bisect import bisect_left
+from typing import (
+    Callable,
+    Iterable,
+    List,
+    Dict,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+from PyQt6.QtWidgets import (
+    QHeaderView,
+    QAbstractItemView,
+    QWidget,
+    QHBoxLayout,
+    QApplication,
+)
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QEvent,
+    QMimeData,
+    QPoint,
+    QThreadPool,
+    QTimer,
+)
+from PyQt6.QtGui import QKeySequence
+
+from .column_chooser import ColumnChooser
+from .copy_worker import CopyBlock, CopyWorker, format_selection
+from .filterable_header import FilterableHeaderView
+from .filter_popup import FilterPopup
+from .filter_engine import ColumnFilter, compile_filters, match_text
+from .filter_worker import FilterWorker
+from .settings_store import SettingsStore, default_settings_store
+from .sort_keys import EMPTY_NUMBER, composite_argsort, permute, sorted_position
+from .value_index import ColumnValueIndex
+
+if TYPE_CHECKING:
+    from .action_delegate import ActionButtonsDelegate
+    from .active_filters_bar import ActiveFiltersBar
+    from .enhanced_table import ColumnConfig
+
+
+def _flipped(order: Qt.SortOrder) -> Qt.SortOrder:
+    if order == Qt.SortOrder.AscendingOrder:
+        return Qt.SortOrder.DescendingOrder
+    return Qt.SortOrder.AscendingOrder
+
+
+class EnhancedTableMixin:
+    """
+    Table behavior shared by the enhanced table classes.
+
+    Subclasses combine this mixin with a QTableView based class and provide
+    the data access hooks:
+    - _source_row_count(): Number of data rows
+    - _cell_text(row, col_idx): Display text of a cell
+    - _row_id(row): Row ID of a view row (or None)
+    - _storage_row_id(row): Row ID of a data row (or None)
+    - _view_row(row): View row showing a data row (-1 if filtered out)
+    - _storage_row(row): Data row shown at a view row
+    - _show_rows(rows): Show only the given data rows (None shows all)
+    - _column_sort_keys(col_idx): Sort key of every data row of a column
+    - _cell_sort_key(row, col_idx, numeric): Sort key of one cell, matching
+      _column_sort_keys (None if it no longer fits a numeric column)
+    - _apply_row_order(perm): Reorder data rows (perm[new_row] = old_row)
+    - _update_storage_row(row, values): Set cells of a data row (col_idx -> value)
+    - _remove_storage_rows(rows): Remove data rows
+
+    and forward data changes to the _on_storage_* handlers so the
+    per-column value indexes and the row ID index stay current.
+    """
+
+    # Signals
+    row_double_clicked = pyqtSignal(int)  # Row ID
+    row_selected = pyqtSignal(int)  # Row ID
+    settings_changed = pyqtSignal()  # When settings change
+    filter_changed = pyqtSignal(dict)  # When active filters change
+    rows_filtered = pyqtSignal(int, int)  # Post-filter (visible, total)
+    filter_busy = pyqtSignal(bool)  # Async filter evaluation running
+    filter_progress = pyqtSignal(int, int)  # Async filter (done, total)
+    copy_busy = pyqtSignal(bool)  # Large clipboard copy running
+    copy_progress = pyqtSignal(int, int)  # Large copy (done rows, total rows)
+
+    # Async filtering is only used from this many candidate rows on
+    ASYNC_FILTER_MIN_ROWS = 50000
+
+    # Copies of this many cells or more are formatted in a worker thread
+    ASYNC_COPY_MIN_CELLS = 200000
+
+    # Settings (layout, sort, filters) are written this long after the last change
+    SETTINGS_FLUSH_DELAY_MS = 500
+
+    def _init_enhanced_table(
+        self,
+        table_id: str,
+        columns: List["ColumnConfig"],
+        user_id: int = 0,
+        settings_store: Optional[SettingsStore] = None,
+    ):
+        """Initialize shared state and build the table"""
+        self.table_id = table_id
+        self.user_id = user_id
+        self.columns = {col.key: col for col in columns}
+        self.column_order = [col.key for col in columns]
+        self._column_index = {key: i for i, key in enumerate(self.column_order)}
+
+        # Column layout (rebuilt after sections move or are hidden / shown)
+        self._column_chooser: Optional[ColumnChooser] = None  # Created on first use
+        self._visual_order: Optional[List[int]] = None  # visual -> logical
+        self._visual_indexes: Optional[List[int]] = None  # logical -> visual
+        self._visible_columns: Optional[List[str]] = None  # Keys in visual order
+        self._changing_columns = False  # Batch show/hide running
+
+        # Filtering
+        self._active_filters: Dict[str, dict] = {}
+        self._predefined_options: Dict[str, List[str]] = {}
+        self._filter_popup: Optional[FilterPopup] = None  # Created on first use
+        self._value_indexes: Dict[int, ColumnValueIndex] = {}  # col_idx -> index
+        self._visible_count: Optional[int] = None  # Last rows_filtered count
+
+        # Row identity (built on first lookup, kept current on row changes).
+        # Rows shifted by moves / removals keep their dict entry; lookups
+        # look for them up to _id_drift rows away in _row_ids.
+        self._id_rows: Optional[Dict[object, int]] = None  # row_id -> data row
+        self._row_ids: Optional[List[object]] = None  # data row -> row_id
+        self._id_drift = 0  # Max. rows a dict entry may be off by
+        self._ids_unique = True  # No row_id held by two rows
+
+        # Sorting
+        self._sort_keys: Dict[int, Sequence] = {}  # col_idx -> cached row keys
+        self._sort_columns: List[Tuple[str, Qt.SortOrder]] = []  # Sort stack
+
+        # Async filtering
+        self._async_filtering = False
+        self._filter_busy = False
+        self._filter_generation = 0
+        self._filter_jobs: Dict[int, FilterWorker] = {}  # generation -> worker
+
+        # Async clipboard copy
+        self._copy_busy = False
+        self._copy_generation = 0
+        self._copy_jobs: Dict[int, CopyWorker] = {}  # generation -> worker
+
+        # Write-behind settings
+        self._pending_settings = False
+        self._pending_filters = False
+        self._settings_store = settings_store or default_settings_store()
+        self._settings_record: Dict[str, object] = {}  # Last loaded/written values
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(self.SETTINGS_FLUSH_DELAY_MS)
+        self._settings_timer.timeout.connect(self.flush_settings)
+
+        # CSS class
+        self.setProperty("class", "enhanced-table")
+
+        self._load_settings()
+        self._setup_table()
+        self._setup_filterable_header()
+        self._apply_column_settings()
+        self._connect_signals()
+        self._load_filter_settings()
+
+    # --- Data access hooks ---
+
+    def _source_row_count(self) -> int:
+        raise NotImplementedError
+
+    def _cell_text(self, row: int, col_idx: int) -> str:
+        raise NotImplementedError
+
+    def _row_id(self, row: int):
+        raise NotImplementedError
+
+    def _storage_row_id(self, row: int):
+        raise NotImplementedError
+
+    def _view_row(self, row: int) -> int:
+        raise NotImplementedError
+
+    def _storage_row(self, row: int) -> int:
+        raise NotImplementedError
+
+    def _show_rows(self, rows: Optional[List[int]]):
+        raise NotImplementedError
+
+    def _column_sort_keys(self, col_idx: int) -> Sequence:
+        raise NotImplementedError
+
+    def _cell_sort_key(self, row: int, col_idx: int, numeric: bool):
+        raise NotImplementedError
+
+    def _apply_row_order(self, perm: List[int]):
+        raise NotImplementedError
+
+    def _update_storage_row(self, row: int, values: Dict[int, object]):
+        raise NotImplementedError
+
+    def _remove_storage_rows(self, rows: List[int]):
+        raise NotImplementedError
+
+    def set_filter_options(self, column_key: str, options: List[str]):
+        """Set predefined options for filter menu"""
+        self._predefined_options[column_key] = options
+
+    def get_logical_visible_columns(self) -> List[str]:
+        """Get visible columns in logical (original) order"""
+        return [key for key in self.column_order if self.columns[key].visible]
+
+    def _get_table_index(self, column_key: str) -> int:
+        """Get logical index of column in table (-1 if unknown)"""
+        return self._column_index.get(column_key, -1)
+
+    def _column_layout(self):
+        """Rebuild the visual order maps and the visible column list"""
+        header = self.horizontalHeader()
+        order = [header.logicalIndex(visual) for visual in range(header.count())]
+        indexes = [0] * len(order)
+        for visual, logical_idx in enumerate(order):
+            indexes[logical_idx] = visual
+        self._visual_order = order
+        self._visual_indexes = indexes
+        self._visible_columns = [
+            self.column_order[logical_idx]
+            for logical_idx in order
+            if not header.isSectionHidden(logical_idx)
+        ]
+
+    def _invalidate_column_layout(self):
+        self._visual_order = None
+        self._visual_indexes = None
+        self._visible_columns = None
+
+    def _visual_columns(self) -> List[int]:
+        """Logical indexes of all columns in visual order"""
+        if self._visual_order is None:
+            self._column_layout()
+        return self._visual_order
+
+    def _visual_index(self, logical_idx: int) -> int:
+        """Visual position of a logical column"""
+        if self._visual_indexes is None:
+            self._column_layout()
+        return self._visual_indexes[logical_idx]
+
+    def _setup_table(self):
+        """Basic table setup"""
+        self.setAlternatingRowColors(True)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectItems)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.verticalHeader().setVisible(True)
+        self.verticalHeader().setDefaultSectionSize(36)
+        self.setShowGrid(False)
+        self.setSortingEnabled(False)  # Using custom handler
+
+    def _hide_initial_columns(self):
+        """Hide columns configured (or saved) as hidden"""
+        self._set_column_visibility(
+            {key: self.columns[key].visible for key in self.column_order}, save=False
+        )
+
+    def _setup_filterable_header(self):
+        """Setup filterable header"""
+        self._filter_header = FilterableHeaderView(Qt.Orientation.Horizontal, self)
+        self.setHorizontalHeader(self._filter_header)
+
+        self._filter_header.setSectionsMovable(True)
+        self._filter_header.setStretchLastSection(False)
+        self._filter_header.sectionMoved.connect(self._on_section_moved)
+        self._filter_header.sectionResized.connect(self._on_section_resized)
+        self._filter_header.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self._filter_header.customContextMenuRequested.connect(self._show_column_menu)
+
+        # Filter signal
+        self._filter_header.filter_icon_clicked.connect(self._on_filter_icon_clicked)
+
+        # Set filterability
+        for logical_idx, key in enumerate(self.column_order):
+            col = self.columns[key]
+            self._filter_header.set_column_filterable(logical_idx, col.filterable)
+
+        self._update_sort_indicators()
+
+    def _connect_signals(self):
+        """Connect internal signals"""
+        self.doubleClicked.connect(self._on_double_click)
+        self.selectionModel().selectionChanged.connect(
+            lambda selected, deselected: self._on_selection_changed()
+        )
+        self._filter_header.sectionClicked.connect(self._on_header_clicked)
+
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_settings)
+
+    def closeEvent(self, event):
+        """Write pending settings before closing"""
+        self.flush_settings()
+        super().closeEvent(event)
+
+    def hideEvent(self, event):
+        """Write pending settings when hidden (embedded tables get no closeEvent)"""
+        self.flush_settings()
+        super().hideEvent(event)
+
+    def event(self, event):
+        # deleteLater(): last chance while the header still exists
+        if event.type() == QEvent.Type.DeferredDelete:
+            self.flush_settings()
+        return super().event(event)
+
+    def keyPressEvent(self, event):
+        """Copy shortcut (Ctrl+C)"""
+        if event.matches(QKeySequence.StandardKey.Copy):
+            self._copy_selection()
+        else:
+            super().keyPressEvent(event)
+
+    def _copy_selection(self):
+        """
+        Copy selected cells to clipboard as TSV (text/plain), CSV and HTML.
+        Hidden rows and columns are skipped; large copies run in a worker.
+        """
+        blocks, columns = self._copy_blocks()
+        if not blocks:
+            return
+
+        self._cancel_copy()
+        cell_count = sum(len(rows) for rows, _ in blocks) * len(columns)
+        if cell_count < self.ASYNC_COPY_MIN_CELLS:
+            cell_text = self._cell_text
+            getters = [
+                lambda row, col_idx=col_idx: cell_text(row, col_idx)
+                for col_idx in columns
+            ]
+            self._set_clipboard(format_selection(blocks, getters))
+            return
+
+        getters = [self._snapshot_column(col_idx) for col_idx in columns]
+        self._copy_generation += 1
+        worker = CopyWorker(self._copy_generation, blocks, getters)
+        worker.signals.progress.connect(self._on_copy_progress)
+        worker.signals.finished.connect(self._on_copy_finished)
+        self._copy_jobs[worker.generation] = worker
+
+        self._set_copy_busy(True)
+        QThreadPool.globalInstance().start(worker)
+
+    def _copy_blocks(self) -> Tuple[List[CopyBlock], List[int]]:
+        """
+        Read the selection ranges as row blocks sharing the same columns.
+        Returns (blocks of storage rows, copied columns in visual order).
+        """
+        ranges = [
+            (sel.top(), sel.bottom(), sel.left(), sel.right())
+            for sel in self.selectionModel().selection()
+        ]
+        if not ranges:
+            return [], []
+
+        column_set = set()
+        for _, _, left, right in ranges:
+            column_set.update(range(left, right + 1))
+        columns = sorted(
+            (col for col in column_set if not self.isColumnHidden(col)),
+            key=self._visual_index,
+        )
+        if not columns:
+            return [], []
+        positions = {col: pos for pos, col in enumerate(columns)}
+
+        # Split rows where a range starts or ends; within a segment every
+        # row is covered by the same ranges
+        bounds = sorted(
+            {top for top, _, _, _ in ranges}
+            | {bottom + 1 for _, bottom, _, _ in ranges}
+        )
+        segment_columns = [set() for _ in bounds[1:]]
+        for top, bottom, left, right in ranges:
+            range_columns = [
+                positions[col] for col in range(left, right + 1) if col in positions
+            ]
+            for segment in range(
+                bisect_left(bounds, top), bisect_left(bounds, bottom + 1)
+            ):
+                segment_columns[segment].update(range_columns)
+
+        blocks: List[CopyBlock] = []
+        last_selected: object = ()
+        for start, end, selected in zip(bounds, bounds[1:], segment_columns):
+            if not selected:
+                continue
+            if len(selected) == len(columns):
+                selected = None  # Every column
+
+            rows = [
+                self._storage_row(row)
+                for row in range(start, end)
+                if not self.isRowHidden(row)
+            ]
+            if not rows:
+                continue
+            if blocks and selected == last_selected:
+                blocks[-1][0].extend(rows)
+            else:
+                blocks.append((rows, selected))
+            last_selected = selected
+        return blocks, columns
+
+    def _set_clipboard(self, texts: Dict[str, str]):
+        mime = QMimeData()
+        for mime_type, text in texts.items():
+            if mime_type == "text/plain":
+                mime.setText(text)
+            elif mime_type == "text/html":
+                mime.setHtml(text)
+            else:
+                mime.setData(mime_type, text.encode("utf-8"))
+        QApplication.clipboard().setMimeData(mime)
+
+    def _cancel_copy(self):
+        """Cancel an in-flight copy (its result is dropped)"""
+        if not self._copy_jobs:
+            return
+        self._copy_generation += 1
+        for worker in self._copy_jobs.values():
+            worker.cancel()
+        self._set_copy_busy(False)
+
+    def _on_copy_progress(self, generation: int, done: int, total: int):
+        if generation == self._copy_generation:
+            self.copy_progress.emit(done, total)
+
+    def _on_copy_finished(self, generation: int, texts):
+        self._copy_jobs.pop(generation, None)
+        if generation == self._copy_generation:
+            self._set_copy_busy(False)
+            if texts is not None:
+                self._set_clipboard(texts)
+
+    def _set_copy_busy(self, busy: bool):
+        if busy != self._copy_busy:
+            self._copy_busy = busy
+            self.copy_busy.emit(busy)
+
+    def _on_header_clicked(self, logical_index: int):
+        """
+        Sort when header is clicked.
+        Shift+click adds the column as a further sort key (or flips its order).
+        """
+        if logical_index < 0 or logical_index >= len(self.column_order):
+            return
+
+        column_key = self.column_order[logical_index]
+        sort_columns = list(self._sort_columns)
+        sort_keys = [key for key, _ in sort_columns]
+        modifiers = QApplication.keyboardModifiers()
+
+        if modifiers & Qt.KeyboardModifier.ShiftModifier:
+            if column_key in sort_keys:
+                pos = sort_keys.index(column_key)
+                sort_columns[pos] = (column_key, _flipped(sort_columns[pos][1]))
+            else:
+                sort_columns.append((column_key, Qt.SortOrder.AscendingOrder))
+        else:
+            order = Qt.SortOrder.AscendingOrder
+            if sort_keys and sort_keys[0] == column_key:
+                order = _flipped(sort_columns[0][1])
+            sort_columns = [(column_key, order)]
+
+        self.sort_by_columns(
+            [(self._column_index[key], order) for key, order in sort_columns]
+        )
+        self._schedule_settings()
+
+    def sort_by_column(
+        self, col_idx: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder
+    ):
+        """Sort rows by a single column"""
+        self.sort_by_columns([(col_idx, order)])
+
+    def sort_by_columns(self, sort_columns: List[Tuple[int, Qt.SortOrder]]):
+        """
+        Sort rows by several columns, most significant first,
+        e.g. [(status_idx, Ascending), (price_idx, Descending)].
+        """
+        self._sort_columns = [
+            (self.column_order[col_idx], order)
+            for col_idx, order in sort_columns
+            if 0 <= col_idx < len(self.column_order)
+        ]
+        self._update_sort_indicators()
+        self._apply_sort()
+
+    def get_sort_columns(self) -> List[Tuple[str, Qt.SortOrder]]:
+        """Current sort stack as (column_key, order), most significant first"""
+        return list(self._sort_columns)
+
+    def _update_sort_indicators(self):
+        self._filter_header.set_sort_columns(
+            [
+                (self._column_index[key], order)
+                for key, order in self._sort_columns
+            ]
+        )
+
+    def _apply_sort(self):
+        """
+        Reorder rows by the sort stack.
+        Argsorts the cached column keys in one pass and applies the
+        permutation in one layout change.
+        """
+        columns = self._sort_key_columns()
+        if not columns:
+            return
+        perm = composite_argsort(columns)
+
+        cached = dict(self._sort_keys)
+        self._apply_row_order(perm)  # Storage reset drops the key cache
+        self._sort_keys = {
+            col: permute(col_keys, perm) for col, col_keys in cached.items()
+        }
+
+    def _sort_key_columns(self) -> List[Tuple[Sequence, bool]]:
+        """(keys, descending) of every column of the sort stack"""
+        return [
+            (
+                self._sort_column_keys(self._column_index[key]),
+                order == Qt.SortOrder.DescendingOrder,
+            )
+            for key, order in self._sort_columns
+        ]
+
+    def _sorted_row_position(self, row: int, skip: Set[int] = frozenset()) -> int:
+        """
+        Data row a changed row belongs at under the current sort (binary
+        search; rows in skip are changed rows not placed yet)
+        """
+        columns = self._sort_key_columns()
+        if not columns:
+            return row
+        return sorted_position(columns, row, skip)
+
+    def _place_sorted_rows(
+        self, rows: List[int], move_row: Callable[[int, int], None]
+    ) -> List[Tuple[int, int]]:
+        """
+        Move changed data rows to their sorted positions one at a time with
+        move_row(source, target); returns the (source, target) moves made.
+        """
+        rows = list(rows)  # Current positions, shifted as rows move
+        moves = []
+        for i, source in enumerate(rows):
+            target = self._sorted_row_position(source, set(rows[i + 1 :]))
+            if target == source:
+                continue
+            move_row(source, target)
+            moves.append((source, target))
+            for j in range(i + 1, len(rows)):
+                row = rows[j]
+                if source < row <= target:
+                    rows[j] = row - 1
+                elif target <= row < source:
+                    rows[j] = row + 1
+            rows[i] = target
+        return moves
+
+    def _sort_column_keys(self, col_idx: int) -> Sequence:
+        """Sort keys of a column (cached until its cells change)"""
+        keys = self._sort_keys.get(col_idx)
+        if keys is None:
+            keys = self._column_sort_keys(col_idx)
+            self._sort_keys[col_idx] = keys
+        return keys
+
+    def _on_filter_icon_clicked(self, section: int, global_pos: QPoint):
+        """Show filter popup"""
+        if section < 0 or section >= len(self.column_order):
+            return
+
+        column_key = self.column_order[section]
+        col_config = self.columns[column_key]
+
+        unique_values = self.get_unique_values(column_key)
+        value_counts = self.get_value_counts(column_key)
+        current_filter = self._active_filters.get(column_key)
+
+        popup = self._filter_popup
+        if popup is None:
+            # One popup per table, retargeted on each open
+            popup = FilterPopup(column_key, col_config.title, parent=self)
+            popup.filter_applied.connect(self._on_filter_applied)
+            popup.filter_cleared.connect(
+                lambda: self._on_filter_cleared(self._filter_popup.column_key)
+            )
+            self._filter_popup = popup
+        popup.set_column(
+            column_key,
+            col_config.title,
+            unique_values,
+            current_filter,
+            value_counts,
+        )
+
+        popup.move(global_pos)
+
+        # Boundary check
+        screen = self.screen()
+        if screen:
+            screen_width = screen.geometry().width()
+            popup_width = popup.width()
+            if global_pos.x() + popup_width > screen_width:
+                new_x = global_pos.x() - popup_width + 20
+                popup.move(new_x, global_pos.y())
+
+        popup.show()
+
+    def _on_filter_applied(self, filter_data: dict):
+        """Filter applied callback"""
+        column_key = filter_data.get("column_key")
+        if not column_key:
+            return
+
+        if filter_data.get("all_selected") and "text_filter" not in filter_data:
+            self._on_filter_cleared(column_key)
+            return
+
+        self._active_filters[column_key] = filter_data
+
+        logical_idx = self._get_table_index(column_key)
+        if logical_idx != -1:
+            self._filter_header.set_filter_active(logical_idx, True)
+
+        self._apply_filters()
+        self._schedule_filter_settings()
+        self.filter_changed.emit(self._active_filters)
+
+    def _on_filter_cleared(self, column_key: str):
+        """Filter cleared callback"""
+        if column_key in self._active_filters:
+            del self._active_filters[column_key]
+
+        logical_idx = self._get_table_index(column_key)
+        if logical_idx != -1:
+            self._filter_header.set_filter_active(logical_idx, False)
+
+        self._apply_filters()
+        self._schedule_filter_settings()
+        self.filter_changed.emit(self._active_filters)
+
+    def _apply_filters(self):
+        """Apply all active filters"""
+        row_count = self._source_row_count()
+        if getattr(self, "server_side_mode", False):
+            self.rows_filtered.emit(row_count, row_count)
+            return
+
+        self._cancel_async_filter()
+        if not self._active_filters:
+            self._finish_filter(None)
+            return
+
+        candidates, scan_filters = self._plan_filters()
+        visible_rows = range(row_count) if candidates is None else candidates
+
+        if (
+            scan_filters
+            and self._async_filtering
+            and len(visible_rows) >= self.ASYNC_FILTER_MIN_ROWS
+        ):
+            self._start_async_filter(visible_rows, scan_filters)
+            return
+
+        # Remaining (text) filters: narrow the candidates one column at a time
+        cell_text = self._cell_text
+        for col_idx, matches in scan_filters:
+            visible_rows = [
+                row for row in visible_rows if matches(cell_text(row, col_idx))
+            ]
+        self._finish_filter(list(visible_rows))
+
+    def _plan_filters(
+        self,
+    ) -> Tuple[Optional[List[int]], List[Tuple[int, Callable[[str], bool]]]]:
+        """
+        Resolve value filters through the column indexes.
+        Returns (candidate rows or None for all rows, predicates still to scan).
+        """
+        # Value filters: intersect posting lists of the column indexes
+        candidates: Optional[List[int]] = None
+        scan_filters = []
+        for col_idx, column_filter in self._compiled_filters():
+            index = None
+            if column_filter.allowed is not None:
+                index = self._value_index(col_idx)
+            if index is None:
+                scan_filters.append((col_idx, column_filter.matches))
+                continue
+
+            rows = index.rows_for(column_filter.allowed)
+            if candidates is None:
+                candidates = rows
+            else:
+                if len(rows) > len(candidates):
+                    rows, candidates = candidates, rows
+                keep = set(candidates)
+                candidates = [row for row in rows if row in keep]
+
+            if column_filter.text_matches is not None:
+                scan_filters.append((col_idx, column_filter.text_matches))
+
+        return candidates, scan_filters
+
+    def _finish_filter(self, visible_rows: Optional[List[int]]):
+        """Swap in the whole visible-row set at once (None shows all)"""
+        row_count = self._source_row_count()
+        self._show_rows(visible_rows)
+        self._set_filter_busy(False)
+        self._visible_count = row_count if visible_rows is None else len(visible_rows)
+        self.rows_filtered.emit(self._visible_count, row_count)
+
+    def set_async_filtering(self, enabled: bool):
+        """
+        Evaluate text filters in a worker thread for large tables.
+        The GUI stays responsive; filter_busy / filter_progress report the
+        evaluation and rows_filtered fires when the result is shown.
+        """
+        self._async_filtering = enabled
+        if not enabled:
+            self._cancel_async_filter()
+
+    def _snapshot_column(self, col_idx: int) -> Callable[[int], str]:
+        """Thread-safe text getter over a copy of a column"""
+        cell_text = self._cell_text
+        texts = [cell_text(row, col_idx) for row in range(self._source_row_count())]
+        return texts.__getitem__
+
+    def _start_async_filter(
+        self, rows, scan_filters: List[Tuple[int, Callable[[str], bool]]]
+    ):
+        filters = [
+            (self._snapshot_column(col_idx), matches)
+            for col_idx, matches in scan_filters
+        ]
+        self._filter_generation += 1
+        worker = FilterWorker(self._filter_generation, rows, filters)
+        worker.signals.progress.connect(self._on_async_filter_progress)
+        worker.signals.finished.connect(self._on_async_filter_finished)
+        self._filter_jobs[worker.generation] = worker
+
+        self._set_filter_busy(True)
+        QThreadPool.globalInstance().start(worker)
+
+    def _cancel_async_filter(self):
+        """Cancel in-flight evaluations (their results are dropped)"""
+        if not self._filter_jobs:
+            return
+        self._filter_generation += 1
+        for worker in self._filter_jobs.values():
+            worker.cancel()
+        self._set_filter_busy(False)
+
+    def _on_async_filter_progress(self, generation: int, done: int, total: int):
+        if generation == self._filter_generation:
+            self.filter_progress.emit(done, total)
+
+    def _on_async_filter_finished(self, generation: int, rows):
+        self._filter_jobs.pop(generation, None)
+        if generation == self._filter_generation and rows is not None:
+            self._finish_filter(rows)
+
+    def _set_filter_busy(self, busy: bool):
+        if busy != self._filter_busy:
+            self._filter_busy = busy
+            self.filter_busy.emit(busy)
+
+    def _compiled_filters(self) -> List[Tuple[int, ColumnFilter]]:
+        """Active filters as (column index, compiled filter) pairs"""
+        compiled = []
+        for column_filter in compile_filters(self._active_filters):
+            if column_filter.column_key not in self.columns:
+                continue
+            col_idx = self._get_table_index(column_filter.column_key)
+            if col_idx != -1:
+                compiled.append((col_idx, column_filter))
+        return compiled
+
+    def _value_index(self, col_idx: int) -> Optional[ColumnValueIndex]:
+        """Inverted value index of a filterable column (built on first use)"""
+        index = self._value_indexes.get(col_idx)
+        if index is None:
+            if not self.columns[self.column_order[col_idx]].filterable:
+                return None
+            index = ColumnValueIndex(
+                lambda row: self._cell_text(row, col_idx), self._source_row_count()
+            )
+            self._value_indexes[col_idx] = index
+        return index
+
+    def _on_storage_rows_inserted(self, first: int, count: int):
+        for col_idx in list(self._sort_keys):
+            self._insert_sort_keys(col_idx, first, count)
+        if self._visible_count is not None:
+            view_row = self._view_row
+            self._visible_count += sum(
+                view_row(row) != -1 for row in range(first, first + count)
+            )
+        for index in self._value_indexes.values():
+            index.rows_inserted(first, count)
+        if self._row_ids is not None and first == len(self._row_ids):
+            self._on_storage_ids_changed(first, first + count - 1)
+        else:
+            self._drop_id_index()
+        self._restart_async_filter()
+
+    def _on_storage_rows_removed(self, first: int, count: int):
+        end = first + count
+        for keys in self._sort_keys.values():
+            del keys[first:end]
+        self._visible_count = None
+        for index in self._value_indexes.values():
+            index.rows_removed(first, count)
+
+        row_ids = self._row_ids
+        if row_ids is not None:
+            removed = row_ids[first:end]
+            del row_ids[first:end]
+            if self._id_rows is not None and self._ids_unique:
+                for row_id in removed:
+                    self._id_rows.pop(row_id, None)
+                self._id_drift += count  # Following rows moved up
+            else:
+                self._id_rows = None  # Rebuilt from _row_ids on next lookup
+        self._restart_async_filter()
+
+    def _insert_sort_keys(self, col_idx: int, first: int, count: int):
+        """Make room for inserted rows in cached sort keys and fill it in"""
+        keys = self._sort_keys[col_idx]
+        if count * 8 > len(keys):
+            del self._sort_keys[col_idx]  # Cheaper to recompute on next sort
+            return
+        if isinstance(keys, array):
+            keys[first:first] = array(keys.typecode, [EMPTY_NUMBER]) * count
+        else:
+            keys[first:first] = [""] * count
+        self._patch_sort_keys(col_idx, first, first + count - 1)
+
+    def _on_storage_cells_changed(
+        self, first_row: int, last_row: int, first_col: int, last_col: int
+    ):
+        for col_idx, index in self._value_indexes.items():
+            if first_col <= col_idx <= last_col:
+                index.rows_changed(first_row, last_row)
+        for col_idx in range(first_col, last_col + 1):
+            self._patch_sort_keys(col_idx, first_row, last_row)
+        if first_col == 0:
+            self._on_storage_ids_changed(first_row, last_row)
+
+    def _patch_sort_keys(self, col_idx: int, first_row: int, last_row: int):
+        """Update cached sort keys of changed cells (drop them for large changes)"""
+        keys = self._sort_keys.get(col_idx)
+        if keys is None:
+            return
+        if (last_row - first_row + 1) * 8 > len(keys):
+            del self._sort_keys[col_idx]  # Cheaper to recompute on next sort
+            return
+
+        numeric = isinstance(keys, array)
+        cell_sort_key = self._cell_sort_key
+        for row in range(first_row, last_row + 1):
+            key = cell_sort_key(row, col_idx, numeric)
+            if key is None:
+                del self._sort_keys[col_idx]  # Column no longer sorts numerically
+                return
+            keys[row] = key
+
+    def _on_storage_row_moved(self, source: int, target: int):
+        """Data row source was moved to target (rows in between shift by one)"""
+        for index in self._value_indexes.values():
+            index.row_moved(source, target)
+        for keys in self._sort_keys.values():
+            keys.insert(target, keys.pop(source))
+
+        row_ids = self._row_ids
+        if row_ids is not None:
+            row_ids.insert(target, row_ids.pop(source))
+            if self._id_rows is not None and self._ids_unique:
+                self._id_drift += 1  # Rows in between shifted by one
+                if row_ids[target] is not None:
+                    self._id_rows[row_ids[target]] = target
+            else:
+                self._id_rows = None
+        self._restart_async_filter()
+
+    def _on_storage_ids_changed(self, first_row: int, last_row: int):
+        """Row IDs of data rows first_row..last_row were set or replaced"""
+        row_ids = self._row_ids
+        if row_ids is None:
+            return
+        if (last_row - first_row + 1) * 8 > len(row_ids) + 1:
+            self._drop_id_index()  # Cheaper to rebuild on next lookup
+            return
+
+        id_rows = self._id_rows
+        storage_row_id = self._storage_row_id
+        for row in range(first_row, last_row + 1):
+            new_id = storage_row_id(row)
+            if row < len(row_ids):
+                old_id = row_ids[row]
+                if old_id == new_id:
+                    continue
+                row_ids[row] = new_id
+                if id_rows is not None and (
+                    self._ids_unique or id_rows.get(old_id) == row
+                ):
+                    id_rows.pop(old_id, None)
+            else:
+                row_ids.append(new_id)
+            if id_rows is None or new_id is None:
+                continue
+            held = id_rows.get(new_id, row)
+            if held != row:
+                self._ids_unique = False
+                if self._id_drift:
+                    self._id_rows = None  # First rows unknown: rebuild on lookup
+                    return
+            if held >= row:
+                id_rows[new_id] = row
+
+    def _drop_id_index(self):
+        self._id_rows = None
+        self._row_ids = None
+        self._id_drift = 0
+
+    def _on_storage_reset(self):
+        self._value_indexes.clear()
+        self._sort_keys.clear()
+        self._drop_id_index()
+        self._restart_async_filter()
+
+    def _restart_async_filter(self):
+        """Rows moved under a running evaluation: its result is stale, redo it"""
+        if self._filter_busy:
+            self._apply_filters()
+
+    def _refresh_rows(self, rows: List[int], columns: Set[int]):
+        """
+        Hook after cells of data rows changed (col_idx in columns). Tables
+        that keep filters and sort current incrementally override it.
+        """
+
+    def _row_matches_filters(
+        self, row: int, filters: Optional[List[Tuple[int, ColumnFilter]]] = None
+    ) -> bool:
+        """Check if single row matches filters (filters: _compiled_filters())"""
+        if not self._active_filters:
+            return True
+
+        if filters is None:
+            filters = self._compiled_filters()
+        for col_idx, column_filter in filters:
+            if not column_filter.matches(self._cell_text(row, col_idx)):
+                return False
+        return True
+
+    def _match_text_filter(self, cell_text: str, text: str, mode: str) -> bool:
+        """Helper for text logic"""
+        return match_text(cell_text, text, mode)
+
+    def get_unique_values(self, column_key: str) -> List[str]:
+        """Get unique values in a column"""
+        if column_key in self._predefined_options:
+            return self._predefined_options[column_key]
+
+        col_idx = self._get_table_index(column_key)
+        if col_idx == -1:
+            return []
+
+        index = self._value_index(col_idx)
+        if index is not None:
+            return index.sorted_values()
+
+        values: Set[str] = set()
+        for row in range(self._source_row_count()):
+            values.add(self._cell_text(row, col_idx))
+        return sorted(values)
+
+    def get_value_counts(self, column_key: str) -> Dict[str, int]:
+        """Get row count per distinct value of a filterable column"""
+        col_idx = self._get_table_index(column_key)
+        if col_idx == -1:
+            return {}
+
+        index = self._value_index(col_idx)
+        if index is None:
+            return {}
+        return index.value_counts()
+
+    def clear_all_filters(self):
+        """Clear all active filters"""
+        self._active_filters.clear()
+        self._filter_header.clear_all_filter_indicators()
+        self._cancel_async_filter()
+        self._finish_filter(None)  # Shows all rows and reports the counts
+        self._schedule_filter_settings()
+        self.filter_changed.emit(self._active_filters)
+
+    def get_visible_columns(self) -> List[str]:
+        """Get visible column keys in visual order"""
+        if self._visible_columns is None:
+            self._column_layout()
+        return list(self._visible_columns)
+
+    def _on_section_moved(self, logical_idx, old_visual, new_visual):
+        self._invalidate_column_layout()
+        self._schedule_settings()
+
+    def _on_section_resized(self, logical_idx, old_size, new_size):
+        if not (old_size and new_size):  # Section hidden or shown
+            self._invalidate_column_layout()
+        if not self._changing_columns:
+            self._schedule_settings()
+
+    def _show_column_menu(self, pos: QPoint):
+        """Show the searchable show/hide columns popup"""
+        chooser = self._column_chooser
+        if chooser is None:
+            chooser = ColumnChooser(parent=self)
+            chooser.columns_applied.connect(self._set_column_visibility)
+            self._column_chooser = chooser
+
+        # Listed in visual order
+        keys = [self.column_order[logical] for logical in self._visual_columns()]
+        chooser.set_columns(
+            [(key, self.columns[key].title) for key in keys],
+            set(self.get_visible_columns()),
+        )
+        chooser.move(self._filter_header.mapToGlobal(pos))
+        chooser.show()
+        chooser.search_input.setFocus()
+
+    def set_columns_visible(self, column_keys: Iterable[str], visible: bool = True):
+        """Show or hide several columns at once (one settings write)"""
+        self._set_column_visibility(dict.fromkeys(column_keys, visible))
+
+    def _toggle_column(self, key: str, visible: bool):
+        """Toggle column visibility"""
+        self._set_column_visibility({key: visible})
+
+    def _set_column_visibility(self, changes: Dict[str, bool], save: bool = True):
+        """Apply column_key -> visible changes with a single repaint and save"""
+        header = self.horizontalHeader()
+        self._changing_columns = True
+        self.setUpdatesEnabled(False)
+        try:
+            for key, visible in changes.items():
+                logical_idx = self._get_table_index(key)
+                if logical_idx == -1:
+                    continue
+                col = self.columns[key]
+                col.visible = visible
+                if header.isSectionHidden(logical_idx) == visible:
+                    header.setSectionHidden(logical_idx, not visible)
+                self._filter_header.set_column_filterable(
+                    logical_idx, col.filterable if visible else False
+                )
+        finally:
+            self.setUpdatesEnabled(True)
+            self._changing_columns = False
+
+        self._invalidate_column_layout()
+        if save:
+            self._schedule_settings()
+
+    def _apply_column_settings(self):
+        """Apply visibility, width and stretch settings"""
+        self._hide_initial_columns()
+
+        header = self.horizontalHeader()
+        for idx, key in enumerate(self.column_order):
+            if idx >= header.count():
+                break
+
+            col = self.columns[key]
+            header.setSectionResizeMode(idx, QHeaderView.ResizeMode.Interactive)
+            self.setColumnWidth(idx, col.width)
+
+        if hasattr(self, "_saved_header_state") and self._saved_header_state:
+            try:
+                header.restoreState(self._saved_header_state)
+            except Exception:
+                self._saved_header_state = None
+            self._invalidate_column_layout()
+
+    def _on_double_click(self, index):
+        """Emit double click signal with Row ID"""
+        item_id = self._row_id(index.row())
+        if item_id:
+            self.row_double_clicked.emit(item_id)
+
+    def _on_selection_changed(self):
+        item_id = self.get_selected_id()
+        if item_id:
+            self.row_selected.emit(item_id)
+
+    def get_selected_id(self) -> Optional[int]:
+        sel_model = self.selectionModel()
+        if sel_model:
+            current = sel_model.currentIndex()
+            if current.isValid():
+                item_id = self._row_id(current.row())
+                if item_id:
+                    return item_id
+
+            selected = sel_model.selectedIndexes()
+            if selected:
+                return self._row_id(selected[0].row())
+        return None
+
+    # --- Row ID index ---
+
+    def _id_index(self) -> Dict[object, int]:
+        """
+        row_id -> data row (first row holding it). Entries may be up to
+        _id_drift rows off after moves / removals: look rows up with _id_row().
+        """
+        row_ids = self._row_ids
+        if row_ids is not None and self._id_drift * 8 > len(row_ids):
+            self._id_rows = None  # Drifted too far for windowed lookups
+        if self._id_rows is None:
+            if row_ids is None:
+                storage_row_id = self._storage_row_id
+                row_ids = self._row_ids = [
+                    storage_row_id(row) for row in range(self._source_row_count())
+                ]
+            # Built backwards so duplicate IDs end up at their first row
+            id_rows = dict(zip(reversed(row_ids), range(len(row_ids) - 1, -1, -1)))
+            id_rows.pop(None, None)
+            self._ids_unique = len(id_rows) + row_ids.count(None) == len(row_ids)
+            self._id_rows = id_rows
+            self._id_drift = 0
+        return self._id_rows
+
+    def _id_row(self, row_id) -> Optional[int]:
+        """Data row holding a row ID (None if unknown)"""
+        id_rows = self._id_index()
+        row = id_rows.get(row_id)
+        if row is None:
+            return None
+        row_ids = self._row_ids
+        if row < len(row_ids) and row_ids[row] == row_id:
+            return row
+
+        # Shifted since the entry was written: at most _id_drift rows away
+        drift = self._id_drift
+        try:
+            row = row_ids.index(row_id, max(0, row - drift), row + drift + 1)
+        except ValueError:
+            del id_rows[row_id]  # ID was replaced
+            return None
+        id_rows[row_id] = row
+        return row
+
+    def row_for_id(self, row_id) -> int:
+        """View row showing a row ID (-1 if unknown or filtered out)"""
+        row = self._id_row(row_id)
+        if row is None:
+            return -1
+        return self._view_row(row)
+
+    def select_id(self, row_id) -> bool:
+        """Select and scroll to the row of a row ID (False if not shown)"""
+        row = self.row_for_id(row_id)
+        if row == -1:
+            return False
+        self.selectRow(row)
+        self.scrollTo(self.model().index(row, 0))
+        return True
+
+    def scroll_to_id(
+        self,
+        row_id,
+        hint: QAbstractItemView.ScrollHint = QAbstractItemView.ScrollHint.EnsureVisible,
+    ) -> bool:
+        """Scroll to the row of a row ID (False if not shown)"""
+        row = self.row_for_id(row_id)
+        if row == -1:
+            return False
+        self.scrollTo(self.model().index(row, 0), hint)
+        return True
+
+    def update_row(self, row_id, values) -> bool:
+        """
+        Set cells of the row of a row ID.
+        values is a dict keyed by ColumnConfig.key (only given columns
+        change) or a sequence in column order. False if the ID is unknown.
+        """
+        row = self._id_row(row_id)
+        if row is None:
+            return False
+        if isinstance(values, dict):
+            cells = {
+                self._column_index[key]: value
+                for key, value in values.items()
+                if key in self.columns
+            }
+        else:
+            cells = dict(enumerate(list(values)[: len(self.column_order)]))
+        if cells:
+            self._update_storage_row(row, cells)
+            self._refresh_rows([row], set(cells))
+        return True
+
+    def remove_ids(self, row_ids: Iterable) -> int:
+        """Remove the rows of the given row IDs; returns the number removed"""
+        rows = {self._id_row(row_id) for row_id in row_ids}
+        rows.discard(None)
+        rows = sorted(rows)
+        if rows:
+            self._remove_storage_rows(rows)
+        return len(rows)
+
+    def _schedule_settings(self):
+        """Schedule a write of the column layout (header state, columns, sort)"""
+        self._pending_settings = True
+        self._settings_timer.start()  # Restarted by each change: coalesced
+
+    def _schedule_filter_settings(self):
+        """Schedule a write of the active filters"""
+        self._pending_filters = True
+        self._settings_timer.start()
+
+    def flush_settings(self):
+        """
+        Write pending settings now.
+        Runs after SETTINGS_FLUSH_DELAY_MS without further changes, when the
+        table is hidden, closed or deleted and on application quit; keys whose
+        value did not change are skipped.
+        """
+        self._settings_timer.stop()
+        if not (self._pending_settings or self._pending_filters):
+            return
+
+        changes = {}
+        if self._pending_settings:
+            self._pending_settings = False
+            header = self.horizontalHeader()
+            self._collect_setting(changes, "header_state", header.saveState())
+
+            col_settings = {}
+            for key, col in self.columns.items():
+                col_settings[key] = {"visible": col.visible, "width": col.width}
+            self._collect_setting(changes, "columns", col_settings)
+
+            # Sort stack as column keys, "-" prefix = descending
+            sort_specs = [
+                ("-" if order == Qt.SortOrder.DescendingOrder else "") + key
+                for key, order in self._sort_columns
+            ]
+            self._collect_setting(changes, "sort", sort_specs)
+
+        if self._pending_filters:
+            self._pending_filters = False
+            self._collect_setting(
+                changes, "filters", copy.deepcopy(self._active_filters)
+            )
+
+        if changes:
+            self._settings_store.save(self.table_id, self.user_id, changes)
+            if set(changes) - {"filters"}:
+                self.settings_changed.emit()
+
+    def _collect_setting(self, changes: dict, key: str, value):
+        """Add key to changes unless the stored record already holds value"""
+        if key in self._settings_record and self._settings_record[key] == value:
+            return
+        changes[key] = value
+        self._settings_record[key] = value
+
+    def _load_settings(self):
+        self._settings_record = self._settings_store.load(self.table_id, self.user_id)
+        record = self._settings_record
+
+        col_settings = record.get("columns")
+        if col_settings:
+            for key, config in col_settings.items():
+                if key in self.columns:
+                    self.columns[key].visible = config.get("visible", True)
+                    self.columns[key].width = config.get("width", 100)
+
+        header_state = record.get("header_state")
+        if header_state:
+            self._saved_header_state = header_state
+
+        sort_specs = record.get("sort") or []
+        if isinstance(sort_specs, str):  # Single item list from QSettings
+            sort_specs = [sort_specs]
+        self._sort_columns = []
+        for spec in sort_specs:
+            key = spec[1:] if spec.startswith("-") else spec
+            if key in self.columns:
+                order = (
+                    Qt.SortOrder.DescendingOrder
+                    if spec.startswith("-")
+                    else Qt.SortOrder.AscendingOrder
+                )
+                self._sort_columns.append((key, order))
+
+    def _load_filter_settings(self):
+        saved_filters = self._settings_record.get("filters")
+        if saved_filters:
+            self._active_filters = copy.deepcopy(saved_filters)
+            for col_key in self._active_filters:
+                if col_key in self.columns:
+                    logical_idx = self._column_index[col_key]
+                    self._filter_header.set_filter_active(logical_idx, True)
+
+    def apply_saved_filters(self):
+        """Apply saved sort and filters after loading data"""
+        if self._sort_columns:
+            self._apply_sort()
+        if self._active_filters:
+            self._apply_filters()
+
+    def set_standard_row_height(self, height: int):
+        self.verticalHeader().setDefaultSectionSize(height)
+
+    def set_user_id(self, user_id: int):
+        self.flush_settings()  # Pending writes belong to the previous user
+        self.user_id = user_id
+        self._load_settings()
+        self._apply_column_settings()
+        self._update_sort_indicators()
+
+    def create_action_delegate(
+        self, column_key: str, actions: Sequence[str] = ("view", "edit", "delete")
+    ) -> "ActionButtonsDelegate":
+        """
+        Paint action buttons in a column with a delegate (no widget per row).
+        Connect action_clicked(row_id, action) of the returned delegate.
+        """
+        from .action_delegate import ActionButtonsDelegate
+
+        delegate = ActionButtonsDelegate(actions, self)
+        logical_idx = self._get_table_index(column_key)
+        if logical_idx != -1:
+            self.setItemDelegateForColumn(logical_idx, delegate)
+        return delegate
+
+    def create_action_widget(self, item_id, actions, callbacks=None):
+        """
+        Create inline action buttons (one widget tree per row, for small
+        tables; see create_action_delegate)
+        """
+        from .action_buttons import (
+            create_view_button,
+            create_edit_button,
+            create_delete_button,
+        )
+
+        widget = QWidget()
+        layout = QHBoxLayout(widget)
+        layout.setContentsMargins(4, 2, 4, 2)
+        layout.setSpacing(6)
+
+        for action in actions:
+            btn = None
+            if action == "view":
+                btn = create_view_button(widget)
+                if callbacks and "view" in callbacks:
+                    btn.clicked.connect(callbacks["view"])
+            elif action == "edit":
+                btn = create_edit_button(widget)
+                if callbacks and "edit" in callbacks:
+                    btn.clicked.connect(callbacks["edit"])
+            elif action == "delete":
+                btn = create_delete_button(widget)
+                if callbacks and "delete" in callbacks:
+                    btn.clicked.connect(callbacks["delete"])
+
+            if btn:
+                layout.addWidget(btn)
+
+        layout.addStretch()
+        return widget
+
+    def create_filters_bar(self) -> "ActiveFiltersBar":
+        """Create and attach an ActiveFiltersBar"""
+        from .active_filters_bar import ActiveFiltersBar
+
+        bar = ActiveFiltersBar(self.parent())
+
+        bar.filter_removed.connect(self._on_filter_cleared)
+        bar.clear_all_clicked.connect(self.clear_all_filters)
+        self.filter_changed.connect(
+            lambda filters: bar.update_filters(
+                filters, {k: c.title for k, c in self.columns.items()}
+            )
+        )
+
+        def sync_filters():
+            if self._active_filters:
+                bar.update_filters(
+                    self._active_filters, {k: c.title for k, c in self.columns.items()}
+                )
+
+        QTimer.singleShot(0, sync_filters)
+
+        return bar
+
+    def set_server_side_mode(self, enabled: bool):
+        self.server_side_mode = enabled
+
+    def get_backend_filters(self):
+        """Convert filters (if needed for backend)"""
+        filters = {}
+        for col_key, filter_data in self._active_filters.items():
+            col_filter = {}
+
+            if not filter_data.get("all_selected", True):
+                col_filter["selected_values"] = filter_data.get("selected_values", [])
+
+            text_filter = filter_data.get("text_filter")
+            if text_filter:
+                col_filter["text_match"] = {
+                    "mode": text_filter.get("mode", "contains"),
+                    "text": text_filter.get("text", ""),
+                }
+
+            if col_filter:
+                filters[col_key] = col_filter
+
+        return filters
@@ -0,0 +1,520 @@
+"""
+Columnar table model.
+Stores each column as a compact typed array and serves cells on demand.
+"""
+
+import math
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+)
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QAbstractItemModel,
+    QAbstractTableModel,
+    QModelIndex,
+)
+
+from .sort_keys import (
+    EMPTY_NUMBER,
+    argsort,
+    numeric_sort_keys,
+    permute,
+    text_sort_keys,
+)
+
+if TYPE_CHECKING:
+    from .enhanced_table import ColumnConfig
+
+
+def _number_text(value: float, fmt: Optional[str], integral: bool) -> str:
+    """Display text of a stored number"""
+    if value != value:  # NaN -> empty
+        return ""
+    if fmt:
+        return format(value, fmt)
+    if integral:
+        return str(int(value))
+    return str(value)
+
+
+class ColumnarTableModel(QAbstractTableModel):
+    """
+    Column oriented table model.
+
+    Storage:
+    - Numeric columns (filter_type="number"): array("d"), NaN for empty cells
+    - Text columns: list of interned strings
+    - Row IDs: served as UserRole on column 0 (same as EnhancedTableWidget)
+
+    Display text is produced on demand in data(), so no per-cell objects
+    are kept alive.
+
+    Rows are addressed two ways: storage rows (cell_text, cell_value,
+    row_id) and view rows (Qt indexes). Filtering installs a visible-row
+    map with set_visible_rows(); view row i shows storage row map[i].
+    The storage_* signals report changes in storage rows.
+    """
+
+    # Signals (storage rows)
+    storage_rows_inserted = pyqtSignal(int, int)  # first, count
+    storage_rows_removed = pyqtSignal(int, int)  # first, count
+    storage_cells_changed = pyqtSignal(int, int, int, int)  # rows, columns
+    storage_row_moved = pyqtSignal(int, int)  # source, target
+    storage_reset = pyqtSignal()  # Storage replaced or reordered
+
+    def __init__(self, columns: List["ColumnConfig"], parent=None):
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._keys = [col.key for col in self._columns]
+        self._key_index = {key: i for i, key in enumerate(self._keys)}
+        self._numeric = [col.filter_type == "number" for col in self._columns]
+        self._integral = [True] * len(self._columns)  # All numbers were whole
+        self._formats: Dict[int, str] = {}
+        self._data: List[Any] = [self._new_column(i) for i in range(len(self._keys))]
+        self._row_ids: List[Any] = []
+        self._view_rows: Optional[List[int]] = None  # None = all rows
+
+    # --- Qt model interface ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        if self._view_rows is not None:
+            return len(self._view_rows)
+        return len(self._row_ids)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._keys)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row, col = self.storage_row(index.row()), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.cell_text(row, col)
+        if role == Qt.ItemDataRole.UserRole and col == 0:
+            return self._row_ids[row]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self._columns[col].align
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(self._columns)
+        ):
+            return self._columns[section].title
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """Reorder rows by a column (empty cells first when ascending)"""
+        if column < 0 or column >= len(self._keys):
+            return
+        descending = order == Qt.SortOrder.DescendingOrder
+        self.apply_row_order(argsort(self.sort_keys(column), descending))
+
+    def sort_keys(self, column: int) -> Sequence:
+        """Sort key of every storage row of a column"""
+        values = self._data[column]
+        if self._numeric[column]:
+            return numeric_sort_keys(values)
+        return text_sort_keys(values)
+
+    def cell_sort_key(self, row: int, column: int):
+        """Sort key of one storage cell (as in sort_keys)"""
+        value = self._data[column][row]
+        if self._numeric[column]:
+            return EMPTY_NUMBER if value != value else value
+        return value.casefold()
+
+    def apply_row_order(self, perm: List[int]):
+        """Reorder storage rows in one layout change (perm[new_row] = old_row)"""
+        hint = QAbstractItemModel.LayoutChangeHint.VerticalSortHint
+        self.layoutAboutToBeChanged.emit([], hint)
+
+        new_rows = [0] * len(perm)
+        for new_row, old_row in enumerate(perm):
+            new_rows[old_row] = new_row
+
+        self._data = [permute(col_values, perm) for col_values in self._data]
+        self._row_ids = permute(self._row_ids, perm)
+
+        old_indexes = self.persistentIndexList()
+        if self._view_rows is None:
+            new_indexes = [
+                self.index(new_rows[idx.row()], idx.column()) for idx in old_indexes
+            ]
+        else:
+            # Visible rows keep their storage rows, now in sorted order
+            old_view_rows = self._view_rows
+            self._view_rows = sorted(new_rows[row] for row in old_view_rows)
+            new_indexes = [
+                self.index(
+                    bisect_left(self._view_rows, new_rows[old_view_rows[idx.row()]]),
+                    idx.column(),
+                )
+                for idx in old_indexes
+            ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit([], hint)
+        self.storage_reset.emit()
+
+    def set_visible_rows(self, rows: Optional[List[int]]):
+        """Show only the given storage rows, ascending (None shows all)"""
+        self.beginResetModel()
+        self._view_rows = list(rows) if rows is not None else None
+        self.endResetModel()
+
+    def set_row_visible(self, row: int, visible: bool) -> bool:
+        """Show / hide one storage row in the visible-row map (True if changed)"""
+        view_rows = self._view_rows
+        if view_rows is None:
+            if visible:
+                return False
+            view_rows = self._view_rows = list(range(len(self._row_ids)))
+
+        pos = bisect_left(view_rows, row)
+        shown = pos < len(view_rows) and view_rows[pos] == row
+        if shown == visible:
+            return False
+        if visible:
+            self.beginInsertRows(QModelIndex(), pos, pos)
+            view_rows.insert(pos, row)
+            self.endInsertRows()
+        else:
+            self.beginRemoveRows(QModelIndex(), pos, pos)
+            del view_rows[pos]
+            self.endRemoveRows()
+        return True
+
+    def show_appended_rows(self, rows: List[int]):
+        """
+        Show storage rows past the last visible row (ascending, e.g. rows
+        just appended under a visible-row map) with one insertion.
+        """
+        view_rows = self._view_rows
+        if view_rows is None or not rows:
+            return
+        first = len(view_rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        view_rows.extend(rows)
+        self.endInsertRows()
+
+    def move_row(self, source: int, target: int):
+        """
+        Move one storage row to target (rows in between shift by one).
+        Costs O(|target - source|) per column instead of a full reorder.
+        """
+        if source == target:
+            return
+        low, high = min(source, target), max(source, target)
+        step = -1 if source < target else 1
+
+        view_rows = self._view_rows
+        if view_rows is None:
+            old_pos, new_pos = source, target
+        else:
+            old_pos = bisect_left(view_rows, source)
+            if old_pos == len(view_rows) or view_rows[old_pos] != source:
+                old_pos = new_pos = -1  # Hidden row
+            elif step < 0:
+                new_pos = bisect_right(view_rows, target) - 1
+            else:
+                new_pos = bisect_left(view_rows, target)
+
+        moved = old_pos != new_pos and self.beginMoveRows(
+            QModelIndex(),
+            old_pos,
+            old_pos,
+            QModelIndex(),
+            new_pos + 1 if new_pos > old_pos else new_pos,
+        )
+        for values in self._data:
+            values.insert(target, values.pop(source))
+        self._row_ids.insert(target, self._row_ids.pop(source))
+        if view_rows is not None:
+            # Visible rows in between keep their order, shifted by one
+            if old_pos != -1:
+                del view_rows[old_pos]
+            first, last = bisect_left(view_rows, low), bisect_right(view_rows, high)
+            view_rows[first:last] = [row + step for row in view_rows[first:last]]
+            if new_pos != -1:
+                view_rows.insert(new_pos, target)
+        if moved:
+            self.endMoveRows()
+        self.storage_row_moved.emit(source, target)
+
+    def storage_row(self, row: int) -> int:
+        """Storage row shown at a view row"""
+        if self._view_rows is None:
+            return row
+        return self._view_rows[row]
+
+    def view_row(self, row: int) -> int:
+        """View row showing a storage row (-1 if not visible)"""
+        if self._view_rows is None:
+            return row if 0 <= row < len(self._row_ids) else -1
+        pos = bisect_left(self._view_rows, row)
+        if pos < len(self._view_rows) and self._view_rows[pos] == row:
+            return pos
+        return -1
+
+    def storage_row_count(self) -> int:
+        """Number of stored rows (visible or not)"""
+        return len(self._row_ids)
+
+    # --- Cell access ---
+
+    def column_index(self, column_key: str) -> int:
+        """Column position of a key (-1 if unknown)"""
+        return self._key_index.get(column_key, -1)
+
+    def cell_text(self, row: int, col: int) -> str:
+        """Display text of a cell"""
+        values = self._data[col]
+        if not self._numeric[col]:
+            return values[row]
+
+        return _number_text(values[row], self._formats.get(col), self._integral[col])
+
+    def snapshot_column(self, col: int) -> Callable[[int], str]:
+        """Text getter (by storage row) over a copy of a column, for worker threads"""
+        values = self._data[col][:]
+        if not self._numeric[col]:
+            return values.__getitem__
+
+        fmt = self._formats.get(col)
+        integral = self._integral[col]
+        return lambda row: _number_text(values[row], fmt, integral)
+
+    def cell_value(self, row: int, col: int):
+        """Raw cell value (float or None for numeric columns, str otherwise)"""
+        value = self._data[col][row]
+        if self._numeric[col] and value != value:
+            return None
+        return value
+
+    def row_id(self, row: int):
+        """Row ID of a storage row (or None)"""
+        if 0 <= row < len(self._row_ids):
+            return self._row_ids[row]
+        return None
+
+    def update_row(self, row: int, values: Dict[int, Any]):
+        """Set cells of a storage row (column -> value, same values as set_rows)"""
+        if not values:
+            return
+        for col, value in values.items():
+            if self._numeric[col]:
+                self._set_number(row, col, value)
+            else:
+                self._data[col][row] = "" if value is None else sys.intern(str(value))
+
+        first_col, last_col = min(values), max(values)
+        view_row = self.view_row(row)
+        if view_row != -1:
+            self.dataChanged.emit(
+                self.index(view_row, first_col), self.index(view_row, last_col)
+            )
+        self.storage_cells_changed.emit(row, row, first_col, last_col)
+
+    def _set_number(self, row: int, col: int, value: Any):
+        if value is None or value == "":
+            self._data[col][row] = math.nan
+            return
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            # Non numeric content -> fall back to text storage
+            self._demote_to_text(col)
+            self._data[col][row] = sys.intern(str(value))
+            self._refresh_column(col)
+            return
+        self._data[col][row] = number
+        if self._integral[col] and not number.is_integer():
+            self._integral[col] = False  # Display of the whole column changes
+            self._refresh_column(col)
+
+    def _refresh_column(self, col: int, row_count: Optional[int] = None):
+        """
+        Display text of a whole column changed (storage rows before
+        row_count, default all): repaint it and report it as changed cells,
+        so value indexes and sort keys of the column are rebuilt.
+        """
+        view_count = self.rowCount()
+        if view_count:
+            self.dataChanged.emit(self.index(0, col), self.index(view_count - 1, col))
+        if row_count is None:
+            row_count = len(self._row_ids)
+        if row_count:
+            self.storage_cells_changed.emit(0, row_count - 1, col, col)
+
+    def remove_rows(self, rows: Iterable[int]):
+        """Remove storage rows (one model removal per contiguous run)"""
+        rows = sorted({row for row in rows if 0 <= row < len(self._row_ids)})
+        end = len(rows)
+        while end:
+            start = end - 1
+            while start and rows[start - 1] == rows[start] - 1:
+                start -= 1
+            self._remove_run(rows[start], end - start)
+            end = start
+
+    def _remove_run(self, first: int, count: int):
+        last = first + count
+        if self._view_rows is None:
+            view_first, view_last = first, last
+        else:
+            view_first = bisect_left(self._view_rows, first)
+            view_last = bisect_left(self._view_rows, last)
+
+        visible = view_last > view_first
+        if visible:
+            self.beginRemoveRows(QModelIndex(), view_first, view_last - 1)
+        for values in self._data:
+            del values[first:last]
+        del self._row_ids[first:last]
+        if self._view_rows is not None:
+            tail = self._view_rows[view_last:]
+            self._view_rows[view_first:] = [row - count for row in tail]
+        if visible:
+            self.endRemoveRows()
+        self.storage_rows_removed.emit(first, count)
+
+    def set_column_format(self, column_key: str, fmt: Optional[str]):
+        """Set display format spec for a numeric column (e.g. ".2f")"""
+        col = self.column_index(column_key)
+        if col == -1:
+            return
+        if fmt:
+            self._formats[col] = fmt
+        else:
+            self._formats.pop(col, None)
+        self._refresh_column(col)
+
+    # --- Loading ---
+
+    def set_rows(self, rows: Iterable, id_key: Optional[str] = None):
+        """
+        Replace all rows.
+
+        Rows are tuples/lists in column order or dicts keyed by
+        ColumnConfig.key. id_key names the column holding the row ID.
+        """
+        self.beginResetModel()
+        self._integral = [True] * len(self._keys)
+        self._numeric = [col.filter_type == "number" for col in self._columns]
+        self._data = [self._new_column(i) for i in range(len(self._keys))]
+        self._row_ids = []
+        self._view_rows = None
+        self._extend(rows, id_key)
+        self.endResetModel()
+        self.storage_reset.emit()
+
+    def append_rows(self, rows: Iterable, id_key: Optional[str] = None):
+        """
+        Append rows at the end (same row format as set_rows).
+
+        While a visible-row map is installed the new rows stay hidden until
+        the map is replaced (e.g. by re-applying filters).
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        first = len(self._row_ids)
+        integral = list(self._integral)
+        if self._view_rows is not None:
+            self._extend(rows, id_key)
+        else:
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._extend(rows, id_key)
+            self.endInsertRows()
+        for col, was_integral in enumerate(integral):
+            if was_integral and not self._integral[col]:
+                # A fractional number changed the display of the old rows
+                self._refresh_column(col, first)
+        self.storage_rows_inserted.emit(first, len(rows))
+
+    def clear(self):
+        """Remove all rows"""
+        self.set_rows([])
+
+    def _new_column(self, col: int):
+        return array("d") if self._numeric[col] else []
+
+    def _extend(self, rows: Iterable, id_key: Optional[str]):
+        """Append rows to storage (no model signals)"""
+        keys = self._keys
+        id_col = self._key_index.get(id_key, -1) if id_key else -1
+        columns = [[] for _ in keys]
+
+        for row in rows:
+            if isinstance(row, dict):
+                values = [row.get(key) for key in keys]
+                row_id = row.get(id_key) if id_key else None
+            else:
+                values = list(row[: len(keys)])
+                values.extend([None] * (len(keys) - len(values)))
+                row_id = values[id_col] if id_col != -1 else None
+
+            for col, value in enumerate(values):
+                columns[col].append(value)
+            self._row_ids.append(row_id)
+
+        for col, values in enumerate(columns):
+            if self._numeric[col]:
+                self._extend_numeric(col, values)
+            else:
+                self._extend_text(col, values)
+
+    def _extend_numeric(self, col: int, values: List[Any]):
+        numbers = array("d")
+        integral = self._integral[col]
+        try:
+            for value in values:
+                if value is None or value == "":
+                    numbers.append(math.nan)
+                    continue
+                number = float(value)
+                numbers.append(number)
+                if integral and not number.is_integer():
+                    integral = False  # "5", 5.0 and Decimal("5") stay integral
+        except (TypeError, ValueError):
+            # Non numeric content -> fall back to text storage
+            self._demote_to_text(col)
+            self._extend_text(col, values)
+            return
+
+        self._integral[col] = integral
+        self._data[col].extend(numbers)
+
+    def _extend_text(self, col: int, values: List[Any]):
+        intern = sys.intern
+        self._data[col].extend(
+            "" if value is None else intern(str(value)) for value in values
+        )
+
+    def _demote_to_text(self, col: int):
+        """Convert a numeric column to text storage"""
+        count = len(self._data[col])
+        texts = [self.cell_text(row, col) for row in range(count)]
+        self._numeric[col] = False
+        self._data[col] = [sys.intern(text) for text in texts]
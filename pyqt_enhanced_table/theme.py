@@ -2,6 +2,11 @@
 Default theme configuration for pyqt-enhanced-table.
 """
 
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from PyQt6.QtCore import QEvent, QObject, QTimer
+from PyQt6.QtWidgets import QApplication, QWidget
+
 # Default Colors (Dark Mode inspired)
 COLORS = {
     "primary": "#3498db",
@@ -42,9 +47,418 @@ ICONS = {
     "cancel": "fa5s.times",
     "check": "fa5s.check",
     "refresh": "fa5s.sync-alt",
+    "spinner": "fa5s.spinner",
     "arrow_left": "fa5s.chevron-left",
     "arrow_right": "fa5s.chevron-right",
     "star": "fa5s.star",
     "eye": "fa5s.eye",
     "list": "fa5s.list",
 }
+
+
+# --- Compiled stylesheet ---
+#
+# All component styles live in one application stylesheet, scoped by class
+# names, object names and dynamic properties, so widgets never call
+# setStyleSheet themselves. Switching theme is one re-polish of the app.
+
+_THEME_BEGIN = "/* pyqt-enhanced-table theme */"
+_THEME_END = "/* pyqt-enhanced-table theme end */"
+
+
+def hex_to_rgba(hex_color: str, alpha: float) -> str:
+    """Hex kodu RGBA string'ine çevirir."""
+    hex_color = hex_color.lstrip("#")
+    if len(hex_color) == 6:
+        r = int(hex_color[0:2], 16)
+        g = int(hex_color[2:4], 16)
+        b = int(hex_color[4:6], 16)
+        return f"rgba({r}, {g}, {b}, {alpha})"
+    return hex_color
+
+
+# Popups sharing the search box / checkable list look (CheckableListPopup)
+_LIST_POPUPS = ("FilterPopup", "ColumnChooser")
+
+
+def _list_popup_selector(suffix: str = "") -> str:
+    return ", ".join(popup + suffix for popup in _LIST_POPUPS)
+
+
+def _list_popup_rules(c: Dict[str, str], font: str) -> str:
+    sel = _list_popup_selector
+    return f"""
+{sel()} {{
+    background: {c['bg_secondary']};
+    border: 1px solid {c['border']};
+    border-radius: 6px;
+}}
+{sel(' QLineEdit')} {{
+    background: {c['bg_primary']};
+    border: 1px solid {c['border']};
+    border-radius: 2px;
+    padding: 0px 4px;
+    color: {c['text_primary']};
+    font-family: {font};
+    font-size: 9px;
+    min-height: 14px;
+}}
+{sel(' QLineEdit:focus')} {{
+    border-color: {c['primary']};
+}}
+{sel(' QComboBox')} {{
+    background: {c['bg_primary']};
+    border: 1px solid {c['border']};
+    border-radius: 2px;
+    padding: 0px 4px;
+    color: {c['text_primary']};
+    font-family: {font};
+    font-size: 9px;
+    min-height: 14px;
+}}
+{sel(' QComboBox::drop-down')} {{
+    border: none;
+    width: 12px;
+}}
+{sel(' QComboBox::down-arrow')} {{
+    image: none;
+    border-left: 2px solid transparent;
+    border-right: 2px solid transparent;
+    border-top: 3px solid {c['text_secondary']};
+}}
+{sel(' QComboBox QAbstractItemView')} {{
+    background: {c['bg_secondary']};
+    border: 1px solid {c['border']};
+    selection-background-color: {c['primary']};
+    font-size: 9px;
+}}
+{sel(' QPushButton')} {{
+    background: {c['bg_hover']};
+    border: 1px solid {c['border']};
+    border-radius: 2px;
+    padding: 0px 4px;
+    color: {c['text_primary']};
+    font-family: {font};
+    font-size: 9px;
+}}
+{sel(' QPushButton:hover')} {{
+    background: {c['bg_active']};
+}}
+{sel(' QPushButton[class="primary"]')} {{
+    background: {c['primary']};
+    border: none;
+    color: white;
+}}
+{sel(' QPushButton[class="primary"]:hover')} {{
+    background: {c['primary_hover']};
+}}
+{sel(' QListView')} {{
+    background: {c['bg_primary']};
+    border: 1px solid {c['border']};
+    border-radius: 3px;
+    padding: 2px;
+    color: {c['text_primary']};
+    font-family: {font};
+    font-size: 10px;
+    outline: none;
+}}
+{sel(' QScrollBar:vertical')} {{
+    background: {c['bg_primary']};
+    width: 6px;
+    border-radius: 3px;
+}}
+{sel(' QScrollBar::handle:vertical')} {{
+    background: {c['border']};
+    border-radius: 3px;
+    min-height: 16px;
+}}
+{sel(' QScrollBar::handle:vertical:hover')} {{
+    background: {c['text_muted']};
+}}
+{sel(' QListView::item')} {{
+    padding: 1px;
+}}
+{sel(' QListView::item:hover')} {{
+    background: {c['bg_hover']};
+    border-radius: 2px;
+}}
+{sel(' QListView::indicator')} {{
+    width: 10px;
+    height: 10px;
+    border: 1px solid {c['border']};
+    border-radius: 2px;
+    background: {c['bg_primary']};
+}}
+{sel(' QListView::indicator:checked')} {{
+    background: {c['primary']};
+    border-color: {c['primary']};
+}}
+{sel(' QListView::indicator:checked:hover')} {{
+    background: {c['primary_hover']};
+}}
+"""
+
+
+def _filters_bar_rules(c: Dict[str, str]) -> str:
+    return f"""
+QFrame#ActiveFiltersBar {{
+    background: {c['bg_tertiary']};
+    border: 1px solid {c['border']};
+    border-radius: 4px;
+}}
+QLabel#ActiveFiltersLabel {{
+    color: {c['text_muted']};
+}}
+QPushButton#ClearFiltersButton {{
+    background: transparent;
+    border: 1px solid {c['danger']};
+    border-radius: 4px;
+    color: {c['danger']};
+    padding: 2px 8px;
+}}
+QPushButton#ClearFiltersButton:hover {{
+    background: {c['danger']};
+    color: white;
+}}
+FilterChip {{
+    background: {c['bg_hover']};
+    border: 1px solid {c['border']};
+    border-radius: 12px;
+}}
+FilterChip QLabel {{
+    color: {c['text_primary']};
+    background: transparent;
+    border: none;
+}}
+FilterChip QPushButton {{
+    background: transparent;
+    border: none;
+    color: {c['text_muted']};
+    border-radius: 8px;
+}}
+FilterChip QPushButton:hover {{
+    background: {c['danger']};
+    color: white;
+}}
+"""
+
+
+def _footer_rules(c: Dict[str, str]) -> str:
+    active_border = c.get("active_border", "#505050")
+    return f"""
+MiniStat {{
+    background-color: {c['bg_secondary']};
+    border: 1px solid {c['bg_hover']};
+    border-radius: 4px;
+}}
+MiniStat QLabel {{
+    border: none;
+    background: transparent;
+}}
+MiniStat .mini-stat-title {{
+    color: {c['text_secondary']};
+    font-size: 11px;
+    font-weight: 500;
+}}
+MiniStat .mini-stat-value {{
+    color: {c['text_primary']};
+    font-size: 12px;
+    font-weight: bold;
+}}
+TableFooter {{
+    background-color: {c['bg_primary']};
+    border-top: 1px solid #333333;
+}}
+TableFooter .footer-label, TableFooter .pagination-label {{
+    color: {c['text_secondary']};
+    font-size: 12px;
+}}
+TableFooter .footer-controls {{
+    background-color: {c['bg_secondary']};
+    border: 1px solid {c['bg_hover']};
+    border-radius: 4px;
+}}
+TableFooter QFrame#FooterSeparator {{
+    background-color: {c['bg_hover']};
+    border: none;
+    width: 1px;
+}}
+TableFooter QComboBox {{
+    background-color: transparent;
+    border: 1px solid transparent;
+    border-radius: 4px;
+    color: {c['text_secondary']};
+    padding: 0px;
+    padding-left: 4px;
+    width: 45px;
+    min-width: 45px;
+    max-width: 45px;
+    height: 24px;
+    min-height: 24px;
+    max-height: 24px;
+}}
+TableFooter QComboBox:hover {{
+    background-color: {c['bg_hover']};
+    border: 1px solid {active_border};
+    color: {c['text_primary']};
+}}
+TableFooter QComboBox::drop-down {{
+    border: none;
+    width: 14px;
+}}
+TableFooter QComboBox::down-arrow {{
+    image: none;
+    border-left: 3px solid transparent;
+    border-right: 3px solid transparent;
+    border-top: 3px solid #909090;
+    margin-right: 4px;
+}}
+TableFooter QPushButton {{
+    background-color: transparent;
+    border: 1px solid transparent;
+    border-radius: 4px;
+}}
+TableFooter QPushButton:hover {{
+    background-color: {c['bg_hover']};
+    border: 1px solid {active_border};
+}}
+"""
+
+
+def _action_button_rules(c: Dict[str, str]) -> str:
+    # Action buttons: class="action-button", actionColor=<COLORS key>
+    rules = [
+        """
+QPushButton[class="action-button"] {
+    background-color: transparent;
+    border: none;
+    border-radius: 4px;
+    padding: 2px;
+}
+"""
+    ]
+    for name, color in c.items():
+        selector = f'QPushButton[class="action-button"][actionColor="{name}"]'
+        rules.append(
+            f"""
+{selector}:hover {{
+    background-color: {hex_to_rgba(color, 0.4)};
+    border: 1px solid {color};
+}}
+{selector}:pressed {{
+    background-color: {hex_to_rgba(color, 0.6)};
+}}
+"""
+        )
+    return "".join(rules)
+
+
+@lru_cache(maxsize=8)
+def _compile_stylesheet(color_items: Tuple[Tuple[str, str], ...], font: str) -> str:
+    colors = dict(color_items)
+    return "".join(
+        [
+            _list_popup_rules(colors, font),
+            _filters_bar_rules(colors),
+            _footer_rules(colors),
+            _action_button_rules(colors),
+        ]
+    )
+
+
+def build_stylesheet(
+    colors: Optional[Dict[str, str]] = None, font_family: Optional[str] = None
+) -> str:
+    """Stylesheet of all components (compiled once per color set)"""
+    colors = COLORS if colors is None else colors
+    return _compile_stylesheet(
+        tuple(sorted(colors.items())), font_family or FONT_FAMILY_QT
+    )
+
+
+def install_theme(app: Optional[QApplication] = None):
+    """
+    Install the component stylesheet on the application.
+    Rules set by the application itself are kept; a previously installed
+    theme block is replaced.
+    """
+    app = app or QApplication.instance()
+    if app is None:
+        return
+
+    sheet = app.styleSheet()
+    begin = sheet.find(_THEME_BEGIN)
+    if begin != -1:
+        end = sheet.find(_THEME_END, begin)
+        end = len(sheet) if end == -1 else end + len(_THEME_END)
+        sheet = sheet[:begin] + sheet[end:]
+
+    block = f"{_THEME_BEGIN}\n{build_stylesheet()}\n{_THEME_END}"
+    app.setStyleSheet(f"{sheet.rstrip()}\n{block}" if sheet.strip() else block)
+
+
+class _ThemeWatcher(QObject):
+    """
+    Re-installs the theme after the application replaced its stylesheet.
+    Watches StyleChange events of the components (sent to every widget on
+    app.setStyleSheet) and checks once per event loop turn.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending = False
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() == QEvent.Type.StyleChange and not self._pending:
+            self._pending = True
+            QTimer.singleShot(0, self._check)
+        return False
+
+    def _check(self):
+        self._pending = False
+        ensure_theme()
+
+
+_watcher: Optional[_ThemeWatcher] = None
+
+
+def ensure_theme(widget: Optional[QWidget] = None):
+    """
+    Install the theme unless the application already has it.
+    widget (a component) is watched so the theme comes back if the
+    application later sets its own stylesheet.
+    """
+    global _watcher
+    app = QApplication.instance()
+    if app is None:
+        return
+    if _THEME_BEGIN not in app.styleSheet():
+        install_theme(app)
+    if widget is not None:
+        if _watcher is None:
+            _watcher = _ThemeWatcher(app)
+        widget.installEventFilter(_watcher)
+
+
+_theme_generation = 0
+
+
+def theme_generation() -> int:
+    """Incremented by set_theme(); lets painters drop cached colors/pixmaps"""
+    return _theme_generation
+
+
+def set_theme(
+    colors: Optional[Dict[str, str]] = None, font_family: Optional[str] = None
+):
+    """
+    Switch theme: update COLORS and re-install the stylesheet.
+    Painted headers pick up the new colors on their next repaint.
+    """
+    global FONT_FAMILY_QT, _theme_generation
+    if colors:
+        COLORS.update(colors)
+    if font_family:
+        FONT_FAMILY_QT = font_family
+    _theme_generation += 1
+    install_theme()
@@ -0,0 +1,214 @@
+"""
+Inverted value index for table columns.
+Maps each distinct cell text to the sorted rows holding it, so value
+(checkbox) filters become a union of posting lists instead of a full scan,
+and distinct values / counts for filter popups come without a scan.
+"""
+
+from array import array
+from bisect import bisect_left, insort
+from itertools import chain
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set
+
+
+class ColumnValueIndex:
+    """
+    Inverted index of one column: cell text -> sorted row array.
+
+    Edits are recorded as dirty rows and patched lazily on the next lookup
+    (or rebuilt when a large share of the column changed). Row inserts and
+    removals shift the postings in place when few rows move (appends,
+    removals near the end); otherwise, or if edits are still pending, the
+    index is rebuilt on next use instead. A single row move shifts only the
+    postings between its old and new position.
+    """
+
+    # Rebuild instead of patching when more than 1/N of the rows are dirty
+    REBUILD_RATIO = 8
+
+    def __init__(self, cell_text: Callable[[int], str], row_count: int):
+        self._cell_text = cell_text
+        self._values: List[str] = []  # row -> indexed text
+        self._postings: Dict[str, array] = {}
+        self._sorted: Optional[List[str]] = None  # Cached sorted distinct values
+        self._dirty: Set[int] = set()
+        self._stale = False
+        self._row_count = row_count
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    def _rebuild(self):
+        cell_text = self._cell_text
+        self._values = [cell_text(row) for row in range(self._row_count)]
+
+        groups: Dict[str, List[int]] = {}
+        for row, text in enumerate(self._values):
+            rows = groups.get(text)
+            if rows is None:
+                groups[text] = [row]
+            else:
+                rows.append(row)
+
+        self._postings = {text: array("l", rows) for text, rows in groups.items()}
+        self._sorted = None
+        self._dirty.clear()
+        self._stale = False
+
+    def _flush(self):
+        """Bring postings up to date with recorded edits"""
+        if self._stale or len(self._dirty) * self.REBUILD_RATIO > self._row_count:
+            self._rebuild()
+            return
+
+        for row in self._dirty:
+            old = self._values[row]
+            new = self._cell_text(row)
+            if new == old:
+                continue
+
+            rows = self._postings[old]
+            del rows[bisect_left(rows, row)]
+            if not rows:
+                del self._postings[old]
+                self._sorted = None
+
+            rows = self._postings.get(new)
+            if rows is None:
+                self._postings[new] = array("l", [row])
+                self._sorted = None
+            else:
+                insort(rows, row)
+            self._values[row] = new
+        self._dirty.clear()
+
+    # --- Lookup ---
+
+    def rows_for(self, values: Iterable[str]) -> List[int]:
+        """Sorted rows whose text is one of values"""
+        self._flush()
+        postings = self._postings
+        runs = [postings[value] for value in values if value in postings]
+        if not runs:
+            return []
+        if len(runs) == 1:
+            return runs[0].tolist()
+        # Concatenated sorted runs: timsort merges them in linear time
+        return sorted(chain.from_iterable(runs))
+
+    def values(self) -> FrozenSet[str]:
+        """Distinct texts in the column"""
+        self._flush()
+        return frozenset(self._postings)
+
+    def sorted_values(self) -> List[str]:
+        """Distinct texts in sorted order (cached until the value set changes)"""
+        self._flush()
+        if self._sorted is None:
+            self._sorted = sorted(self._postings)
+        return list(self._sorted)
+
+    def value_counts(self) -> Dict[str, int]:
+        """Number of rows holding each distinct text"""
+        self._flush()
+        return {text: len(rows) for text, rows in self._postings.items()}
+
+    def count(self, value: str) -> int:
+        """Number of rows holding a text"""
+        self._flush()
+        rows = self._postings.get(value)
+        return len(rows) if rows is not None else 0
+
+    # --- Maintenance ---
+
+    def rows_changed(self, first: int, last: int):
+        """Rows first..last (inclusive) were edited"""
+        if self._stale:
+            return
+        if (last - first + 1) * self.REBUILD_RATIO > self._row_count:
+            self._stale = True
+            return
+        self._dirty.update(range(first, last + 1))
+
+    def _defer_structure_change(self, row_count: int, shifted: int) -> bool:
+        """Fall back to a lazy rebuild if edits are pending or many rows move"""
+        if self._stale or self._dirty or shifted * self.REBUILD_RATIO > row_count:
+            self._stale = True
+            self._dirty.clear()
+            self._row_count = row_count
+            return True
+        return False
+
+    def rows_inserted(self, first: int, count: int):
+        """count rows were inserted before row first"""
+        shifted = max(0, self._row_count - first)
+        if self._defer_structure_change(self._row_count + count, shifted):
+            return
+        self._row_count += count
+
+        if first < len(self._values):
+            for rows in self._postings.values():
+                pos = bisect_left(rows, first)
+                if pos < len(rows):
+                    rows[pos:] = array("l", [row + count for row in rows[pos:]])
+
+        cell_text = self._cell_text
+        new_texts = [cell_text(row) for row in range(first, first + count)]
+        self._values[first:first] = new_texts
+        for row, text in enumerate(new_texts, first):
+            rows = self._postings.get(text)
+            if rows is None:
+                self._postings[text] = array("l", [row])
+                self._sorted = None
+            elif rows[-1] < row:
+                rows.append(row)
+            else:
+                insort(rows, row)
+
+    def row_moved(self, source: int, target: int):
+        """Row source was moved to target (rows in between shift by one)"""
+        if source == target or self._stale:
+            return
+        low, high = min(source, target), max(source, target)
+        step = -1 if source < target else 1
+
+        if self._dirty:
+            self._dirty = {
+                target if row == source else row + step if low <= row <= high else row
+                for row in self._dirty
+            }
+
+        # Only postings of texts within the span hold rows that shift
+        text = self._values[source]
+        moved = self._postings[text]
+        del moved[bisect_left(moved, source)]
+        for span_text in set(self._values[low : high + 1]):
+            rows = self._postings[span_text]
+            start, end = bisect_left(rows, low), bisect_left(rows, high + 1)
+            if start < end:
+                rows[start:end] = array("l", [row + step for row in rows[start:end]])
+        insort(moved, target)
+        self._values.insert(target, self._values.pop(source))
+
+    def rows_removed(self, first: int, count: int):
+        """Rows first..first+count-1 were removed"""
+        shifted = max(0, self._row_count - first - count)
+        if self._defer_structure_change(self._row_count - count, shifted):
+            return
+        self._row_count -= count
+
+        end = first + count
+        for text in set(self._values[first:end]):
+            rows = self._postings[text]
+            del rows[bisect_left(rows, first) : bisect_left(rows, end)]
+            if not rows:
+                del self._postings[text]
+                self._sorted = None
+
+        if end < len(self._values):
+            for rows in self._postings.values():
+                pos = bisect_left(rows, end)
+                if pos < len(rows):
+                    rows[pos:] = array("l", [row - count for row in rows[pos:]])
+        del self._values[first:end]
@@ -0,0 +1,81 @@
+from pyqt_enhanced_table.copy_worker import (
+    CHUNK_ROWS,
+    MIME_CSV,
+    MIME_HTML,
+    MIME_TSV,
+    CopyWorker,
+    format_selection,
+)
+
+CELLS = [
+    ["1", "Alice", "x"],
+    ["2", 'Bob "B", Jr.', "<y>"],
+    ["3", "Carol", "z"],
+]
+
+
+def _getters(cells):
+    return [lambda row, col=col: cells[row][col] for col in range(len(cells[0]))]
+
+
+def test_formats_full_rows():
+    texts = format_selection([([0, 2], None)], _getters(CELLS))
+    assert texts[MIME_TSV] == "1\tAlice\tx\n3\tCarol\tz"
+    assert texts[MIME_CSV] == "1,Alice,x\r\n3,Carol,z\r\n"
+    assert texts[MIME_HTML] == (
+        '<meta charset="utf-8"><table>'
+        "<tr><td>1</td><td>Alice</td><td>x</td></tr>"
+        "<tr><td>3</td><td>Carol</td><td>z</td></tr>"
+        "</table>"
+    )
+
+
+def test_quotes_and_escapes():
+    texts = format_selection([([1], None)], _getters(CELLS))
+    assert texts[MIME_CSV] == '2,"Bob ""B"", Jr.",<y>\r\n'
+    assert "<td>Bob &quot;B&quot;, Jr.</td><td>&lt;y&gt;</td>" in texts[MIME_HTML]
+
+
+def test_unselected_columns_are_empty():
+    blocks = [([0], {1}), ([1, 2], None)]
+    texts = format_selection(blocks, _getters(CELLS))
+    assert texts[MIME_TSV].split("\n") == [
+        "\tAlice\t",
+        '2\tBob "B", Jr.\t<y>',
+        "3\tCarol\tz",
+    ]
+
+
+def test_empty_selection():
+    texts = format_selection([], _getters(CELLS))
+    assert texts[MIME_TSV] == ""
+    assert texts[MIME_CSV] == ""
+
+
+def test_worker_reports_progress_and_result():
+    cells = [[str(row), "v"] for row in range(CHUNK_ROWS * 2 + 5)]
+    worker = CopyWorker(7, [(range(len(cells)), None)], _getters(cells))
+    progress, results = [], []
+    worker.signals.progress.connect(lambda *args: progress.append(args))
+    worker.signals.finished.connect(lambda *args: results.append(args))
+    worker.run()
+
+    total = len(cells)
+    assert progress == [
+        (7, CHUNK_ROWS, total),
+        (7, CHUNK_ROWS * 2, total),
+        (7, total, total),
+    ]
+    generation, texts = results[0]
+    assert generation == 7
+    assert texts == format_selection([(range(total), None)], _getters(cells))
+
+
+def test_cancelled_worker_returns_nothing():
+    cells = [[str(row)] for row in range(CHUNK_ROWS * 2)]
+    worker = CopyWorker(1, [(range(len(cells)), None)], _getters(cells))
+    results = []
+    worker.signals.progress.connect(lambda *args: worker.cancel())
+    worker.signals.finished.connect(lambda *args: results.append(args))
+    worker.run()
+    assert results == [(1, None)]
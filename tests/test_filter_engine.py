@@ -0,0 +1,92 @@
+import pytest
+
+from pyqt_enhanced_table.filter_engine import (
+    column_signature,
+    compile_filters,
+    filters_signature,
+    match_text,
+)
+
+
+def _values(*values):
+    return {"selected_values": list(values), "all_selected": False}
+
+
+def _text(text, mode="contains"):
+    return {"all_selected": True, "text_filter": {"text": text, "mode": mode}}
+
+
+def test_value_signature_ignores_order_and_types():
+    first = column_signature("status", _values("b", "a", 1))
+    second = column_signature("status", _values(1, "a", "b", "a"))
+    assert first == second == ("status", frozenset({"a", "b", "1"}), None, "")
+
+
+def test_all_selected_from_qsettings_strings():
+    assert column_signature("s", {"all_selected": "true"})[1] is None
+    filter_data = {"all_selected": "false", "selected_values": ["x"]}
+    assert column_signature("s", filter_data)[1] == frozenset({"x"})
+
+
+def test_text_signature_lowers_needle():
+    assert column_signature("name", _text("AbC", "starts_with")) == (
+        "name",
+        None,
+        "starts_with",
+        "abc",
+    )
+
+
+def test_compiled_filters_are_cached_by_signature():
+    first = compile_filters({"status": _values("a", "b")})
+    second = compile_filters({"status": _values("b", "a")})
+    assert first is second
+    assert compile_filters({"status": _values("a")}) is not first
+
+
+def test_columns_without_condition_are_dropped():
+    filters = {"status": {"all_selected": True}, "name": _text("x")}
+    assert [f.column_key for f in compile_filters(filters)] == ["name"]
+    assert compile_filters({}) == ()
+
+
+def test_value_predicate():
+    (status,) = compile_filters({"status": _values("Active", "")})
+    assert status.matches("Active")
+    assert status.matches("")
+    assert not status.matches("active")
+    assert status.text_matches is None
+
+
+@pytest.mark.parametrize(
+    "mode, cell, expected",
+    [
+        ("contains", "Hello World", True),
+        ("contains", "Help", False),
+        ("not_contains", "Help", True),
+        ("equals", "HELLO", True),
+        ("not_equals", "HELLO", False),
+        ("starts_with", "hello there", True),
+        ("ends_with", "say hello", True),
+        ("ends_with", "hello!", False),
+    ],
+)
+def test_text_predicate(mode, cell, expected):
+    (name,) = compile_filters({"name": _text("Hello", mode)})
+    assert name.matches(cell) is expected
+    assert match_text(cell, "hello", mode) is expected
+
+
+def test_values_and_text_combined():
+    filter_data = _values("Ankara", "Antalya", "Izmir")
+    filter_data["text_filter"] = {"text": "an"}
+    (city,) = compile_filters({"city": filter_data})
+    assert city.matches("Ankara")
+    assert not city.matches("Izmir")  # Allowed value, text does not match
+    assert not city.matches("Manisa")  # Text matches, value not allowed
+    assert city.text_matches("Manisa")
+
+
+def test_filters_signature_keeps_column_order():
+    signature = filters_signature({"b": _values("x"), "a": _text("y")})
+    assert [column[0] for column in signature] == ["b", "a"]
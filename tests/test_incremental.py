@@ -0,0 +1,173 @@
+import random
+
+import pytest
+from PyQt6.QtCore import Qt
+
+from pyqt_enhanced_table import (
+    ColumnConfig,
+    EnhancedTableView,
+    EnhancedTableWidget,
+    MemorySettingsStore,
+)
+
+COLUMNS = [
+    ColumnConfig("id", "ID"),
+    ColumnConfig("cat", "Category"),
+    ColumnConfig("score", "Score", filter_type="number"),
+]
+CATEGORIES = ["A", "B", "C"]
+
+
+@pytest.fixture(params=[EnhancedTableWidget, EnhancedTableView])
+def table(request, qapp):
+    table = request.param("test_table", COLUMNS, settings_store=MemorySettingsStore())
+    yield table
+    table.deleteLater()
+
+
+def _rows(ids, rnd):
+    return [(str(i), rnd.choice(CATEGORIES), rnd.randint(0, 40)) for i in ids]
+
+
+def _filter_categories(table, categories):
+    table._on_filter_applied(
+        {"column_key": "cat", "selected_values": categories, "all_selected": False}
+    )
+
+
+def _shown_rows(table):
+    """Data rows shown, in display order"""
+    view_row = table._view_row
+    rows = [row for row in range(table._source_row_count()) if view_row(row) != -1]
+    return sorted(rows, key=view_row)
+
+
+def _assert_consistent(table, categories=None, descending=False):
+    """Shown rows are the matching rows, in sort order"""
+    shown = _shown_rows(table)
+    expected = {
+        row
+        for row in range(table._source_row_count())
+        if categories is None or table._cell_text(row, 1) in categories
+    }
+    assert set(shown) == expected
+
+    scores = [float(table._cell_text(row, 2)) for row in shown]
+    assert scores == sorted(scores, reverse=descending)
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_sorted_edits_keep_order(table, descending):
+    rnd = random.Random(1)
+    table.set_rows(_rows(range(300), rnd), id_key="id")
+    order = Qt.SortOrder.DescendingOrder if descending else Qt.SortOrder.AscendingOrder
+    table.sort_by_column(2, order)
+
+    for _ in range(60):
+        row_id = str(rnd.randrange(300))
+        table.select_id(row_id)
+        table.update_row(row_id, {"score": rnd.randint(0, 40)})
+        _assert_consistent(table, descending=descending)
+        assert table.get_selected_id() == row_id  # Selection moves along
+
+
+def test_sorted_and_filtered_edits(table):
+    rnd = random.Random(2)
+    table.set_rows(_rows(range(300), rnd), id_key="id")
+    table.sort_by_column(2)
+    _filter_categories(table, ["A", "B"])
+    counts = []
+    table.rows_filtered.connect(lambda visible, total: counts.append(visible))
+
+    for _ in range(60):
+        row_id = str(rnd.randrange(300))
+        values = {"score": rnd.randint(0, 40)}
+        if rnd.random() < 0.5:
+            values["cat"] = rnd.choice(CATEGORIES)
+        table.update_row(row_id, values)
+        _assert_consistent(table, {"A", "B"})
+    assert counts and counts[-1] == len(_shown_rows(table))
+
+
+def _no_full_pass(table, monkeypatch):
+    def full_pass(*args):
+        raise AssertionError("full filter / sort pass")
+
+    monkeypatch.setattr(table, "_apply_filters", full_pass)
+    monkeypatch.setattr(table, "_apply_sort", full_pass)
+
+
+def test_appends_are_filtered_and_placed(table, monkeypatch):
+    rnd = random.Random(3)
+    table.set_rows(_rows(range(300), rnd), id_key="id")
+    table.sort_by_column(2)
+    _filter_categories(table, ["A", "C"])
+    counts = []
+    table.rows_filtered.connect(lambda visible, total: counts.append((visible, total)))
+
+    _no_full_pass(table, monkeypatch)
+    next_id = 300
+    for count in (1, 1, 3, 1, 5):
+        table.append_rows(_rows(range(next_id, next_id + count), rnd), id_key="id")
+        next_id += count
+        _assert_consistent(table, {"A", "C"})
+        assert counts[-1] == (len(_shown_rows(table)), next_id)
+
+    monkeypatch.undo()
+    table.append_rows(_rows(range(next_id, next_id + 200), rnd), id_key="id")
+    _assert_consistent(table, {"A", "C"})  # Large batch: fully sorted
+
+
+def test_unfiltered_appends_are_placed(table, monkeypatch):
+    rnd = random.Random(4)
+    table.set_rows(_rows(range(300), rnd), id_key="id")
+    table.sort_by_column(2, Qt.SortOrder.DescendingOrder)
+
+    _no_full_pass(table, monkeypatch)
+    for row_id in range(300, 310):
+        table.append_rows(_rows([row_id], rnd), id_key="id")
+    _assert_consistent(table, descending=True)
+
+
+def test_edits_need_no_full_pass(table, monkeypatch):
+    rnd = random.Random(5)
+    table.set_rows(_rows(range(300), rnd), id_key="id")
+    table.sort_by_column(2)
+    _filter_categories(table, ["B"])
+
+    _no_full_pass(table, monkeypatch)
+    for _ in range(30):
+        row_id = str(rnd.randrange(300))
+        table.update_row(row_id, {"cat": rnd.choice(CATEGORIES), "score": 7})
+    _assert_consistent(table, {"B"})
+
+
+def test_removals_update_counts(table, monkeypatch):
+    rnd = random.Random(6)
+    table.set_rows(_rows(range(300), rnd), id_key="id")
+    table.sort_by_column(2)
+    _filter_categories(table, ["A", "B"])
+    counts = []
+    table.rows_filtered.connect(lambda visible, total: counts.append((visible, total)))
+
+    _no_full_pass(table, monkeypatch)
+    remaining = 300
+    for _ in range(10):
+        batch = [str(rnd.randrange(300)) for _ in range(5)]
+        remaining -= table.remove_ids(batch)
+        _assert_consistent(table, {"A", "B"})
+        assert counts[-1] == (len(_shown_rows(table)), remaining)
+
+
+def test_clear_all_filters_reports_counts(table):
+    rnd = random.Random(7)
+    table.set_rows(_rows(range(300), rnd), id_key="id")
+    table.sort_by_column(2)
+    _filter_categories(table, ["A"])
+    counts = []
+    table.rows_filtered.connect(lambda visible, total: counts.append((visible, total)))
+
+    table.clear_all_filters()
+    assert counts == [(300, 300)]
+    assert table._visible_count == 300
+    _assert_consistent(table)
@@ -0,0 +1,138 @@
+import random
+
+import pytest
+from PyQt6.QtCore import Qt
+
+from pyqt_enhanced_table import (
+    ColumnConfig,
+    EnhancedTableView,
+    EnhancedTableWidget,
+    MemorySettingsStore,
+)
+
+COLUMNS = [
+    ColumnConfig("id", "ID", filter_type="number"),
+    ColumnConfig("name", "Name"),
+    ColumnConfig("score", "Score", filter_type="number"),
+]
+
+
+@pytest.fixture(params=[EnhancedTableWidget, EnhancedTableView])
+def table(request, qapp):
+    table = request.param("test_table", COLUMNS, settings_store=MemorySettingsStore())
+    yield table
+    table.deleteLater()
+
+
+def _rows(ids, rnd):
+    return [
+        {"id": row_id, "name": f"n{row_id}", "score": rnd.randint(0, 50)}
+        for row_id in ids
+    ]
+
+
+def _expected_row(table, row_id):
+    """First view row showing row_id, by a full scan"""
+    for row in range(table.model().rowCount()):
+        if table._row_id(row) == row_id:
+            return row
+    return -1
+
+
+def _assert_lookups(table, row_ids):
+    for row_id in row_ids:
+        assert table.row_for_id(row_id) == _expected_row(table, row_id)
+
+
+def test_lookup_after_load(table):
+    rnd = random.Random(0)
+    table.set_rows(_rows(range(100), rnd), id_key="id")
+    _assert_lookups(table, range(100))
+    assert table.row_for_id(1000) == -1
+
+
+def test_lookup_after_sorted_edits(table):
+    rnd = random.Random(1)
+    table.set_rows(_rows(range(200), rnd), id_key="id")
+    table.sort_by_column(2, Qt.SortOrder.AscendingOrder)
+    table.row_for_id(0)  # Build the index before rows move
+
+    for _ in range(30):
+        row_id = rnd.randrange(200)
+        assert table.update_row(row_id, {"score": rnd.randint(0, 50)})
+        _assert_lookups(table, rnd.sample(range(200), 20))
+    _assert_lookups(table, range(200))
+
+
+def test_lookup_after_removals(table):
+    rnd = random.Random(2)
+    table.set_rows(_rows(range(200), rnd), id_key="id")
+    table.row_for_id(0)
+
+    removed = set()
+    for _ in range(10):
+        batch = rnd.sample(sorted(set(range(200)) - removed), 3)
+        assert table.remove_ids(batch) == 3
+        assert table._id_drift  # Entries are shifted, not rebuilt
+        removed.update(batch)
+        for row_id in batch:
+            assert table.row_for_id(row_id) == -1
+        _assert_lookups(table, rnd.sample(range(200), 20))
+    _assert_lookups(table, range(200))
+    assert table.remove_ids([next(iter(removed))]) == 0
+
+
+def test_lookup_with_duplicate_ids(table):
+    rnd = random.Random(3)
+    ids = list(range(50)) + [10, 20, 20]  # 10 twice, 20 three times
+    table.set_rows(_rows(ids, rnd), id_key="id")
+    _assert_lookups(table, range(50))
+
+    # Removing by ID drops the first row holding it; the next one takes over
+    assert table.remove_ids([20]) == 1
+    assert table.row_for_id(20) == _expected_row(table, 20) != -1
+    _assert_lookups(table, range(50))
+
+
+def test_lookup_with_duplicate_ids_after_moves(table):
+    rnd = random.Random(4)
+    ids = list(range(100)) + [5, 5, 40]
+    table.set_rows(_rows(ids, rnd), id_key="id")
+    table.sort_by_column(2, Qt.SortOrder.DescendingOrder)
+    table.row_for_id(0)
+
+    for _ in range(20):
+        row_id = rnd.choice([5, 40, rnd.randrange(100)])
+        assert table.update_row(row_id, {"score": rnd.randint(0, 50)})
+        _assert_lookups(table, [5, 40] + rnd.sample(range(100), 10))
+    _assert_lookups(table, range(100))
+
+
+def test_lookup_after_appends(table):
+    rnd = random.Random(5)
+    table.set_rows(_rows(range(100), rnd), id_key="id")
+    table.row_for_id(0)
+
+    table.append_rows(_rows(range(100, 110), rnd), id_key="id")
+    _assert_lookups(table, range(110))
+    table.append_rows(_rows([7, 105], rnd), id_key="id")  # Duplicates at the end
+    _assert_lookups(table, range(110))
+
+
+def test_lookup_after_id_edits(qapp):
+    rnd = random.Random(6)
+    store = MemorySettingsStore()
+    table = EnhancedTableWidget("test_table", COLUMNS, settings_store=store)
+    table.set_rows(_rows(range(100), rnd), id_key="id")
+    table.sort_by_column(2, Qt.SortOrder.AscendingOrder)
+    table.row_for_id(0)
+
+    id_item = table.item(table.row_for_id(3), 0)
+    id_item.setData(Qt.ItemDataRole.UserRole, 500)
+    assert table.row_for_id(3) == -1
+    assert table.row_for_id(500) == _expected_row(table, 500) != -1
+
+    table.item(table.row_for_id(4), 0).setData(Qt.ItemDataRole.UserRole, 6)
+    assert table.row_for_id(4) == -1
+    _assert_lookups(table, [6, 7, 500])  # 6 is now held by two rows
+    table.deleteLater()
@@ -0,0 +1,123 @@
+import pytest
+from PyQt6.QtCore import QByteArray, Qt
+
+from pyqt_enhanced_table import (
+    ColumnConfig,
+    EnhancedTableWidget,
+    MemorySettingsStore,
+    SQLiteSettingsStore,
+)
+
+RECORD = {
+    "header_state": QByteArray(b"\x00\x01header\xff"),
+    "columns": {"name": {"visible": False, "width": 120}},
+    "sort": [["name", 1]],
+    "filters": {
+        "status": {
+            "column_key": "status",
+            "selected_values": ["Active"],
+            "all_selected": False,
+        }
+    },
+}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield MemorySettingsStore()
+    else:
+        store = SQLiteSettingsStore(str(tmp_path / "settings.db"))
+        yield store
+        store.close()
+
+
+def test_round_trip(store):
+    assert store.load("users", 1) == {}
+    store.save("users", 1, RECORD)
+    assert store.load("users", 1) == RECORD
+
+
+def test_save_updates_given_keys(store):
+    store.save("users", 1, RECORD)
+    store.save("users", 1, {"sort": []})
+    record = store.load("users", 1)
+    assert record["sort"] == []
+    assert record["columns"] == RECORD["columns"]
+
+
+def test_records_per_table_and_user(store):
+    store.save("users", 1, {"sort": [["a", 0]]})
+    store.save("users", 2, {"sort": [["b", 0]]})
+    store.save("orders", 1, {"sort": [["c", 0]]})
+    assert store.load("users", 1) == {"sort": [["a", 0]]}
+    assert store.load("users", 2) == {"sort": [["b", 0]]}
+    assert store.load("orders", 1) == {"sort": [["c", 0]]}
+
+
+def test_loaded_record_is_a_copy(store):
+    store.save("users", 1, RECORD)
+    store.load("users", 1)["columns"]["name"]["width"] = 999
+    assert store.load("users", 1) == RECORD
+
+
+def test_sqlite_persists_across_connections(tmp_path):
+    path = str(tmp_path / "settings.db")
+    store = SQLiteSettingsStore(path)
+    store.save("users", 1, RECORD)
+    store.close()
+
+    store = SQLiteSettingsStore(path)
+    assert store.load("users", 1) == RECORD
+    store.close()
+
+
+def test_sqlite_rejects_unknown_types(tmp_path):
+    store = SQLiteSettingsStore(str(tmp_path / "settings.db"))
+    with pytest.raises(TypeError):
+        store.save("users", 1, {"sort": object()})
+    store.close()
+
+
+def test_table_settings_round_trip(qapp):
+    columns = [ColumnConfig("name", "Name"), ColumnConfig("status", "Status")]
+    store = MemorySettingsStore()
+    table = EnhancedTableWidget("users", columns, settings_store=store)
+    table.set_rows([("a", "Active"), ("b", "Passive")])
+    table.sort_by_column(0, Qt.SortOrder.DescendingOrder)
+    table._on_filter_applied(RECORD["filters"]["status"])
+    table._set_column_visibility({"name": False})
+    table.flush_settings()
+    table.deleteLater()
+
+    table = EnhancedTableWidget("users", columns, settings_store=store)
+    table.set_rows([("a", "Active"), ("b", "Passive")])
+    assert table.get_sort_columns() == [("name", Qt.SortOrder.DescendingOrder)]
+    assert table.get_visible_columns() == ["status"]
+    assert table._active_filters == RECORD["filters"]
+    assert [table.isRowHidden(row) for row in range(2)] == [True, False]  # b, a
+    table.deleteLater()
+
+
+def test_table_writes_behind(qapp):
+    columns = [ColumnConfig("name", "Name"), ColumnConfig("status", "Status")]
+    store = MemorySettingsStore()
+    table = EnhancedTableWidget("users", columns, settings_store=store)
+    table.set_rows([("a", "Active"), ("b", "Passive")])
+
+    # Filter, sort and visibility changes are coalesced into one write
+    saves = []
+    save = store.save
+    store.save = lambda *args: saves.append(args[2]) or save(*args)
+    table._on_filter_applied(RECORD["filters"]["status"])
+    table._on_header_clicked(0)
+    table._set_column_visibility({"name": False})
+    assert saves == []
+    assert table._settings_timer.isActive()
+
+    table.show()
+    table.hide()  # Hiding writes pending settings
+    assert len(saves) == 1
+    assert {"filters", "sort", "columns"} <= set(saves[0])
+    assert store.load("users", 0)["filters"] == RECORD["filters"]
+    table.deleteLater()
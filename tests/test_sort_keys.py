@@ -0,0 +1,121 @@
+import random
+from functools import cmp_to_key
+
+import pytest
+
+from pyqt_enhanced_table.sort_keys import sorted_position
+
+
+def _cmp(columns):
+    """Row comparison of sorted_position: keys, then row order on ties"""
+
+    def cmp(a, b):
+        for keys, descending in columns:
+            if keys[a] != keys[b]:
+                less = keys[a] > keys[b] if descending else keys[a] < keys[b]
+                return -1 if less else 1
+        return (a > b) - (a < b)
+
+    return cmp_to_key(cmp)
+
+
+def _check_placed(columns, row, skip, pos):
+    """Rows outside skip are sorted after moving row to pos"""
+    order = [r for r in range(len(columns[0][0])) if r != row]
+    order.insert(pos, row)
+    placed = [r for r in order if r not in skip]
+    assert placed == sorted(placed, key=_cmp(columns))
+
+
+def test_row_in_place():
+    keys = [1, 2, 3, 4]
+    assert sorted_position([(keys, False)], 2) == 2
+    assert sorted_position([(keys, False)], 0) == 0
+    assert sorted_position([(keys, False)], 3) == 3
+
+
+@pytest.mark.parametrize(
+    "keys, row, expected",
+    [
+        ([1, 2, 9, 4, 5], 2, 4),  # Moves down to the end
+        ([1, 2, 3, 0, 5], 3, 0),  # Moves up to the start
+        ([1, 5, 3, 4, 6], 1, 3),  # Moves down into the middle
+        ([3, 3, 3, 3], 2, 2),  # Equal keys keep row order
+    ],
+)
+def test_row_moves(keys, row, expected):
+    assert sorted_position([(keys, False)], row) == expected
+
+
+def test_descending():
+    assert sorted_position([([9, 7, 1, 5, 3], True)], 2) == 4
+    assert sorted_position([([9, 2, 5, 3], True)], 1) == 3
+
+
+def test_ties_follow_row_order():
+    # Row 3 ties with rows 0 and 1: it belongs after them (higher row number)
+    keys = [1, 1, 2, 1, 3]
+    assert sorted_position([(keys, False)], 3) == 2
+    # Row 0 ties with rows 1 and 2 and stays before them
+    keys = [5, 5, 5, 7]
+    assert sorted_position([(keys, False)], 0) == 0
+
+
+def test_secondary_column():
+    status = ["a", "a", "b", "b", "a"]
+    price = [1.0, 3.0, 1.0, 2.0, 2.0]
+    columns = [(status, False), (price, False)]
+    assert sorted_position(columns, 4) == 1
+    _check_placed(columns, 4, frozenset(), 1)
+
+
+def test_skipped_neighbours_are_ignored():
+    # Row 2 is in order w.r.t. its sorted neighbours once skipped rows
+    # (still to be placed, arbitrary keys) are ignored
+    keys = [1, 0, 5, 99, 9]
+    skip = {1, 3}
+    pos = sorted_position([(keys, False)], 2, skip)
+    _check_placed([(keys, False)], 2, skip, pos)
+    assert pos in (1, 2, 3)
+
+
+def test_skipped_rows_do_not_attract_the_row():
+    keys = [1, 2, 8, 0, 4, 6]
+    skip = {3}
+    pos = sorted_position([(keys, False)], 2, skip)
+    _check_placed([(keys, False)], 2, skip, pos)
+    assert pos == 5
+
+
+def test_all_other_rows_skipped():
+    keys = [5, 1, 3]
+    pos = sorted_position([(keys, False)], 1, {0, 2})
+    assert 0 <= pos <= 2
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_random_against_full_sort(seed):
+    rnd = random.Random(seed)
+    count = rnd.randint(1, 40)
+    column_count = rnd.randint(1, 3)
+    descending = [rnd.random() < 0.5 for _ in range(column_count)]
+
+    # Sorted table with many ties, then one changed row and some rows
+    # still to be placed (skip) holding arbitrary keys
+    rows = [
+        [rnd.randint(0, 4) for _ in range(column_count)] for _ in range(count)
+    ]
+    columns = [([row[c] for row in rows], descending[c]) for c in range(column_count)]
+    order = sorted(range(count), key=_cmp(columns))
+    columns = [([keys[r] for r in order], desc) for keys, desc in columns]
+
+    row = rnd.randrange(count)
+    others = [r for r in range(count) if r != row]
+    skip = set(rnd.sample(others, rnd.randint(0, len(others) // 2)))
+    for r in skip | {row}:
+        for keys, _ in columns:
+            keys[r] = rnd.randint(0, 4)
+
+    pos = sorted_position(columns, row, skip)
+    assert 0 <= pos < count
+    _check_placed(columns, row, skip, pos)
@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+import pytest
+
+from pyqt_enhanced_table import ColumnConfig, EnhancedTableView, MemorySettingsStore
+
+COLUMNS = [
+    ColumnConfig("id", "ID"),
+    ColumnConfig("p", "P", filter_type="number"),
+]
+
+
+@pytest.fixture
+def view(qapp):
+    view = EnhancedTableView("test_view", COLUMNS, settings_store=MemorySettingsStore())
+    view.set_rows([(str(i), i % 3) for i in range(99)], id_key="id")
+    yield view
+    view.deleteLater()
+
+
+def _filter(view, values):
+    view._on_filter_applied(
+        {"column_key": "p", "selected_values": values, "all_selected": False}
+    )
+    return view.model().rowCount()
+
+
+def test_whole_numbers_display_as_integers(qapp):
+    view = EnhancedTableView("test_view", COLUMNS, settings_store=MemorySettingsStore())
+    view.set_rows([("a", "5"), ("b", Decimal("5")), ("c", 5.0), ("d", None)])
+    model = view.table_model()
+    assert [model.cell_text(row, 1) for row in range(4)] == ["5", "5", "5", ""]
+    view.deleteLater()
+
+
+def test_fractional_edit_refreshes_column_values(view):
+    assert view.get_unique_values("p") == ["0", "1", "2"]
+    view.update_row("5", {"p": 2.5})
+    assert view.get_unique_values("p") == ["0.0", "1.0", "2.0", "2.5"]
+    assert view.get_value_counts("p")["1.0"] == 33
+    assert _filter(view, ["1.0"]) == 33
+
+
+def test_fractional_append_refreshes_column_values(view):
+    view.get_unique_values("p")  # Build the index before the append
+    view.append_rows([("x", 0.5)], id_key="id")
+    assert view.get_unique_values("p") == ["0.0", "0.5", "1.0", "2.0"]
+    assert _filter(view, ["2.0"]) == 33
+
+
+def test_column_format_refreshes_column_values(view):
+    view.update_row("5", {"p": 2.5})
+    view.get_unique_values("p")
+    view.set_column_format("p", ".2f")
+    assert view.get_unique_values("p") == ["0.00", "1.00", "2.00", "2.50"]
+    assert _filter(view, ["1.00", "2.50"]) == 34
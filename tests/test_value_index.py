@@ -0,0 +1,165 @@
+import random
+
+import pytest
+
+from pyqt_enhanced_table.value_index import ColumnValueIndex
+
+
+def _index(texts):
+    return ColumnValueIndex(lambda row: texts[row], len(texts))
+
+
+def _assert_matches(index, texts):
+    """Index answers like one freshly built over texts"""
+    expected = {}
+    for row, text in enumerate(texts):
+        expected.setdefault(text, []).append(row)
+    assert len(index) == len(texts)
+    assert index.value_counts() == {text: len(rows) for text, rows in expected.items()}
+    assert index.sorted_values() == sorted(expected)
+    for text, rows in expected.items():
+        assert index.rows_for([text]) == rows
+        assert index.count(text) == len(rows)
+    assert index.rows_for(["missing"]) == []
+
+
+def test_build_and_lookup():
+    texts = ["b", "a", "b", "c", "a", "b"]
+    index = _index(texts)
+    _assert_matches(index, texts)
+    assert index.rows_for(["a", "c"]) == [1, 3, 4]
+    assert index.values() == frozenset("abc")
+
+
+def test_edits_are_patched():
+    texts = [str(i % 5) for i in range(100)]
+    index = _index(texts)
+    texts[7] = "x"
+    index.rows_changed(7, 7)
+    assert index._dirty == {7}
+    _assert_matches(index, texts)
+    assert not index._dirty
+
+
+def test_large_edit_rebuilds():
+    texts = [str(i % 5) for i in range(16)]
+    index = _index(texts)
+    texts[:8] = ["x"] * 8
+    index.rows_changed(0, 7)
+    assert index._stale
+    _assert_matches(index, texts)
+    assert not index._stale
+
+
+def test_append_shifts_in_place():
+    texts = [str(i % 5) for i in range(100)]
+    index = _index(texts)
+    texts += ["4", "new"]
+    index.rows_inserted(100, 2)
+    assert not index._stale
+    _assert_matches(index, texts)
+
+
+def test_insert_near_end_shifts_postings():
+    texts = [str(i % 5) for i in range(100)]
+    index = _index(texts)
+    texts[95:95] = ["new", "1"]
+    index.rows_inserted(95, 2)
+    assert not index._stale
+    _assert_matches(index, texts)
+
+
+def test_insert_at_start_rebuilds():
+    texts = [str(i % 5) for i in range(100)]
+    index = _index(texts)
+    texts[0:0] = ["new"]
+    index.rows_inserted(0, 1)
+    assert index._stale
+    _assert_matches(index, texts)
+
+
+def test_remove_near_end_shifts_postings():
+    texts = [str(i % 5) for i in range(100)]
+    texts[97] = "only"
+    index = _index(texts)
+    del texts[96:98]
+    index.rows_removed(96, 2)
+    assert not index._stale
+    _assert_matches(index, texts)
+    assert "only" not in index.values()
+
+
+def test_remove_at_start_rebuilds():
+    texts = [str(i % 5) for i in range(100)]
+    index = _index(texts)
+    del texts[0:3]
+    index.rows_removed(0, 3)
+    assert index._stale
+    _assert_matches(index, texts)
+
+
+def test_structure_change_with_pending_edits_rebuilds():
+    texts = [str(i % 5) for i in range(100)]
+    index = _index(texts)
+    texts[10] = "edited"
+    index.rows_changed(10, 10)
+    texts.append("0")
+    index.rows_inserted(100, 1)
+    assert index._stale
+    _assert_matches(index, texts)
+
+
+@pytest.mark.parametrize("source, target", [(2, 8), (8, 2), (0, 99), (99, 0), (5, 6)])
+def test_row_moved_shifts_postings(source, target):
+    texts = [str(i % 7) for i in range(100)]
+    index = _index(texts)
+    texts.insert(target, texts.pop(source))
+    index.row_moved(source, target)
+    assert not index._stale
+    _assert_matches(index, texts)
+
+
+def test_row_moved_keeps_pending_edits():
+    texts = [str(i % 7) for i in range(100)]
+    index = _index(texts)
+    texts[3] = "a"
+    texts[20] = "b"
+    texts[40] = "c"
+    for row in (3, 20, 40):
+        index.rows_changed(row, row)
+
+    # Dirty rows move along: 3 -> 30 and 20 -> 19, 40 stays
+    texts.insert(30, texts.pop(3))
+    index.row_moved(3, 30)
+    assert index._dirty == {30, 19, 40}
+    _assert_matches(index, texts)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_random_changes(seed):
+    rnd = random.Random(seed)
+    texts = [str(rnd.randint(0, 9)) for _ in range(rnd.randint(20, 200))]
+    index = _index(texts)
+    for _ in range(40):
+        op = rnd.randrange(4)
+        if op == 0 or not texts:
+            first = rnd.randint(max(0, len(texts) - 5), len(texts))
+            count = rnd.randint(1, 3)
+            texts[first:first] = [str(rnd.randint(0, 12)) for _ in range(count)]
+            index.rows_inserted(first, count)
+        elif op == 1:
+            first = rnd.randrange(len(texts))
+            count = rnd.randint(1, min(3, len(texts) - first))
+            del texts[first : first + count]
+            index.rows_removed(first, count)
+        elif op == 2:
+            row = rnd.randrange(len(texts))
+            texts[row] = str(rnd.randint(0, 12))
+            index.rows_changed(row, row)
+        else:
+            source, target = rnd.randrange(len(texts)), rnd.randrange(len(texts))
+            texts.insert(target, texts.pop(source))
+            index.row_moved(source, target)
+        if rnd.random() < 0.3:
+            _assert_matches(index, texts)
+    _assert_matches(index, texts)